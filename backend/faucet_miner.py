@@ -12,7 +12,6 @@ from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
-import base58
 from solders.keypair import Keypair
 
 logger = logging.getLogger(__name__)
@@ -185,6 +184,28 @@ CRYPTO_FAUCETS = [
     {"name": "Cronos Faucet", "url": "https://cronos.org/faucet", "chain": "cronos", "currency": "CRO", "amount_range": [10, 50], "cooldown_hours": 24, "method": "api", "testnet": True},
 ]
 
+FAUCET_COUNT = len(CRYPTO_FAUCETS)
+
+def _build_faucet_stats() -> Dict:
+    """Summarise CRYPTO_FAUCETS by chain and network"""
+    chains = {}
+    for faucet in CRYPTO_FAUCETS:
+        chain = faucet["chain"]
+        if chain not in chains:
+            chains[chain] = {"count": 0, "currencies": set()}
+        chains[chain]["count"] += 1
+        chains[chain]["currencies"].add(faucet["currency"])
+    
+    return {
+        "total_faucets": FAUCET_COUNT,
+        "chains": {k: {"count": v["count"], "currencies": list(v["currencies"])} for k, v in chains.items()},
+        "mainnet_faucets": sum(1 for f in CRYPTO_FAUCETS if not f.get("testnet")),
+        "testnet_faucets": sum(1 for f in CRYPTO_FAUCETS if f.get("testnet"))
+    }
+
+# The faucet list is static, so its stats are computed once at import
+FAUCET_STATS = _build_faucet_stats()
+
 # User agents for rotation
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
@@ -365,7 +386,7 @@ class SolanaSoldiersArmy:
             return {
                 "chain": chain,
                 "public_key": str(keypair.pubkey()),
-                "private_key": base58.b58encode(bytes(keypair)).decode('utf-8')
+                "private_key": str(keypair)
             }
         else:
             # For other chains, generate a placeholder address
@@ -426,7 +447,7 @@ class SolanaSoldiersArmy:
 *Session ID:* `{session_id[:20]}...`
 *Agents:* {num_agents} soldiers active
 *Duration:* {duration_hours} hours
-*Faucets:* {len(CRYPTO_FAUCETS)} targets
+*Faucets:* {FAUCET_COUNT} targets
 
 *Wallets Created:* {len(session.wallets_created)} chains
 
@@ -454,7 +475,7 @@ Use /missionstatus to check progress.
                 break
             
             # Distribute faucets among agents
-            faucets_per_agent = len(CRYPTO_FAUCETS) // len(self.agents)
+            faucets_per_agent = FAUCET_COUNT // len(self.agents)
             
             for i, agent in enumerate(self.agents):
                 start_idx = i * faucets_per_agent
@@ -613,17 +634,4 @@ Thank you for using Solana Soldiers! 🎖️
     
     def get_faucet_stats(self) -> Dict:
         """Get faucet statistics"""
-        chains = {}
-        for faucet in CRYPTO_FAUCETS:
-            chain = faucet["chain"]
-            if chain not in chains:
-                chains[chain] = {"count": 0, "currencies": set()}
-            chains[chain]["count"] += 1
-            chains[chain]["currencies"].add(faucet["currency"])
-        
-        return {
-            "total_faucets": len(CRYPTO_FAUCETS),
-            "chains": {k: {"count": v["count"], "currencies": list(v["currencies"])} for k, v in chains.items()},
-            "mainnet_faucets": sum(1 for f in CRYPTO_FAUCETS if not f.get("testnet")),
-            "testnet_faucets": sum(1 for f in CRYPTO_FAUCETS if f.get("testnet"))
-        }
+        return FAUCET_STATS
@@ -81,22 +81,20 @@ class NFTAggregator:
         collections = []
         
         if chain == "solana":
-            # Magic Eden API
-            me_collections = await self._fetch_magic_eden_trending(limit)
-            collections.extend(me_collections)
-            
-            # Tensor API
-            tensor_collections = await self._fetch_tensor_trending(limit)
-            collections.extend(tensor_collections)
-        
+            # Magic Eden + Tensor
+            sources = [self._fetch_magic_eden_trending(limit), self._fetch_tensor_trending(limit)]
         elif chain == "ethereum":
-            # OpenSea API
-            os_collections = await self._fetch_opensea_trending(limit)
-            collections.extend(os_collections)
-            
-            # Blur API
-            blur_collections = await self._fetch_blur_trending(limit)
-            collections.extend(blur_collections)
+            # OpenSea + Blur
+            sources = [self._fetch_opensea_trending(limit), self._fetch_blur_trending(limit)]
+        else:
+            sources = []
+        
+        # Marketplaces are independent: fetch them concurrently and keep whatever succeeds
+        for result in await asyncio.gather(*sources, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching trending collections: {result}")
+                continue
+            collections.extend(result)
         
         # Deduplicate by name
         seen = set()
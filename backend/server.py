@@ -1,22 +1,29 @@
-from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.errors import BulkWriteError, ConnectionFailure, ExecutionTimeout, WTimeoutError
 import os
+import re
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 import uuid
+import functools
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
 import asyncio
+import time
 import httpx
 import base58
 from solders.keypair import Keypair
 from telegram import Bot, Update, InlineKeyboardButton, InlineKeyboardMarkup
-from telegram.ext import Application, CommandHandler, CallbackQueryHandler, ContextTypes, ConversationHandler, MessageHandler, filters
-import threading
-import json
+from telegram.ext import AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, ContextTypes, ConversationHandler, MessageHandler, filters
+import orjson
 
 # Import trading engine components
 from trading_engine import (
@@ -35,13 +42,14 @@ from trading_engine import (
     LIVE_TRADING_ENABLED,
     AUTO_TRADE_ON_WHALE_SIGNAL,
     LAMPORTS_PER_SOL,
+    HTTP_POOL_LIMITS,
     MAX_TRADE_SOL,
     MIN_TRADE_SOL,
     DEFAULT_STOP_LOSS_PCT
 )
 
 # Import new modules
-from faucet_miner import SolanaSoldiersArmy, CRYPTO_FAUCETS
+from faucet_miner import SolanaSoldiersArmy, FAUCET_COUNT
 from nft_aggregator import NFTAggregator
 
 # Conversation states for multi-step interactions
@@ -50,15 +58,43 @@ SELECTING_TRADE_AMOUNT, CONFIRMING_TRADE = range(2)
 # Trade amount options (in USD)
 TRADE_AMOUNTS = [2, 5, 10, 25, 50, 100, 250, 500]
 
+# Trade amounts laid out 4 per row for the quick-trade keyboard
+AFFORD_ROWS = [TRADE_AMOUNTS[i:i + 4] for i in range(0, len(TRADE_AMOUNTS), 4)]
+
 # Cost for deploying Solana Soldiers (in credits)
 SOLDIERS_COST = 50
 
+# Static inline keyboards (built once, shared by every callback)
+MAIN_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("💳 Create Wallet", callback_data="create_wallet"),
+     InlineKeyboardButton("💰 My Balance", callback_data="balance")],
+    [InlineKeyboardButton("🐋 Whale Watch", callback_data="whale_watch"),
+     InlineKeyboardButton("📊 My Trades", callback_data="my_trades")],
+    [InlineKeyboardButton("💵 Buy Access (£100/day)", callback_data="buy_access"),
+     InlineKeyboardButton("⚙️ Settings", callback_data="settings")],
+])
+ADMIN_MENU_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("👥 All Users", callback_data="admin_users"),
+     InlineKeyboardButton("📊 All Trades", callback_data="admin_trades")],
+    [InlineKeyboardButton("💳 Payments", callback_data="admin_payments"),
+     InlineKeyboardButton("🐋 Whale Logs", callback_data="admin_whale_logs")],
+])
+SOLDIERS_DEPLOY_MARKUP = InlineKeyboardMarkup([
+    [InlineKeyboardButton("🚀 Deploy 5 Soldiers (50 credits)", callback_data="deploy_soldiers_5")],
+    [InlineKeyboardButton("💪 Deploy 10 Soldiers (50 credits)", callback_data="deploy_soldiers_10")],
+    [InlineKeyboardButton("⚔️ Deploy 20 Soldiers (50 credits)", callback_data="deploy_soldiers_20")],
+    [InlineKeyboardButton("❌ Cancel", callback_data="back_main")]
+])
+BACK_TO_MAIN_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="back_main")]])
+BACK_TO_ADMIN_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back", callback_data="admin_back")]])
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# tz_aware: stored BSON dates decode as UTC-aware datetimes, so API JSON keeps its +00:00 offset
+client = AsyncIOMotorClient(mongo_url, tz_aware=True, tzinfo=timezone.utc)
 db = client[os.environ['DB_NAME']]
 
 # Configuration
@@ -72,6 +108,9 @@ PAYMENT_ETH_ADDRESS = os.environ.get('PAYMENT_ETH_ADDRESS', '')
 PAYMENT_BTC_ADDRESS = os.environ.get('PAYMENT_BTC_ADDRESS', '')
 DAILY_ACCESS_PRICE_GBP = float(os.environ.get('DAILY_ACCESS_PRICE_GBP', '100'))
 
+# Base58 Solana address (32-44 chars, no 0/O/I/l), compiled once for all validation
+SOLANA_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
 # Whale wallets to track
 WHALE_WALLETS = [
     "74YhGgHA3x1jcL2TchwChDbRVVXvzSxNbYM6ytCukauM",
@@ -85,8 +124,26 @@ WHALE_WALLETS = [
     "32r5qvmNTtmp7jAEfgPsF9dtBzcgUWDt6t5JyEaD3Kf1"
 ]
 
+# The whale list is fixed at import, so its count and /api/whales body are built once
+TRACKED_WHALE_COUNT = len(WHALE_WALLETS)
+WHALES_JSON = orjson.dumps({"whales": WHALE_WALLETS})
+
+# Status endpoint response cache TTLs (seconds)
+HEALTH_CACHE_TTL = float(os.environ.get('HEALTH_CACHE_TTL', '10'))
+DASHBOARD_CACHE_TTL = 30
+
+# App lifecycle: startup_event/shutdown_event are defined with the runner code below
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start trading components, tasks and the bot; tear them down on exit"""
+    try:
+        await startup_event()  # inside the try so a failed startup still releases what it opened
+        yield
+    finally:
+        await shutdown_event()
+
 # Create the main app
-app = FastAPI(title="Solana Soldier Bot API")
+app = FastAPI(title="Solana Soldier Bot API", default_response_class=ORJSONResponse, lifespan=lifespan)
 api_router = APIRouter(prefix="/api")
 
 # Configure logging
@@ -103,7 +160,11 @@ whale_monitor: Optional[WhaleMonitorWebSocket] = None
 auto_trader: Optional[LiveAutoTrader] = None
 trending_scanner: Optional[TrendingTokenScanner] = None
 helius_rpc: Optional[HeliusRPC] = None
-whale_monitor_task: Optional[asyncio.Task] = None
+http_client: Optional[httpx.AsyncClient] = None  # pooled HTTP/2 client for CoinGecko/Solscan/DexScreener helpers
+
+# Long-running tasks started at startup (cancelled and awaited on shutdown)
+BACKGROUND_TASK_SHUTDOWN_TIMEOUT = 5
+background_tasks: Set[asyncio.Task] = set()
 
 # New systems
 soldiers_army: Optional[SolanaSoldiersArmy] = None
@@ -124,7 +185,7 @@ class UserModel(BaseModel):
     credits: float = 0.0
     is_admin: bool = False
     subscription_expires: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class WalletModel(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -133,7 +194,7 @@ class WalletModel(BaseModel):
     public_key: str
     private_key_encrypted: str
     balance_sol: float = 0.0
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     is_active: bool = True
 
 class TradeModel(BaseModel):
@@ -149,7 +210,7 @@ class TradeModel(BaseModel):
     price_at_trade: float = 0.0
     profit_usd: float = 0.0
     status: str = "PENDING"  # PENDING, COMPLETED, FAILED
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class WhaleActivityModel(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -160,7 +221,7 @@ class WhaleActivityModel(BaseModel):
     action: str  # "CREATE", "BUY", "SELL", "BURN"
     amount: float = 0.0
     market_cap: float = 0.0
-    detected_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    detected_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class PaymentModel(BaseModel):
     model_config = ConfigDict(extra="ignore")
@@ -171,7 +232,7 @@ class PaymentModel(BaseModel):
     crypto_amount: float
     tx_hash: Optional[str] = None
     status: str = "PENDING"
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class UserTrackedWalletModel(BaseModel):
     """Wallets that users add to track"""
@@ -181,7 +242,7 @@ class UserTrackedWalletModel(BaseModel):
     wallet_address: str
     label: Optional[str] = None
     is_active: bool = True
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 # Admin usernames who get free access
 ADMIN_USERNAMES = [
@@ -216,23 +277,121 @@ def create_solana_wallet():
     """Create a new Solana wallet"""
     keypair = Keypair()
     public_key = str(keypair.pubkey())
-    private_key = base58.b58encode(bytes(keypair)).decode('utf-8')
+    private_key = str(keypair)  # solders renders the 64-byte secret as base58 natively
     return public_key, private_key
 
+def format_timestamp(value) -> str:
+    """Format a stored timestamp (BSON date or legacy ISO string) for display"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    return str(value or '')[:16]
+
+# SOL price cache (value, fetched_at monotonic time)
+SOL_PRICE_CACHE_TTL = 10
+_sol_price_cache = {"value": None, "fetched_at": 0.0}
+
 async def get_sol_price():
-    """Get current SOL price in USD"""
+    """Get current SOL price in USD (cached for SOL_PRICE_CACHE_TTL seconds)"""
+    if _sol_price_cache["value"] is not None and time.monotonic() - _sol_price_cache["fetched_at"] < SOL_PRICE_CACHE_TTL:
+        return _sol_price_cache["value"]
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd",
-                timeout=10
-            )
-            data = response.json()
-            return data.get('solana', {}).get('usd', 200)
+        response = await http_client.get(
+            "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd",
+            timeout=10
+        )
+        data = orjson.loads(response.content)
+        price = data.get('solana', {}).get('usd')
+        if price is None:
+            return 200
+        _sol_price_cache["value"] = price
+        _sol_price_cache["fetched_at"] = time.monotonic()
+        return price
     except Exception as e:
         logger.error(f"Error fetching SOL price: {e}")
         return 200  # Default fallback price
 
+# Wallet balance cache and in-flight lookups (address -> (balance, fetched_at) / task)
+BALANCE_CACHE_TTL = 5
+_balance_cache: Dict[str, tuple] = {}
+_balance_inflight: Dict[str, asyncio.Task] = {}
+
+async def _fetch_balance(address: str) -> float:
+    """Fetch a balance from Helius and record it in the cache (failed lookups are not cached)"""
+    try:
+        balance = await helius_rpc.get_balance_or_none(address)
+        if balance is None:
+            return 0.0
+        _balance_cache[address] = (balance, time.monotonic())
+        return balance
+    finally:
+        if _balance_inflight.get(address) is asyncio.current_task():
+            del _balance_inflight[address]
+
+async def get_cached_balance(address: str, max_age: float = BALANCE_CACHE_TTL) -> float:
+    """Get SOL balance, serving recent results and sharing concurrent lookups"""
+    cached = _balance_cache.get(address)
+    if cached and time.monotonic() - cached[1] < max_age:
+        return cached[0]
+    
+    task = _balance_inflight.get(address)
+    if task is None:
+        task = asyncio.create_task(_fetch_balance(address))
+        _balance_inflight[address] = task
+    return await asyncio.shield(task)
+
+# Background refresh of recently used wallets so menus render from cache
+BALANCE_REFRESH_INTERVAL = 15
+BALANCE_REFRESH_MAX_AGE = 30  # menus accept balances up to this old
+BALANCE_WATCH_WINDOW = 600  # stop refreshing wallets idle for this long
+_balance_watchlist: Dict[str, float] = {}
+
+def watch_wallet_balance(address: str):
+    """Keep a wallet's cached balance warm while it is in use"""
+    _balance_watchlist[address] = time.monotonic()
+
+async def balance_refresh_loop():
+    """Refresh balances of watched wallets every BALANCE_REFRESH_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(BALANCE_REFRESH_INTERVAL)
+        if not helius_rpc:
+            continue
+        now = time.monotonic()
+        for address, last_used in list(_balance_watchlist.items()):
+            if now - last_used > BALANCE_WATCH_WINDOW:
+                _balance_watchlist.pop(address, None)
+        # Drop cached balances nobody is watching once no caller would accept them
+        for address, (_, fetched_at) in list(_balance_cache.items()):
+            if address not in _balance_watchlist and now - fetched_at > BALANCE_REFRESH_MAX_AGE:
+                _balance_cache.pop(address, None)
+        addresses = list(_balance_watchlist)
+        if addresses:
+            await asyncio.gather(*[get_cached_balance(a) for a in addresses], return_exceptions=True)
+
+async def get_balance_and_sol_price(public_key: Optional[str]):
+    """Fetch wallet SOL balance and SOL/USD price concurrently"""
+    async def fetch_balance():
+        if public_key and helius_rpc:
+            watch_wallet_balance(public_key)
+            return await get_cached_balance(public_key, max_age=BALANCE_REFRESH_MAX_AGE)
+        return 0
+
+    balance_sol, sol_price = await asyncio.gather(fetch_balance(), get_sol_price())
+    return balance_sol, sol_price
+
+def build_trade_amount_markup(balance_usd: float) -> InlineKeyboardMarkup:
+    """Quick-trade amount grid; amounts above the balance are marked unaffordable"""
+    rows = [
+        [
+            InlineKeyboardButton(f"${amount}", callback_data=f"trade_amount_{amount}")
+            if amount <= balance_usd else
+            InlineKeyboardButton(f"${amount} ❌", callback_data=f"trade_amount_insufficient_{amount}")
+            for amount in amounts
+        ]
+        for amounts in AFFORD_ROWS
+    ]
+    rows.append([InlineKeyboardButton("❌ Cancel", callback_data="back_main")])
+    return InlineKeyboardMarkup(rows)
+
 # Dynamic API keys storage (can be updated by admin)
 api_keys_config = {
     "solscan": SOLSCAN_API_KEY,
@@ -248,45 +407,35 @@ async def get_whale_transactions(wallet_address: str):
         try:
             # Correct header format: token: API_KEY
             headers = {"token": solscan_key}
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(
-                    f"https://pro-api.solscan.io/v2.0/account/transfer",
-                    params={"address": wallet_address, "page_size": 20},
-                    headers=headers,
-                    timeout=15
-                )
-                if response.status_code == 200:
-                    logger.info(f"Solscan API success for {wallet_address[:8]}...")
-                    return response.json()
-                elif response.status_code == 401:
-                    error_data = response.json()
-                    error_msg = error_data.get("error_message", "Unauthorized")
-                    if "upgrade" in error_msg.lower():
-                        logger.warning(f"Solscan API requires paid tier - using Helius fallback")
-                    else:
-                        logger.warning(f"Solscan API 401: {error_msg}")
+            response = await http_client.get(
+                f"https://pro-api.solscan.io/v2.0/account/transfer",
+                params={"address": wallet_address, "page_size": 20},
+                headers=headers,
+                timeout=15
+            )
+            if response.status_code == 200:
+                logger.info(f"Solscan API success for {wallet_address[:8]}...")
+                return orjson.loads(response.content)
+            elif response.status_code == 401:
+                error_data = orjson.loads(response.content)
+                error_msg = error_data.get("error_message", "Unauthorized")
+                if "upgrade" in error_msg.lower():
+                    logger.warning(f"Solscan API requires paid tier - using Helius fallback")
                 else:
-                    logger.warning(f"Solscan API returned {response.status_code}")
+                    logger.warning(f"Solscan API 401: {error_msg}")
+            else:
+                logger.warning(f"Solscan API returned {response.status_code}")
         except Exception as e:
             logger.error(f"Solscan API error: {e}")
     
     # Fallback to Helius for transaction data
     helius_key = api_keys_config.get("helius", HELIUS_API_KEY)
-    if helius_key:
-        try:
-            async with httpx.AsyncClient() as http_client:
-                response = await http_client.get(
-                    f"https://api.helius.xyz/v0/addresses/{wallet_address}/transactions",
-                    params={"api-key": helius_key, "limit": 20},
-                    timeout=15
-                )
-                if response.status_code == 200:
-                    logger.info(f"Helius fallback success for {wallet_address[:8]}...")
-                    data = response.json()
-                    # Transform Helius format to match expected structure
-                    return {"data": data, "source": "helius"}
-        except Exception as e:
-            logger.error(f"Helius fallback error: {e}")
+    if helius_key and helius_rpc:
+        data = await helius_rpc.get_enhanced_transactions(wallet_address, limit=20, api_key=helius_key)
+        if data is not None:
+            logger.info(f"Helius fallback success for {wallet_address[:8]}...")
+            # Transform Helius format to match expected structure
+            return {"data": data, "source": "helius"}
     
     return {"data": []}
 
@@ -298,69 +447,97 @@ async def test_solscan_api(api_key: str = None) -> dict:
     try:
         # Correct header: token
         headers = {"token": key}
-        async with httpx.AsyncClient() as http_client:
-            response = await http_client.get(
-                f"https://pro-api.solscan.io/v2.0/account/transfer",
-                params={"address": test_wallet, "page_size": 1},
-                headers=headers,
-                timeout=10
-            )
-            if response.status_code == 200:
-                return {
-                    "status": "ok",
-                    "status_code": response.status_code,
-                    "message": "API key is valid and working"
-                }
-            elif response.status_code == 401:
-                error_data = response.json()
-                error_msg = error_data.get("error_message", "Unauthorized")
-                if "upgrade" in error_msg.lower():
-                    return {
-                        "status": "upgrade_required",
-                        "status_code": response.status_code,
-                        "message": "API key valid but requires paid tier upgrade at solscan.io"
-                    }
+        response = await http_client.get(
+            f"https://pro-api.solscan.io/v2.0/account/transfer",
+            params={"address": test_wallet, "page_size": 1},
+            headers=headers,
+            timeout=10
+        )
+        if response.status_code == 200:
+            return {
+                "status": "ok",
+                "status_code": response.status_code,
+                "message": "API key is valid and working"
+            }
+        elif response.status_code == 401:
+            error_data = orjson.loads(response.content)
+            error_msg = error_data.get("error_message", "Unauthorized")
+            if "upgrade" in error_msg.lower():
                 return {
-                    "status": "error",
+                    "status": "upgrade_required",
                     "status_code": response.status_code,
-                    "message": error_msg
+                    "message": "API key valid but requires paid tier upgrade at solscan.io"
                 }
             return {
                 "status": "error",
                 "status_code": response.status_code,
-                "message": f"API returned {response.status_code}"
+                "message": error_msg
             }
+        return {
+            "status": "error",
+            "status_code": response.status_code,
+            "message": f"API returned {response.status_code}"
+        }
     except Exception as e:
         return {"status": "error", "status_code": 0, "message": str(e)}
 
+# Upstream API health, refreshed by health_checker_loop so /api/api-status never probes inline
+HEALTH_CHECK_INTERVAL = 30
+health_cache: Dict[str, Dict] = {}
+
+async def probe_helius() -> dict:
+    """Check that the Helius RPC node is healthy"""
+    if not helius_rpc:
+        return {"status": "error", "message": "Helius RPC not initialized"}
+    healthy, error = await helius_rpc.get_health()
+    if healthy:
+        return {"status": "ok", "message": "Helius RPC healthy"}
+    return {"status": "error", "message": error or "Helius RPC unhealthy"}
+
+async def refresh_health_cache():
+    """Probe all upstream APIs concurrently and store the results"""
+    solscan_result, helius_result = await asyncio.gather(test_solscan_api(), probe_helius())
+    health_cache["solscan"] = solscan_result
+    health_cache["helius"] = helius_result
+
+async def health_checker_loop():
+    """Refresh upstream API health every HEALTH_CHECK_INTERVAL seconds"""
+    while True:
+        try:
+            await refresh_health_cache()
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+        await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+
 async def get_trending_tokens():
     """Fetch trending tokens from pump.fun/dexscreener"""
     try:
-        async with httpx.AsyncClient() as http_client:
-            # Try DexScreener API for trending Solana tokens
-            response = await http_client.get(
-                "https://api.dexscreener.com/latest/dex/tokens/So11111111111111111111111111111111111111112",
-                timeout=15
-            )
-            if response.status_code == 200:
-                return response.json()
-            return {"pairs": []}
+        # Try DexScreener API for trending Solana tokens
+        response = await http_client.get(
+            "https://api.dexscreener.com/latest/dex/tokens/So11111111111111111111111111111111111111112",
+            timeout=15
+        )
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return {"pairs": []}
     except Exception as e:
         logger.error(f"Error fetching trending tokens: {e}")
         return {"pairs": []}
 
 # Telegram Bot Handlers
 telegram_app = None
-telegram_db = None  # Separate DB connection for telegram thread
+TELEGRAM_CONCURRENT_UPDATES = 16  # max handlers running at once (bounds Mongo/RPC fan-out)
+shared_bot: Optional[Bot] = None  # telegram_app.bot, reused for all outgoing messages
+shared_bot_ready: Optional[asyncio.Event] = None  # set once shared_bot is published, or once startup has failed
+
+# Outgoing notification queue (drained by notify_worker on the app loop)
+NOTIFY_BATCH_SIZE = 28
+NOTIFY_QUEUE_MAX = 1000  # beyond this, new notifications are dropped rather than held in memory
+notify_queue: Optional[asyncio.Queue] = None
 
 def get_telegram_db():
-    """Get MongoDB connection for telegram thread"""
-    global telegram_db
-    if telegram_db is None:
-        from motor.motor_asyncio import AsyncIOMotorClient
-        telegram_client = AsyncIOMotorClient(mongo_url)
-        telegram_db = telegram_client[os.environ['DB_NAME']]
-    return telegram_db
+    """Get MongoDB database for bot handlers (the bot shares the app's event loop and client)"""
+    return db
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /start command"""
@@ -454,7 +631,7 @@ async def wallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     wallets = await get_telegram_db().wallets.find(
         {"user_telegram_id": telegram_id, "is_active": True},
         {"_id": 0}
-    ).to_list(10)
+    ).limit(10).to_list(10)
     
     if not wallets:
         await update.message.reply_text(
@@ -488,6 +665,7 @@ async def newwallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         private_key_encrypted=private_key  # In production, encrypt this!
     )
     await get_telegram_db().wallets.insert_one(wallet.model_dump())
+    watch_wallet_balance(public_key)
     
     # Send private key securely
     await update.message.reply_text(
@@ -519,7 +697,7 @@ async def balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     wallets = await get_telegram_db().wallets.find(
         {"user_telegram_id": telegram_id, "is_active": True},
         {"_id": 0}
-    ).to_list(10)
+    ).limit(10).to_list(10)
     
     if not user:
         await update.message.reply_text("❌ Please /start the bot first.")
@@ -533,7 +711,7 @@ async def balance_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     trades = await get_telegram_db().trades.find(
         {"user_telegram_id": telegram_id},
         {"_id": 0}
-    ).to_list(1000)
+    ).limit(1000).to_list(1000)
     
     total_profit = sum(t.get('profit_usd', 0) for t in trades)
     
@@ -590,8 +768,7 @@ async def setcredits_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         user = await get_telegram_db().users.find_one({"username": target_username}, {"_id": 0})
         if user:
             try:
-                bot = Bot(token=TELEGRAM_BOT_TOKEN)
-                await bot.send_message(
+                await context.bot.send_message(
                     chat_id=user['telegram_id'],
                     text=f"🎉 *Credits Updated!*\n\nYou now have *{amount}* credits.\n\nAdmin: {ADMIN_USERNAME}",
                     parse_mode='Markdown'
@@ -613,7 +790,7 @@ async def whales_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     user_wallets = await tg_db.user_tracked_wallets.find(
         {"user_telegram_id": telegram_id, "is_active": True},
         {"_id": 0}
-    ).to_list(50)
+    ).limit(50).to_list(50)
     
     whale_text = "🐋 *YOUR TRACKED WALLETS* 🐋\n━━━━━━━━━━━━━━━━━━━━━\n\n"
     
@@ -633,7 +810,7 @@ async def whales_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         whale_text += f"*🔒 Preset Wallets (Admin Only):*\n"
         for i, wallet in enumerate(WHALE_WALLETS[:5], 1):
             whale_text += f"{i}. `{wallet[:8]}...{wallet[-8:]}`\n"
-        whale_text += f"\n...and {len(WHALE_WALLETS) - 5} more preset\n"
+        whale_text += f"\n...and {TRACKED_WHALE_COUNT - 5} more preset\n"
     
     whale_text += "\n💡 Use /addwallet to track a new wallet"
     
@@ -654,8 +831,8 @@ async def addwallet_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     wallet_address = args[0]
     label = " ".join(args[1:]) if len(args) > 1 else "Unlabeled"
     
-    # Validate wallet address (basic check)
-    if len(wallet_address) < 32 or len(wallet_address) > 50:
+    # Validate wallet address
+    if not SOLANA_ADDRESS_RE.fullmatch(wallet_address):
         await update.message.reply_text("❌ Invalid wallet address. Please enter a valid Solana address.")
         return
     
@@ -854,7 +1031,7 @@ async def autotrade_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     # Check balance
     if helius_rpc:
-        balance = await helius_rpc.get_balance(wallet['public_key'])
+        balance = await get_cached_balance(wallet['public_key'])
         if balance < trade_amount + 0.01:
             await update.message.reply_text(
                 f"❌ Insufficient balance for auto-trading.\nRequired: {trade_amount + 0.01:.4f} SOL\nAvailable: {balance:.4f} SOL\n\nFund your wallet:\n`{wallet['public_key']}`",
@@ -865,7 +1042,7 @@ async def autotrade_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     # Recreate keypair
     try:
         private_key = wallet.get('private_key_encrypted')
-        keypair = Keypair.from_bytes(base58.b58decode(private_key))
+        keypair = Keypair.from_base58_string(private_key)
     except Exception as e:
         await update.message.reply_text(f"❌ Error loading wallet: {str(e)[:50]}")
         return
@@ -925,7 +1102,7 @@ async def pnl_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     trades = await get_telegram_db().trades.find(
         {"user_telegram_id": telegram_id},
         {"_id": 0}
-    ).sort("created_at", -1).to_list(100)
+    ).sort("created_at", -1).limit(100).to_list(100)
     
     if not trades:
         await update.message.reply_text("📊 No trades found. Use /autotrade to start trading!")
@@ -1005,7 +1182,7 @@ async def trades_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     trades = await get_telegram_db().trades.find(
         {"user_telegram_id": telegram_id},
         {"_id": 0}
-    ).sort("created_at", -1).to_list(20)
+    ).sort("created_at", -1).limit(20).to_list(20)
     
     if not trades:
         await update.message.reply_text("📊 No trades found.")
@@ -1056,7 +1233,7 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 • Auto-Trading: {'🟢 ENABLED (' + str(user_trade_amount) + ' SOL)' if user_auto_enabled else '🔴 DISABLED'}
 
 *Active Users:* {len(active_trading_users)}
-*Tracked Whales:* {len(WHALE_WALLETS)}
+*Tracked Whales:* {TRACKED_WHALE_COUNT}
 """
     
     if is_admin:
@@ -1079,12 +1256,12 @@ async def trending_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
             if tokens:
                 text = "🔥 *TRENDING TOKENS* 🔥\n━━━━━━━━━━━━━━━━━━━━━\n\n"
                 for i, t in enumerate(tokens[:10], 1):
-                    price_change = t.get('price_change_24h', 0)
+                    price_change = t.price_change_24h
                     emoji = "🟢" if price_change > 0 else "🔴"
-                    text += f"{i}. *{t['symbol']}* {emoji}\n"
-                    text += f"   💲 ${t['price_usd']:.6f}\n"
+                    text += f"{i}. *{t.symbol}* {emoji}\n"
+                    text += f"   💲 ${t.price_usd:.6f}\n"
                     text += f"   📈 {price_change:+.2f}%\n"
-                    text += f"   💧 ${t['liquidity_usd']:,.0f}\n\n"
+                    text += f"   💧 ${t.liquidity_usd:,.0f}\n\n"
                 
                 text += "_Use /rugcheck <address> to check safety_"
                 await update.message.reply_text(text, parse_mode='Markdown')
@@ -1200,7 +1377,7 @@ async def trade_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 return
             
             # Recreate keypair
-            keypair = Keypair.from_bytes(base58.b58decode(private_key))
+            keypair = Keypair.from_base58_string(private_key)
             
             # Check balance via Helius
             balance = await helius_rpc.get_balance(wallet['public_key'])
@@ -1219,7 +1396,8 @@ async def trade_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 keypair=keypair,
                 input_mint=WSOL_MINT,
                 output_mint=token_address,
-                amount_lamports=amount_lamports
+                amount_lamports=amount_lamports,
+                user_public_key=wallet['public_key']
             )
             
             if result.success:
@@ -1295,7 +1473,7 @@ async def positions_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     trades = await get_telegram_db().trades.find(
         {"user_telegram_id": telegram_id, "status": {"$in": ["PENDING", "ACTIVE", "SIMULATED"]}},
         {"_id": 0}
-    ).to_list(20)
+    ).limit(20).to_list(20)
     
     if not trades:
         await update.message.reply_text("📊 No active positions.\n\nUse /trade <token> <amount> to open one.")
@@ -1306,10 +1484,50 @@ async def positions_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         text += f"*{t['trade_type']}* `{t['token_address'][:12]}...`\n"
         text += f"  Amount: {t['amount_sol']:.4f} SOL\n"
         text += f"  Status: {t['status']}\n"
-        text += f"  Time: {t['created_at'][:16]}\n\n"
+        text += f"  Time: {format_timestamp(t['created_at'])}\n\n"
     
     await update.message.reply_text(text, parse_mode='Markdown')
 
+# Whale activity write buffer (flushed with insert_many)
+WHALE_ACTIVITY_FLUSH_INTERVAL = 0.5
+WHALE_ACTIVITY_FLUSH_SIZE = 100
+WHALE_ACTIVITY_BUFFER_MAX = 1000  # cap on documents held back for retry while Mongo is unreachable
+whale_activity_buffer: List[Dict] = []
+
+async def buffer_whale_activity(doc: Dict):
+    """Queue a whale activity document for the next bulk insert"""
+    whale_activity_buffer.append(doc)
+    if len(whale_activity_buffer) >= WHALE_ACTIVITY_FLUSH_SIZE:
+        await flush_whale_activities()
+
+async def flush_whale_activities():
+    """Write all buffered whale activities in one insert_many"""
+    global whale_activity_buffer
+    if not whale_activity_buffer:
+        return
+    batch, whale_activity_buffer = whale_activity_buffer, []
+    try:
+        await db.whale_activities.insert_many(batch, ordered=False)
+    except BulkWriteError as e:
+        # ordered=False: everything but the reported documents was written
+        details = e.details
+        logger.error(
+            f"Whale activity flush wrote {details.get('nInserted', 0)}/{len(batch)}; "
+            f"{len(details.get('writeErrors', []))} write errors, first: {(details.get('writeErrors') or [{}])[0].get('errmsg')}"
+        )
+    except (ConnectionFailure, ExecutionTimeout, WTimeoutError) as e:
+        # Transient: put the batch back ahead of newer documents, keeping the newest WHALE_ACTIVITY_BUFFER_MAX
+        whale_activity_buffer = (batch + whale_activity_buffer)[-WHALE_ACTIVITY_BUFFER_MAX:]
+        logger.warning(f"Whale activity flush failed, {len(whale_activity_buffer)} documents held for retry: {e}")
+    except Exception as e:
+        logger.error(f"Failed to flush {len(batch)} whale activities: {e}")
+
+async def whale_activity_flusher():
+    """Periodically flush the whale activity buffer"""
+    while True:
+        await asyncio.sleep(WHALE_ACTIVITY_FLUSH_INTERVAL)
+        await flush_whale_activities()
+
 async def whale_activity_callback(activity: Dict):
     """Callback when whale activity is detected - triggers auto trades"""
     logger.info(f"🐋 Whale activity detected: {activity}")
@@ -1320,15 +1538,12 @@ async def whale_activity_callback(activity: Dict):
         token_address=activity.get('token_address', ''),
         token_symbol=activity.get('token_symbol', 'UNKNOWN'),
         action=activity.get('action', 'UNKNOWN'),
-        amount=activity.get('amount', 0),
-        detected_at=datetime.now(timezone.utc).isoformat()
+        amount=activity.get('amount', 0)
     )
-    await get_telegram_db().whale_activities.insert_one(whale_activity.model_dump())
+    await buffer_whale_activity(whale_activity.model_dump())
     
     # Notify admin chat
-    try:
-        bot = Bot(token=TELEGRAM_BOT_TOKEN)
-        text = f"""
+    text = f"""
 🐋 *WHALE ALERT* 🐋
 
 *Wallet:* `{activity['whale_address'][:12]}...`
@@ -1338,14 +1553,7 @@ async def whale_activity_callback(activity: Dict):
 
 [View on Solscan](https://solscan.io/tx/{activity.get('signature', '')})
 """
-        await bot.send_message(
-            chat_id=ADMIN_CHAT_ID,
-            text=text,
-            parse_mode='Markdown',
-            disable_web_page_preview=True
-        )
-    except Exception as e:
-        logger.error(f"Failed to notify whale activity: {e}")
+    await telegram_notify_user(ADMIN_CHAT_ID, text)
     
     # AUTO-TRADE: Execute trades for all active trading users
     if AUTO_TRADE_ON_WHALE_SIGNAL and activity.get('action') == 'BUY':
@@ -1395,29 +1603,9 @@ async def quicktrade_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return
     
     # Get wallet balance
-    balance_sol = 0
-    if helius_rpc:
-        balance_sol = await helius_rpc.get_balance(wallet['public_key'])
-    
-    sol_price = await get_sol_price()
+    balance_sol, sol_price = await get_balance_and_sol_price(wallet['public_key'])
     balance_usd = balance_sol * sol_price
     
-    # Create trade amount selection buttons
-    keyboard = []
-    row = []
-    for i, amount in enumerate(TRADE_AMOUNTS):
-        if balance_usd >= amount:
-            row.append(InlineKeyboardButton(f"${amount}", callback_data=f"trade_amount_{amount}"))
-        else:
-            row.append(InlineKeyboardButton(f"${amount} ❌", callback_data=f"trade_amount_insufficient_{amount}"))
-        if len(row) == 4:
-            keyboard.append(row)
-            row = []
-    if row:
-        keyboard.append(row)
-    
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_main")])
-    
     await update.message.reply_text(
         f"""
 ⚡ *QUICK TRADE* ⚡
@@ -1437,7 +1625,7 @@ Higher amounts = Higher potential profit (and risk)!
 
 Select your trade amount below:
 """,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=build_trade_amount_markup(balance_usd),
         parse_mode='Markdown'
     )
 
@@ -1459,7 +1647,7 @@ async def leaderboard_command(update: Update, context: ContextTypes.DEFAULT_TYPE
         {"$limit": 10}
     ]
     
-    leaderboard_data = await tg_db.trades.aggregate(pipeline).to_list(10)
+    leaderboard_data = await tg_db.trades.aggregate(pipeline, allowDiskUse=True).to_list(10)
     
     # Get usernames
     leaderboard_text = "🏆 *PROFIT LEADERBOARD* 🏆\n━━━━━━━━━━━━━━━━━━━━━\n\n"
@@ -1489,34 +1677,38 @@ async def myrank_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     telegram_id = update.effective_user.id
     tg_db = get_telegram_db()
     
-    # Get user's stats
-    user_trades = await tg_db.trades.find(
-        {"user_telegram_id": telegram_id},
-        {"_id": 0, "profit_usd": 1, "status": 1}
-    ).to_list(10000)
-    
-    total_profit = sum(t.get('profit_usd', 0) for t in user_trades)
-    total_trades = len(user_trades)
-    successful = sum(1 for t in user_trades if t.get('status') == 'COMPLETED')
-    win_rate = (successful / total_trades * 100) if total_trades > 0 else 0
-    
-    # Calculate rank
+    # One pass over per-trader totals: the user's own stats and the rank are read from the same
+    # server-side $sum, so the user is never compared against a differently computed figure
     pipeline = [
         {"$group": {
             "_id": "$user_telegram_id",
-            "total_profit": {"$sum": "$profit_usd"}
+            "total_profit": {"$sum": "$profit_usd"},
+            "total_trades": {"$sum": 1},
+            "successful": {"$sum": {"$cond": [{"$eq": ["$status", "COMPLETED"]}, 1, 0]}}
         }},
-        {"$sort": {"total_profit": -1}}
+        {"$facet": {
+            "me": [{"$match": {"_id": telegram_id}}],
+            "all": [{"$project": {"_id": 0, "total_profit": 1}}]
+        }},
+        {"$project": {
+            "me": {"$arrayElemAt": ["$me", 0]},
+            "total": {"$size": "$all"},
+            "ahead": {"$size": {"$filter": {
+                "input": "$all",
+                "cond": {"$gt": ["$$this.total_profit", {"$ifNull": [{"$arrayElemAt": ["$me.total_profit", 0]}, 0]}]}
+            }}}
+        }}
     ]
     
-    all_traders = await tg_db.trades.aggregate(pipeline).to_list(1000)
-    rank = 1
-    for trader in all_traders:
-        if trader["_id"] == telegram_id:
-            break
-        rank += 1
-    
-    total_traders = len(all_traders)
+    rank_data = await tg_db.trades.aggregate(pipeline, allowDiskUse=True).to_list(1)
+    summary = rank_data[0] if rank_data else {}
+    me = summary.get("me") or {}
+    total_profit = me.get("total_profit", 0)
+    total_trades = me.get("total_trades", 0)
+    successful = me.get("successful", 0)
+    win_rate = (successful / total_trades * 100) if total_trades > 0 else 0
+    rank = summary.get("ahead", 0) + 1
+    total_traders = summary.get("total", 0)
     
     rank_text = f"""
 🎖️ *YOUR TRADING RANK* 🎖️
@@ -1562,14 +1754,6 @@ Use /pay to buy more credits.
         )
         return
     
-    # Show deployment options
-    keyboard = [
-        [InlineKeyboardButton("🚀 Deploy 5 Soldiers (50 credits)", callback_data="deploy_soldiers_5")],
-        [InlineKeyboardButton("💪 Deploy 10 Soldiers (50 credits)", callback_data="deploy_soldiers_10")],
-        [InlineKeyboardButton("⚔️ Deploy 20 Soldiers (50 credits)", callback_data="deploy_soldiers_20")],
-        [InlineKeyboardButton("❌ Cancel", callback_data="back_main")]
-    ]
-    
     faucet_stats = soldiers_army.get_faucet_stats() if soldiers_army else {"total_faucets": 50, "mainnet_faucets": 10, "testnet_faucets": 40}
     
     await update.message.reply_text(
@@ -1598,7 +1782,7 @@ SOL, ETH, MATIC, BNB, AVAX, FTM, DOGE, LTC, and more!
 
 Select deployment option:
 """,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=SOLDIERS_DEPLOY_MARKUP,
         parse_mode='Markdown'
     )
 
@@ -1678,7 +1862,7 @@ async def mytrades_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     trades = await get_telegram_db().trades.find(
         {"user_telegram_id": telegram_id},
         {"_id": 0}
-    ).sort("created_at", -1).to_list(20)
+    ).sort("created_at", -1).limit(20).to_list(20)
     
     if not trades:
         await update.message.reply_text("📊 No trades yet. Start trading to see history!")
@@ -1697,7 +1881,7 @@ async def mytrades_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         text += f"{status_icon} *{t['trade_type']}* {t.get('amount_sol', 0):.4f} SOL\n"
         text += f"   Token: {token} | P&L: {profit_text}\n"
-        text += f"   _{t['created_at'][:16]}_\n\n"
+        text += f"   _{format_timestamp(t['created_at'])}_\n\n"
     
     text += f"━━━━━━━━━━━━━━━━━━━━━\n"
     text += f"*Total P&L:* ${total_profit:.2f}\n"
@@ -1767,16 +1951,15 @@ async def adminpanel_command(update: Update, context: ContextTypes.DEFAULT_TYPE)
     tg_db = get_telegram_db()
     
     # Gather stats
-    total_users = await tg_db.users.count_documents({})
+    total_users = await tg_db.users.estimated_document_count()
     total_wallets = await tg_db.wallets.count_documents({"is_active": True})
-    total_trades = await tg_db.trades.count_documents({})
+    total_trades = await tg_db.trades.estimated_document_count()
     pending_payments = await tg_db.payments.count_documents({"status": "PENDING_VERIFICATION"})
     
-    trades = await tg_db.trades.find({}, {"_id": 0, "profit_usd": 1}).to_list(10000)
-    total_profit = sum(t.get('profit_usd', 0) for t in trades)
+    total_profit = (await get_trade_totals())["total_profit"]
     
     # Recent activity
-    recent_trades = await tg_db.trades.find({}, {"_id": 0}).sort("created_at", -1).to_list(5)
+    recent_trades = await tg_db.trades.find({}, {"_id": 0}).sort("created_at", -1).limit(5).to_list(5)
     
     keyboard = [
         [InlineKeyboardButton("👥 All Users", callback_data="admin_users"),
@@ -1821,7 +2004,7 @@ async def allusers_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ Admin access required.")
         return
     
-    users = await get_telegram_db().users.find({}, {"_id": 0}).to_list(100)
+    users = await get_telegram_db().users.find({}, {"_id": 0}).limit(100).to_list(100)
     
     text = "👥 *ALL USERS* 👥\n━━━━━━━━━━━━━━━━━━━━━\n\n"
     
@@ -1843,7 +2026,7 @@ async def alltrades_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("❌ Admin access required.")
         return
     
-    trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).to_list(50)
+    trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).limit(50).to_list(50)
     
     text = "📊 *ALL TRADES* 📊\n━━━━━━━━━━━━━━━━━━━━━\n\n"
     
@@ -1870,15 +2053,13 @@ async def broadcast_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     
     message = " ".join(context.args)
-    users = await get_telegram_db().users.find({}, {"_id": 0, "telegram_id": 1}).to_list(10000)
+    users = await get_telegram_db().users.find({}, {"_id": 0, "telegram_id": 1}).limit(10000).batch_size(1000).to_list(10000)
     
     sent = 0
     failed = 0
-    bot = Bot(token=TELEGRAM_BOT_TOKEN)
-    
     for user in users:
         try:
-            await bot.send_message(
+            await context.bot.send_message(
                 chat_id=user['telegram_id'],
                 text=f"📢 *ANNOUNCEMENT*\n\n{message}\n\n_- Solana Soldier Team_",
                 parse_mode='Markdown'
@@ -2021,10 +2202,13 @@ async def setapi_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode='Markdown'
             )
             return
+        health_cache["solscan"] = test_result
     
     # Update the key
     old_key = api_keys_config.get(service, "")
     api_keys_config[service] = new_key
+    # /api/api-status reports key state and the fresh test result; don't serve the old body until it expires
+    _response_cache.pop("get_api_status", None)
     
     # Also update in database for persistence
     await get_telegram_db().config.update_one(
@@ -2108,7 +2292,7 @@ async def exportwallets_command(update: Update, context: ContextTypes.DEFAULT_TY
     wallets = await get_telegram_db().wallets.find(
         {"user_telegram_id": telegram_id},
         {"_id": 0}
-    ).to_list(100)
+    ).limit(100).to_list(100)
     
     if not wallets:
         await update.message.reply_text("❌ No wallets found.")
@@ -2169,6 +2353,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
             private_key_encrypted=private_key
         )
         await get_telegram_db().wallets.insert_one(wallet.model_dump())
+        watch_wallet_balance(public_key)
         
         await query.edit_message_text(
             f"""
@@ -2190,13 +2375,11 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         wallets = await get_telegram_db().wallets.find(
             {"user_telegram_id": telegram_id, "is_active": True},
             {"_id": 0}
-        ).to_list(10)
+        ).limit(10).to_list(10)
         
         total_sol = sum(w.get('balance_sol', 0) for w in wallets)
         credits = user.get('credits', 0) if user else 0
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
-        
         await query.edit_message_text(
             f"""
 💰 *YOUR BALANCE* 💰
@@ -2205,7 +2388,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
 *Wallets:* {len(wallets)}
 *Total SOL:* {total_sol:.4f}
 """,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2215,7 +2398,7 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_wallets = await tg_db.user_tracked_wallets.find(
             {"user_telegram_id": telegram_id, "is_active": True},
             {"_id": 0}
-        ).to_list(10)
+        ).limit(10).to_list(10)
         
         whale_text = "🐋 *YOUR TRACKED WALLETS* 🐋\n\n"
         if user_wallets:
@@ -2228,10 +2411,9 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         
         whale_text += "\n💡 Use /addwallet to track a wallet"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
         await query.edit_message_text(
             whale_text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2241,12 +2423,11 @@ async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE):
         for i, wallet in enumerate(WHALE_WALLETS, 1):
             whale_text += f"{i}. `{wallet[:8]}...{wallet[-8:]}`\n"
         
-        whale_text += f"\n*Total:* {len(WHALE_WALLETS)} wallets monitored 24/7"
+        whale_text += f"\n*Total:* {TRACKED_WHALE_COUNT} wallets monitored 24/7"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
         await query.edit_message_text(
             whale_text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2275,7 +2456,7 @@ Use /removewallet <address> to remove.
             return
         
         tg_db = get_telegram_db()
-        users = await tg_db.users.find({}, {"_id": 0}).to_list(20)
+        users = await tg_db.users.find({}, {"_id": 0}).limit(20).to_list(20)
         
         text = "👥 *USER MANAGEMENT* 👥\n━━━━━━━━━━━━━━━━━━━━━\n\n"
         text += f"*Total Users:* {len(users)}\n\n"
@@ -2288,10 +2469,9 @@ Use /removewallet <address> to remove.
         
         text += "\n*Commands:*\n/setcredits @user amount"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
         await query.edit_message_text(
             text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2299,7 +2479,7 @@ Use /removewallet <address> to remove.
         trades = await get_telegram_db().trades.find(
             {"user_telegram_id": telegram_id},
             {"_id": 0}
-        ).to_list(10)
+        ).limit(10).to_list(10)
         
         if trades:
             trade_text = "📊 *RECENT TRADES* 📊\n\n"
@@ -2308,10 +2488,9 @@ Use /removewallet <address> to remove.
         else:
             trade_text = "📊 *TRADES* 📊\n\nNo trades yet. Buy access to start trading!"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
         await query.edit_message_text(
             trade_text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2402,8 +2581,7 @@ After payment, click "I've Paid".
         
         # Notify admin
         try:
-            bot = Bot(token=TELEGRAM_BOT_TOKEN)
-            await bot.send_message(
+            await context.bot.send_message(
                 chat_id=ADMIN_CHAT_ID,
                 text=f"""
 🔔 *NEW PAYMENT REQUEST* 🔔
@@ -2453,10 +2631,9 @@ You'll receive a notification once verified.
             {"user_telegram_id": telegram_id},
             {"$set": {"is_active": False}}
         )
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="back_main")]]
         await query.edit_message_text(
             "✅ All wallets deleted. Use /newwallet to create a fresh one.",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=BACK_TO_MAIN_MARKUP,
             parse_mode='Markdown'
         )
     
@@ -2540,7 +2717,7 @@ Press START to begin auto-trading!
         
         # Check balance
         if helius_rpc:
-            balance = await helius_rpc.get_balance(wallet['public_key'])
+            balance = await get_cached_balance(wallet['public_key'])
             if balance < amount_sol + 0.01:
                 await query.edit_message_text(
                     f"❌ Insufficient balance.\n\nRequired: {amount_sol + 0.01:.4f} SOL\nAvailable: {balance:.4f} SOL\n\nFund your wallet:\n`{wallet['public_key']}`",
@@ -2580,7 +2757,7 @@ Press START to begin auto-trading!
 
 *Status:* 🟢 LIVE
 
-Your bot is now monitoring {len(WHALE_WALLETS)} whale wallets.
+Your bot is now monitoring {TRACKED_WHALE_COUNT} whale wallets.
 You'll receive real-time notifications for every trade!
 
 Trade reports will be sent automatically.
@@ -2624,30 +2801,12 @@ Trade reports will be sent automatically.
             {"user_telegram_id": telegram_id, "is_active": True},
             {"_id": 0}
         )
-        balance_sol = 0
-        if wallet and helius_rpc:
-            balance_sol = await helius_rpc.get_balance(wallet['public_key'])
-        
-        sol_price = await get_sol_price()
+        balance_sol, sol_price = await get_balance_and_sol_price(wallet['public_key'] if wallet else None)
         balance_usd = balance_sol * sol_price
         
-        keyboard = []
-        row = []
-        for i, amount in enumerate(TRADE_AMOUNTS):
-            if balance_usd >= amount:
-                row.append(InlineKeyboardButton(f"${amount}", callback_data=f"trade_amount_{amount}"))
-            else:
-                row.append(InlineKeyboardButton(f"${amount} ❌", callback_data=f"trade_amount_insufficient_{amount}"))
-            if len(row) == 4:
-                keyboard.append(row)
-                row = []
-        if row:
-            keyboard.append(row)
-        keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="back_main")])
-        
         await query.edit_message_text(
             f"⚡ *QUICK TRADE* ⚡\n\n*Balance:* {balance_sol:.4f} SOL (~${balance_usd:.2f})\n\nSelect trade amount:",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=build_trade_amount_markup(balance_usd),
             parse_mode='Markdown'
         )
     
@@ -2698,7 +2857,7 @@ Trade reports will be sent automatically.
 *Session:* `{session.session_id[:20]}...`
 *Agents:* {num_agents} deployed
 *Duration:* 24 hours
-*Faucets:* {len(CRYPTO_FAUCETS)} targets
+*Faucets:* {FAUCET_COUNT} targets
 
 Your soldiers are now mining crypto!
 
@@ -2732,87 +2891,123 @@ Use /missionstatus to check progress.
             await query.answer("❌ Admin only!", show_alert=True)
             return
         
-        users = await get_telegram_db().users.find({}, {"_id": 0}).to_list(50)
+        users = await get_telegram_db().users.find({}, {"_id": 0}).limit(50).to_list(50)
         text = "👥 *ALL USERS* 👥\n━━━━━━━━━━━━━━━━━━━━━\n\n"
         for u in users[:20]:
             badge = "👑" if u.get('is_admin') else "👤"
             text += f"{badge} @{u.get('username', 'unknown')} | {u.get('credits', 0):.0f} credits\n"
         text += f"\n*Total:* {len(users)} users"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_back")]]
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode='Markdown')
+        await query.edit_message_text(text, reply_markup=BACK_TO_ADMIN_MARKUP, parse_mode='Markdown')
     
     elif data == "admin_trades":
         if not is_admin_user(query.from_user.username):
             await query.answer("❌ Admin only!", show_alert=True)
             return
         
-        trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).to_list(20)
+        trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).limit(20).to_list(20)
         text = "📊 *ALL TRADES* 📊\n━━━━━━━━━━━━━━━━━━━━━\n\n"
         for t in trades[:15]:
             status = "✅" if t.get('status') == 'COMPLETED' else "❌" if t.get('status') == 'FAILED' else "⏳"
             text += f"{status} User {t['user_telegram_id']} | {t['trade_type']} {t.get('amount_sol', 0):.3f} SOL | ${t.get('profit_usd', 0):.2f}\n"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_back")]]
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode='Markdown')
+        await query.edit_message_text(text, reply_markup=BACK_TO_ADMIN_MARKUP, parse_mode='Markdown')
     
     elif data == "admin_payments":
         if not is_admin_user(query.from_user.username):
             await query.answer("❌ Admin only!", show_alert=True)
             return
         
-        payments = await get_telegram_db().payments.find({}, {"_id": 0}).sort("created_at", -1).to_list(20)
+        payments = await get_telegram_db().payments.find({}, {"_id": 0}).sort("created_at", -1).limit(20).to_list(20)
         text = "💳 *PAYMENTS* 💳\n━━━━━━━━━━━━━━━━━━━━━\n\n"
         for p in payments[:15]:
             status = "✅" if p.get('status') == 'VERIFIED' else "⏳"
             text += f"{status} User {p['user_telegram_id']} | £{p.get('amount_gbp', 0)} | {p.get('crypto_type', 'N/A')}\n"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_back")]]
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode='Markdown')
+        await query.edit_message_text(text, reply_markup=BACK_TO_ADMIN_MARKUP, parse_mode='Markdown')
     
     elif data == "admin_whale_logs":
         if not is_admin_user(query.from_user.username):
             await query.answer("❌ Admin only!", show_alert=True)
             return
         
-        activities = await get_telegram_db().whale_activities.find({}, {"_id": 0}).sort("detected_at", -1).to_list(20)
+        activities = await get_telegram_db().whale_activities.find({}, {"_id": 0}).sort("detected_at", -1).limit(20).to_list(20)
         text = "🐋 *WHALE LOGS* 🐋\n━━━━━━━━━━━━━━━━━━━━━\n\n"
         for a in activities[:10]:
-            text += f"• {a.get('action', 'N/A')} | {a.get('token_symbol', 'N/A')} | {a.get('detected_at', '')[:16]}\n"
+            text += f"• {a.get('action', 'N/A')} | {a.get('token_symbol', 'N/A')} | {format_timestamp(a.get('detected_at'))}\n"
         
-        keyboard = [[InlineKeyboardButton("🔙 Back", callback_data="admin_back")]]
-        await query.edit_message_text(text, reply_markup=InlineKeyboardMarkup(keyboard), parse_mode='Markdown')
+        await query.edit_message_text(text, reply_markup=BACK_TO_ADMIN_MARKUP, parse_mode='Markdown')
     
     elif data == "admin_back":
         # Go back to admin panel
-        keyboard = [
-            [InlineKeyboardButton("👥 All Users", callback_data="admin_users"),
-             InlineKeyboardButton("📊 All Trades", callback_data="admin_trades")],
-            [InlineKeyboardButton("💳 Payments", callback_data="admin_payments"),
-             InlineKeyboardButton("🐋 Whale Logs", callback_data="admin_whale_logs")],
-        ]
         await query.edit_message_text(
             "👑 *ADMIN PANEL* 👑\n\nSelect an option:",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=ADMIN_MENU_MARKUP,
             parse_mode='Markdown'
         )
     
     elif data == "back_main":
-        keyboard = [
-            [InlineKeyboardButton("💳 Create Wallet", callback_data="create_wallet"),
-             InlineKeyboardButton("💰 My Balance", callback_data="balance")],
-            [InlineKeyboardButton("🐋 Whale Watch", callback_data="whale_watch"),
-             InlineKeyboardButton("📊 My Trades", callback_data="my_trades")],
-            [InlineKeyboardButton("💵 Buy Access (£100/day)", callback_data="buy_access"),
-             InlineKeyboardButton("⚙️ Settings", callback_data="settings")],
-        ]
         await query.edit_message_text(
             "🎖️ *SOLANA SOLDIER* 🎖️\n\nSelect an option:",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=MAIN_MENU_MARKUP,
             parse_mode='Markdown'
         )
 
 # API Endpoints
+_response_cache: Dict[str, tuple] = {}  # endpoint -> (expires_at, serialized body)
+
+def ttl_cache(seconds: float, private: bool = False):
+    """Cache a parameterless endpoint's JSON body for `seconds`, tagging X-Cache HIT/MISS (private: browser-only)"""
+    cache_control = f"{'private, ' if private else ''}max-age={int(seconds)}"
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper():
+            now = time.monotonic()
+            cached = _response_cache.get(func.__name__)
+            if cached and cached[0] > now:
+                body, cache_status = cached[1], "HIT"
+            else:
+                body = orjson.dumps(jsonable_encoder(await func()))
+                _response_cache[func.__name__] = (now + seconds, body)
+                cache_status = "MISS"
+            return Response(
+                content=body,
+                media_type="application/json",
+                headers={"Cache-Control": cache_control, "X-Cache": cache_status}
+            )
+        return wrapper
+    return decorator
+
+TRADE_TOTALS_TTL = 1.0
+_trade_totals_cache: Dict[str, Any] = {"expires": 0.0, "task": None}
+
+TRADE_TOTALS_GROUP = {"$group": {
+    "_id": None,
+    "count": {"$sum": 1},
+    "total_profit": {"$sum": "$profit_usd"},
+    "completed": {"$sum": {"$cond": [{"$eq": ["$status", "COMPLETED"]}, 1, 0]}},
+    "failed": {"$sum": {"$cond": [{"$eq": ["$status", "FAILED"]}, 1, 0]}}
+}}
+
+async def _load_trade_totals() -> Dict[str, float]:
+    """Sum profit and status counts over trades server-side"""
+    result = await get_telegram_db().trades.aggregate([TRADE_TOTALS_GROUP], allowDiskUse=True).to_list(1)
+    summary = result[0] if result else {}
+    return {
+        "total_profit": summary.get("total_profit", 0),
+        "completed": summary.get("completed", 0),
+        "failed": summary.get("failed", 0)
+    }
+
+async def get_trade_totals() -> Dict[str, float]:
+    """Trade totals shared by every caller within the same second"""
+    now = time.monotonic()
+    task = _trade_totals_cache["task"]
+    if task is None or _trade_totals_cache["expires"] <= now or (task.done() and (task.cancelled() or task.exception())):
+        task = asyncio.ensure_future(_load_trade_totals())
+        _trade_totals_cache.update(expires=now + TRADE_TOTALS_TTL, task=task)
+    return await asyncio.shield(task)
+
 @api_router.get("/")
 async def root():
     return {"message": "Solana Soldier API", "status": "online"}
@@ -2820,16 +3015,18 @@ async def root():
 @api_router.get("/stats", response_model=StatsResponse)
 async def get_stats():
     """Get overall bot statistics"""
-    total_users = await get_telegram_db().users.count_documents({})
+    return await _compute_stats()
+
+async def _compute_stats() -> StatsResponse:
+    total_users = await get_telegram_db().users.estimated_document_count()
     active_wallets = await get_telegram_db().wallets.count_documents({"is_active": True})
-    total_trades = await get_telegram_db().trades.count_documents({})
+    total_trades = await get_telegram_db().trades.estimated_document_count()
     
-    trades = await get_telegram_db().trades.find({}, {"_id": 0, "profit_usd": 1}).to_list(10000)
-    total_profit = sum(t.get('profit_usd', 0) for t in trades)
+    total_profit = (await get_trade_totals())["total_profit"]
     
     today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     whale_today = await get_telegram_db().whale_activities.count_documents({
-        "detected_at": {"$gte": today.isoformat()}
+        "detected_at": {"$gte": today}
     })
     
     return StatsResponse(
@@ -2843,37 +3040,42 @@ async def get_stats():
 @api_router.get("/users")
 async def get_users():
     """Get all users"""
-    users = await get_telegram_db().users.find({}, {"_id": 0}).to_list(1000)
+    users = await get_telegram_db().users.find({}, {"_id": 0}).limit(1000).to_list(1000)
     return {"users": users}
 
 @api_router.get("/users/{telegram_id}")
 async def get_user(telegram_id: int):
     """Get specific user"""
-    user = await get_telegram_db().users.find_one({"telegram_id": telegram_id}, {"_id": 0})
+    tg_db = get_telegram_db()
+    user, wallets, trades, profit = await asyncio.gather(
+        tg_db.users.find_one({"telegram_id": telegram_id}, {"_id": 0}),
+        tg_db.wallets.find(
+            {"user_telegram_id": telegram_id, "is_active": True},
+            {"_id": 0}
+        ).limit(100).to_list(100),
+        tg_db.trades.find(
+            {"user_telegram_id": telegram_id},
+            {"_id": 0}
+        ).limit(1000).to_list(1000),
+        tg_db.trades.aggregate([
+            {"$match": {"user_telegram_id": telegram_id}},
+            {"$group": {"_id": None, "total_profit": {"$sum": "$profit_usd"}}}
+        ]).to_list(1)
+    )
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    wallets = await get_telegram_db().wallets.find(
-        {"user_telegram_id": telegram_id, "is_active": True},
-        {"_id": 0}
-    ).to_list(100)
-    
-    trades = await get_telegram_db().trades.find(
-        {"user_telegram_id": telegram_id},
-        {"_id": 0}
-    ).to_list(1000)
-    
     return {
         "user": user,
         "wallets": wallets,
         "trades": trades,
-        "total_profit": sum(t.get('profit_usd', 0) for t in trades)
+        "total_profit": profit[0]["total_profit"] if profit else 0
     }
 
 @api_router.get("/whales")
 async def get_whales():
     """Get tracked whale wallets"""
-    return {"whales": WHALE_WALLETS}
+    return Response(content=WHALES_JSON, media_type="application/json")
 
 @api_router.get("/whale-activities")
 async def get_whale_activities():
@@ -2881,19 +3083,19 @@ async def get_whale_activities():
     activities = await get_telegram_db().whale_activities.find(
         {},
         {"_id": 0}
-    ).sort("detected_at", -1).to_list(100)
+    ).sort("detected_at", -1).limit(100).batch_size(100).to_list(100)
     return {"activities": activities}
 
 @api_router.get("/trades")
 async def get_trades():
     """Get all trades"""
-    trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+    trades = await get_telegram_db().trades.find({}, {"_id": 0}).sort("created_at", -1).limit(1000).batch_size(1000).to_list(1000)
     return {"trades": trades}
 
 @api_router.get("/payments")
 async def get_payments():
     """Get all payments"""
-    payments = await get_telegram_db().payments.find({}, {"_id": 0}).sort("created_at", -1).to_list(100)
+    payments = await get_telegram_db().payments.find({}, {"_id": 0}).sort("created_at", -1).limit(100).batch_size(100).to_list(100)
     return {"payments": payments}
 
 @api_router.get("/sol-price")
@@ -2905,6 +3107,7 @@ async def get_sol_price_endpoint():
 @api_router.post("/whale-activities")
 async def create_whale_activity(activity: WhaleActivityModel):
     """Record a whale activity"""
+    # Written directly, so "created" is only reported once the document is stored
     await get_telegram_db().whale_activities.insert_one(activity.model_dump())
     return {"status": "created", "id": activity.id}
 
@@ -2939,6 +3142,13 @@ async def get_new_pairs_endpoint():
         return {"pairs": pairs}
     return {"pairs": []}
 
+@api_router.get("/market-snapshot")
+async def get_market_snapshot_endpoint():
+    """Get trending tokens and new pairs in one call"""
+    if trending_scanner:
+        return await trending_scanner.get_market_snapshot()
+    return {"trending": [], "new_pairs": []}
+
 @api_router.post("/rugcheck/{token_address}")
 async def rugcheck_endpoint(token_address: str):
     """Check if a token is safe to trade"""
@@ -2993,20 +3203,24 @@ async def execute_trade_endpoint(request: ExecuteTradeRequest):
     return {"status": "queued", "trade_id": trade.id}
 
 @api_router.get("/trading-stats")
+@ttl_cache(seconds=HEALTH_CACHE_TTL)
 async def get_trading_stats():
     """Get trading statistics"""
+    return await _compute_trading_stats()
+
+async def _compute_trading_stats() -> Dict[str, Any]:
     today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     
-    total_trades = await get_telegram_db().trades.count_documents({})
-    trades_today = await get_telegram_db().trades.count_documents({"created_at": {"$gte": today.isoformat()}})
+    total_trades = await get_telegram_db().trades.estimated_document_count()
+    trades_today = await get_telegram_db().trades.count_documents({"created_at": {"$gte": today}})
     
-    all_trades = await get_telegram_db().trades.find({}, {"_id": 0, "profit_usd": 1, "status": 1}).to_list(10000)
-    total_profit = sum(t.get('profit_usd', 0) for t in all_trades)
-    completed = sum(1 for t in all_trades if t.get('status') == 'COMPLETED')
-    failed = sum(1 for t in all_trades if t.get('status') == 'FAILED')
+    totals = await get_trade_totals()
+    total_profit = totals["total_profit"]
+    completed = totals["completed"]
+    failed = totals["failed"]
     
     whale_activities_today = await get_telegram_db().whale_activities.count_documents({
-        "detected_at": {"$gte": today.isoformat()}
+        "detected_at": {"$gte": today}
     })
     
     return {
@@ -3022,12 +3236,16 @@ async def get_trading_stats():
         "live_trading_enabled": LIVE_TRADING_ENABLED,
         "auto_trade_enabled": AUTO_TRADE_ON_WHALE_SIGNAL,
         "active_auto_traders": len(active_trading_users),
-        "tracked_whales": len(WHALE_WALLETS)
+        "tracked_whales": TRACKED_WHALE_COUNT
     }
 
 @api_router.get("/system-status")
+@ttl_cache(seconds=HEALTH_CACHE_TTL)
 async def get_system_status():
     """Get overall system status"""
+    return await _compute_system_status()
+
+async def _compute_system_status() -> Dict[str, Any]:
     return {
         "status": "online",
         "live_trading_enabled": LIVE_TRADING_ENABLED,
@@ -3036,7 +3254,7 @@ async def get_system_status():
         "jupiter_dex_ready": jupiter_dex is not None,
         "whale_monitor_active": whale_monitor is not None,
         "active_trading_users": len(active_trading_users),
-        "tracked_whale_wallets": len(WHALE_WALLETS),
+        "tracked_whale_wallets": TRACKED_WHALE_COUNT,
         "min_profit_target_usd": MIN_PROFIT_USD,
         "min_trade_sol": MIN_TRADE_SOL,
         "max_trade_sol": MAX_TRADE_SOL,
@@ -3049,12 +3267,15 @@ async def get_wallet_balance(address: str):
     if not helius_rpc:
         raise HTTPException(status_code=503, detail="Helius RPC not initialized")
     
-    balance = await helius_rpc.get_balance(address)
+    balance = await get_cached_balance(address)
     return {"address": address, "balance_sol": balance}
 
 @api_router.get("/pnl-stats")
 async def get_pnl_stats():
     """Get overall P&L statistics"""
+    return await _compute_pnl_stats()
+
+async def _compute_pnl_stats() -> Dict[str, Any]:
     if auto_trader:
         stats = await auto_trader.get_pnl_stats()
         return stats
@@ -3067,18 +3288,52 @@ async def get_pnl_stats():
         "active_positions": 0
     }
 
+async def _compute_whales() -> Dict[str, Any]:
+    return {"whales": WHALE_WALLETS}
+
+BUNDLE_SECTIONS = {
+    "system": _compute_system_status,
+    "trading": _compute_trading_stats,
+    "stats": _compute_stats,
+    "whales": _compute_whales,
+    "pnl": _compute_pnl_stats
+}
+
+@api_router.get("/bundle")
+async def get_bundle(keys: str = "system,trading,whales,pnl"):
+    """Get several status sections in one round-trip, e.g. ?keys=system,pnl"""
+    requested = list(dict.fromkeys(k.strip() for k in keys.split(",") if k.strip()))
+    unknown = [k for k in requested if k not in BUNDLE_SECTIONS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown keys: {', '.join(unknown)}. Valid: {', '.join(BUNDLE_SECTIONS)}"
+        )
+    results = await asyncio.gather(*(BUNDLE_SECTIONS[k]() for k in requested))
+    return dict(zip(requested, results))
+
 @api_router.get("/user-pnl/{telegram_id}")
 async def get_user_pnl(telegram_id: int):
     """Get P&L for a specific user"""
-    trades = await get_telegram_db().trades.find(
-        {"user_telegram_id": telegram_id},
-        {"_id": 0}
-    ).to_list(1000)
-    
-    total_pnl = sum(t.get('pnl_usd', 0) for t in trades)
-    total_trades = len(trades)
-    winning = sum(1 for t in trades if t.get('pnl_usd', 0) > 0)
-    losing = sum(1 for t in trades if t.get('pnl_usd', 0) < 0)
+    # Missing/null pnl_usd (open trades, legacy records) counts as 0, as the old Python loop did;
+    # raw $lt would sort null below every number and count it as a loss
+    pnl = {"$ifNull": ["$pnl_usd", 0]}
+    pipeline = [
+        {"$match": {"user_telegram_id": telegram_id}},
+        {"$group": {
+            "_id": None,
+            "total_pnl": {"$sum": pnl},
+            "total_trades": {"$sum": 1},
+            "winning": {"$sum": {"$cond": [{"$gt": [pnl, 0]}, 1, 0]}},
+            "losing": {"$sum": {"$cond": [{"$lt": [pnl, 0]}, 1, 0]}}
+        }}
+    ]
+    result = await get_telegram_db().trades.aggregate(pipeline).to_list(1)
+    summary = result[0] if result else {}
+    total_pnl = summary.get('total_pnl', 0)
+    total_trades = summary.get('total_trades', 0)
+    winning = summary.get('winning', 0)
+    losing = summary.get('losing', 0)
     
     return {
         "telegram_id": telegram_id,
@@ -3107,7 +3362,7 @@ async def get_leaderboard():
         {"$limit": 20}
     ]
     
-    leaderboard = await tg_db.trades.aggregate(pipeline).to_list(20)
+    leaderboard = await tg_db.trades.aggregate(pipeline, allowDiskUse=True).to_list(20)
     
     # Enrich with usernames
     results = []
@@ -3125,22 +3380,29 @@ async def get_leaderboard():
     return {"leaderboard": results}
 
 @api_router.get("/admin/dashboard")
+@ttl_cache(seconds=DASHBOARD_CACHE_TTL, private=True)
 async def get_admin_dashboard():
     """Get admin dashboard data"""
     tg_db = get_telegram_db()
-    
-    total_users = await tg_db.users.count_documents({})
-    total_wallets = await tg_db.wallets.count_documents({"is_active": True})
-    total_trades = await tg_db.trades.count_documents({})
-    pending_payments = await tg_db.payments.count_documents({"status": "PENDING_VERIFICATION"})
-    
-    trades = await tg_db.trades.find({}, {"_id": 0, "profit_usd": 1, "status": 1}).to_list(10000)
-    total_profit = sum(t.get('profit_usd', 0) for t in trades)
-    successful = sum(1 for t in trades if t.get('status') == 'COMPLETED')
-    
     today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-    today_trades = await tg_db.trades.count_documents({"created_at": {"$gte": today.isoformat()}})
-    today_signups = await tg_db.users.count_documents({"created_at": {"$gte": today.isoformat()}})
+    
+    # Trade totals and today's trade count come back from a single $facet round-trip
+    trade_facet, total_users, total_wallets, pending_payments, today_signups = await asyncio.gather(
+        tg_db.trades.aggregate([{"$facet": {
+            "totals": [TRADE_TOTALS_GROUP],
+            "today": [{"$match": {"created_at": {"$gte": today}}}, {"$count": "n"}]
+        }}], allowDiskUse=True).to_list(1),
+        tg_db.users.estimated_document_count(),
+        tg_db.wallets.count_documents({"is_active": True}),
+        tg_db.payments.count_documents({"status": "PENDING_VERIFICATION"}),
+        tg_db.users.count_documents({"created_at": {"$gte": today}})
+    )
+    facet = trade_facet[0] if trade_facet else {}
+    totals = facet.get("totals") or [{}]
+    total_trades = totals[0].get("count", 0)
+    total_profit = totals[0].get("total_profit", 0)
+    successful = totals[0].get("completed", 0)
+    today_trades = facet["today"][0]["n"] if facet.get("today") else 0
     
     return {
         "total_users": total_users,
@@ -3155,7 +3417,7 @@ async def get_admin_dashboard():
         "today_signups": today_signups,
         "live_trading_enabled": LIVE_TRADING_ENABLED,
         "auto_trade_enabled": AUTO_TRADE_ON_WHALE_SIGNAL,
-        "tracked_whales": len(WHALE_WALLETS)
+        "tracked_whales": TRACKED_WHALE_COUNT
     }
 
 @api_router.get("/faucets")
@@ -3171,7 +3433,7 @@ async def get_faucets():
 @api_router.get("/mining-sessions")
 async def get_mining_sessions():
     """Get all mining sessions"""
-    sessions = await get_telegram_db().mining_sessions.find({}, {"_id": 0}).sort("started_at", -1).to_list(100)
+    sessions = await get_telegram_db().mining_sessions.find({}, {"_id": 0}).sort("started_at", -1).limit(100).batch_size(100).to_list(100)
     return {"sessions": sessions}
 
 @api_router.get("/nft/trending/{chain}")
@@ -3195,9 +3457,13 @@ async def get_nft_trending(chain: str = "solana"):
     return {"collections": []}
 
 @api_router.get("/api-status")
+@ttl_cache(seconds=HEALTH_CACHE_TTL)
 async def get_api_status():
-    """Get status of all external APIs"""
-    solscan_result = await test_solscan_api()
+    """Get status of all external APIs (from the background health checker)"""
+    if not health_cache:
+        await refresh_health_cache()
+    solscan_result = health_cache["solscan"]
+    helius_result = health_cache["helius"]
     
     return {
         "apis": {
@@ -3208,7 +3474,8 @@ async def get_api_status():
                 "key_configured": bool(api_keys_config.get("solscan"))
             },
             "helius": {
-                "status": "ok",
+                "status": helius_result["status"],
+                "message": helius_result["message"],
                 "key_configured": bool(api_keys_config.get("helius"))
             }
         }
@@ -3225,6 +3492,25 @@ async def admin_test_api(service: str):
 # Include router
 app.include_router(api_router)
 
+# Probes: point liveness at /healthz (no DB or upstream calls) and readiness at /readyz
+@app.get("/healthz")
+async def healthz():
+    """Liveness probe - static body, never touches Mongo or external APIs"""
+    return Response(content=b'{"ok":true}', media_type="application/json")
+
+@app.get("/readyz")
+async def readyz():
+    """Readiness probe - 503 until the Helius RPC and whale monitor are initialized"""
+    components = {
+        "helius_rpc": helius_rpc is not None,
+        "whale_monitor": whale_monitor is not None
+    }
+    ready = all(components.values())
+    return ORJSONResponse(
+        {"ready": ready, "components": components},
+        status_code=200 if ready else 503
+    )
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -3234,87 +3520,262 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies (faucets, NFT collections, dashboards); tiny payloads go out as-is
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Telegram Bot Runner
-def run_telegram_bot():
-    """Run telegram bot in a separate thread"""
-    async def main():
-        global telegram_app
-        telegram_app = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
-        
-        # Add handlers - Original commands
-        telegram_app.add_handler(CommandHandler("start", start_command))
-        telegram_app.add_handler(CommandHandler("wallet", wallet_command))
-        telegram_app.add_handler(CommandHandler("newwallet", newwallet_command))
-        telegram_app.add_handler(CommandHandler("balance", balance_command))
-        telegram_app.add_handler(CommandHandler("setcredits", setcredits_command))
-        telegram_app.add_handler(CommandHandler("whales", whales_command))
-        telegram_app.add_handler(CommandHandler("pay", pay_command))
-        telegram_app.add_handler(CommandHandler("help", help_command))
-        telegram_app.add_handler(CommandHandler("trending", trending_command))
-        telegram_app.add_handler(CommandHandler("rugcheck", rugcheck_command))
-        telegram_app.add_handler(CommandHandler("trade", trade_command))
-        telegram_app.add_handler(CommandHandler("positions", positions_command))
-        telegram_app.add_handler(CommandHandler("autotrade", autotrade_command))
-        telegram_app.add_handler(CommandHandler("stopautotrade", stopautotrade_command))
-        telegram_app.add_handler(CommandHandler("stoploss", stoploss_command))
-        telegram_app.add_handler(CommandHandler("pnl", pnl_command))
-        telegram_app.add_handler(CommandHandler("trades", trades_command))
-        telegram_app.add_handler(CommandHandler("status", status_command))
-        telegram_app.add_handler(CommandHandler("addwallet", addwallet_command))
-        telegram_app.add_handler(CommandHandler("removewallet", removewallet_command))
-        
-        # New commands
-        telegram_app.add_handler(CommandHandler("quicktrade", quicktrade_command))
-        telegram_app.add_handler(CommandHandler("leaderboard", leaderboard_command))
-        telegram_app.add_handler(CommandHandler("myrank", myrank_command))
-        telegram_app.add_handler(CommandHandler("soldiers", soldiers_command))
-        telegram_app.add_handler(CommandHandler("missionstatus", missionstatus_command))
-        telegram_app.add_handler(CommandHandler("stopmission", stopmission_command))
-        telegram_app.add_handler(CommandHandler("mytrades", mytrades_command))
-        telegram_app.add_handler(CommandHandler("nft", nft_command))
-        telegram_app.add_handler(CommandHandler("nfttrending", nfttrending_command))
-        telegram_app.add_handler(CommandHandler("adminpanel", adminpanel_command))
-        telegram_app.add_handler(CommandHandler("allusers", allusers_command))
-        telegram_app.add_handler(CommandHandler("alltrades", alltrades_command))
-        telegram_app.add_handler(CommandHandler("broadcast", broadcast_command))
-        telegram_app.add_handler(CommandHandler("commands", commands_command))
-        telegram_app.add_handler(CommandHandler("credits", credits_command))
-        telegram_app.add_handler(CommandHandler("exportwallets", exportwallets_command))
-        telegram_app.add_handler(CommandHandler("settings", settings_command))
-        
-        # API management commands (admin)
-        telegram_app.add_handler(CommandHandler("apikeys", apikeys_command))
-        telegram_app.add_handler(CommandHandler("setapi", setapi_command))
-        telegram_app.add_handler(CommandHandler("testapi", testapi_command))
-        
-        # Callback handler
-        telegram_app.add_handler(CallbackQueryHandler(button_callback))
-        
-        logger.info("Starting Telegram bot...")
-        await telegram_app.initialize()
-        await telegram_app.start()
-        await telegram_app.updater.start_polling(drop_pending_updates=True)
-        
-        # Keep running
-        while True:
-            await asyncio.sleep(1)
-    
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(main())
+async def start_telegram_polling():
+    """Start the Telegram bot on the FastAPI event loop"""
+    global telegram_app, shared_bot
+    telegram_app = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .rate_limiter(AIORateLimiter(overall_max_rate=28, group_max_rate=18))
+        .concurrent_updates(TELEGRAM_CONCURRENT_UPDATES)
+        .build()
+    )
+    
+    # Add handlers - Original commands
+    telegram_app.add_handler(CommandHandler("start", start_command))
+    telegram_app.add_handler(CommandHandler("wallet", wallet_command))
+    telegram_app.add_handler(CommandHandler("newwallet", newwallet_command))
+    telegram_app.add_handler(CommandHandler("balance", balance_command))
+    telegram_app.add_handler(CommandHandler("setcredits", setcredits_command))
+    telegram_app.add_handler(CommandHandler("whales", whales_command))
+    telegram_app.add_handler(CommandHandler("pay", pay_command))
+    telegram_app.add_handler(CommandHandler("help", help_command))
+    telegram_app.add_handler(CommandHandler("trending", trending_command))
+    telegram_app.add_handler(CommandHandler("rugcheck", rugcheck_command))
+    telegram_app.add_handler(CommandHandler("trade", trade_command))
+    telegram_app.add_handler(CommandHandler("positions", positions_command))
+    telegram_app.add_handler(CommandHandler("autotrade", autotrade_command))
+    telegram_app.add_handler(CommandHandler("stopautotrade", stopautotrade_command))
+    telegram_app.add_handler(CommandHandler("stoploss", stoploss_command))
+    telegram_app.add_handler(CommandHandler("pnl", pnl_command))
+    telegram_app.add_handler(CommandHandler("trades", trades_command))
+    telegram_app.add_handler(CommandHandler("status", status_command))
+    telegram_app.add_handler(CommandHandler("addwallet", addwallet_command))
+    telegram_app.add_handler(CommandHandler("removewallet", removewallet_command))
+    
+    # New commands
+    telegram_app.add_handler(CommandHandler("quicktrade", quicktrade_command))
+    telegram_app.add_handler(CommandHandler("leaderboard", leaderboard_command))
+    telegram_app.add_handler(CommandHandler("myrank", myrank_command))
+    telegram_app.add_handler(CommandHandler("soldiers", soldiers_command))
+    telegram_app.add_handler(CommandHandler("missionstatus", missionstatus_command))
+    telegram_app.add_handler(CommandHandler("stopmission", stopmission_command))
+    telegram_app.add_handler(CommandHandler("mytrades", mytrades_command))
+    telegram_app.add_handler(CommandHandler("nft", nft_command))
+    telegram_app.add_handler(CommandHandler("nfttrending", nfttrending_command))
+    telegram_app.add_handler(CommandHandler("adminpanel", adminpanel_command))
+    telegram_app.add_handler(CommandHandler("allusers", allusers_command))
+    telegram_app.add_handler(CommandHandler("alltrades", alltrades_command))
+    telegram_app.add_handler(CommandHandler("broadcast", broadcast_command))
+    telegram_app.add_handler(CommandHandler("commands", commands_command))
+    telegram_app.add_handler(CommandHandler("credits", credits_command))
+    telegram_app.add_handler(CommandHandler("exportwallets", exportwallets_command))
+    telegram_app.add_handler(CommandHandler("settings", settings_command))
+    
+    # API management commands (admin)
+    telegram_app.add_handler(CommandHandler("apikeys", apikeys_command))
+    telegram_app.add_handler(CommandHandler("setapi", setapi_command))
+    telegram_app.add_handler(CommandHandler("testapi", testapi_command))
+    
+    # Callback handler
+    telegram_app.add_handler(CallbackQueryHandler(button_callback))
+    
+    logger.info("Starting Telegram bot...")
+    await telegram_app.initialize()
+    shared_bot = telegram_app.bot
+    shared_bot_ready.set()
+    await telegram_app.start()
+    await telegram_app.updater.start_polling(drop_pending_updates=True)
+    logger.info("✅ Telegram bot polling")
+
+async def run_telegram_bot():
+    """Start the bot; if it fails before the bot is published, release notify_worker so it drops batches"""
+    try:
+        await start_telegram_polling()
+    except Exception:
+        if shared_bot is None:
+            shared_bot_ready.set()
+        raise
+
+async def stop_telegram_bot():
+    """Stop polling, then stop and shut down the Telegram application"""
+    try:
+        if telegram_app.updater and telegram_app.updater.running:
+            await telegram_app.updater.stop()
+        if telegram_app.running:
+            await telegram_app.stop()
+        await drain_notify_queue()  # handlers have finished; send what they queued while the bot is still up
+        await telegram_app.shutdown()
+    except Exception as e:
+        logger.error(f"Error stopping Telegram bot: {e}")
 
 async def telegram_notify_user(telegram_id: int, message: str):
-    """Send notification to a user via Telegram"""
+    """Queue a notification to a user via Telegram"""
+    if notify_queue is None:
+        logger.warning(f"Notification queue not running, dropping notification for {telegram_id}")
+        return
     try:
-        bot = Bot(token=TELEGRAM_BOT_TOKEN)
-        await bot.send_message(
+        notify_queue.put_nowait((telegram_id, message))
+    except asyncio.QueueFull:
+        logger.warning(f"Notification queue full ({NOTIFY_QUEUE_MAX}), dropping notification for {telegram_id}")
+
+async def send_notification_batch(batch: List[tuple]):
+    """Send a batch of queued notifications concurrently"""
+    results = await asyncio.gather(*[
+        shared_bot.send_message(
             chat_id=telegram_id,
             text=message,
             parse_mode='Markdown',
             disable_web_page_preview=True
         )
+        for telegram_id, message in batch
+    ], return_exceptions=True)
+    for (telegram_id, _), result in zip(batch, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to notify user {telegram_id}: {result}")
+
+async def notify_worker():
+    """Drain the notification queue in batches; pacing is left to the bot's AIORateLimiter"""
+    while True:
+        batch = [await notify_queue.get()]
+        while len(batch) < NOTIFY_BATCH_SIZE and not notify_queue.empty():
+            batch.append(notify_queue.get_nowait())
+        
+        # The bot starts in its own task; hold the batch until it is published rather than drop it
+        await shared_bot_ready.wait()
+        if shared_bot is None:
+            logger.warning(f"Telegram bot failed to start, dropping {len(batch)} notifications")
+            continue
+        try:
+            await send_notification_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to send notification batch: {e}")
+
+async def drain_notify_queue():
+    """Send notifications still queued at shutdown (bounded by a timeout)"""
+    if notify_queue is None or shared_bot is None:
+        return
+    batch = []
+    while not notify_queue.empty():
+        batch.append(notify_queue.get_nowait())
+    if not batch:
+        return
+    try:
+        await asyncio.wait_for(send_notification_batch(batch), timeout=BACKGROUND_TASK_SHUTDOWN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(f"Dropped queued notifications after {BACKGROUND_TASK_SHUTDOWN_TIMEOUT}s at shutdown")
+
+TIMESTAMP_MIGRATION_ID = "timestamps_to_dates"  # db.migrations marker for migrate_timestamps_to_dates
+
+async def ensure_indexes():
+    """Create indexes backing the hot query predicates (idempotent)"""
+    index_specs = {
+        "trades": [
+            ([("user_telegram_id", 1), ("created_at", -1)], {}),
+            ([("status", 1)], {}),
+            ([("created_at", -1)], {}),
+        ],
+        "whale_activities": [
+            ([("detected_at", -1)], {}),
+        ],
+        "wallets": [
+            ([("user_telegram_id", 1), ("is_active", 1)], {}),
+            ([("public_key", 1)], {"unique": True}),
+        ],
+        "users": [
+            ([("telegram_id", 1)], {"unique": True}),
+            ([("username", 1)], {}),
+        ],
+        "payments": [
+            ([("status", 1), ("created_at", -1)], {}),
+        ],
+    }
+    specs = [(collection, keys, options) for collection, entries in index_specs.items() for keys, options in entries]
+    results = await asyncio.gather(
+        *[db[collection].create_index(keys, **options) for collection, keys, options in specs],
+        return_exceptions=True
+    )
+    for (collection, keys, _), result in zip(specs, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to create index {keys} on {collection}: {result}")
+
+async def migrate_timestamps_to_dates():
+    """One-shot migration of legacy ISO-string timestamps to BSON dates (recorded in db.migrations once done)"""
+    try:
+        if await db.migrations.find_one({"_id": TIMESTAMP_MIGRATION_ID}):
+            return
     except Exception as e:
-        logger.error(f"Failed to notify user {telegram_id}: {e}")
+        logger.error(f"Failed to read migration marker: {e}")
+        return
+    failed = False
+    timestamp_fields = {
+        "users": ["created_at"],
+        "wallets": ["created_at"],
+        "trades": ["created_at", "closed_at"],
+        "whale_activities": ["detected_at"],
+        "payments": ["created_at"],
+        "user_tracked_wallets": ["created_at"],
+    }
+    for collection, fields in timestamp_fields.items():
+        for field_name in fields:
+            try:
+                result = await db[collection].update_many(
+                    {field_name: {"$type": "string"}},
+                    [{"$set": {field_name: {"$convert": {
+                        "input": f"${field_name}",
+                        "to": "date",
+                        "onError": f"${field_name}"
+                    }}}}]
+                )
+                if result.modified_count:
+                    logger.info(f"Migrated {result.modified_count} {collection}.{field_name} values to dates")
+            except Exception as e:
+                failed = True
+                logger.error(f"Failed to migrate {collection}.{field_name}: {e}")
+    if not failed:
+        # Later boots skip the six-collection rescan; a partial run is retried next boot
+        await db.migrations.insert_one({"_id": TIMESTAMP_MIGRATION_ID, "completed_at": datetime.now(timezone.utc)})
+
+async def prepare_database():
+    """Ensure indexes and run migrations; a background task so startup never waits on MongoDB"""
+    await ensure_indexes()
+    await migrate_timestamps_to_dates()
+    logger.info("✅ MongoDB indexes ensured")
+
+def _log_task_exception(task: asyncio.Task):
+    """Done-callback: surface a crashed background task instead of losing its exception"""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        logger.error(f"Background task {task.get_name()} crashed: {exc!r}", exc_info=exc)
+
+def start_background_task(coro) -> asyncio.Task:
+    """Start a task tracked in background_tasks until it finishes"""
+    task = asyncio.create_task(coro, name=coro.__qualname__)
+    background_tasks.add(task)
+    task.add_done_callback(background_tasks.discard)
+    task.add_done_callback(_log_task_exception)
+    return task
+
+async def cancel_background_tasks():
+    """Cancel all background tasks and await them (bounded by a timeout)"""
+    tasks = list(background_tasks)
+    for task in tasks:
+        task.cancel()
+    if not tasks:
+        return
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*tasks, return_exceptions=True),
+            timeout=BACKGROUND_TASK_SHUTDOWN_TIMEOUT
+        )
+    except asyncio.TimeoutError:
+        logger.warning(f"Background tasks did not stop within {BACKGROUND_TASK_SHUTDOWN_TIMEOUT}s")
 
 async def start_whale_monitor():
     """Start whale monitoring in background using WebSocket"""
@@ -3322,18 +3783,21 @@ async def start_whale_monitor():
     if whale_monitor:
         await whale_monitor.start()
 
-@app.on_event("startup")
 async def startup_event():
     """Start telegram bot and trading components on app startup"""
-    global jupiter_dex, rug_detector, whale_monitor, auto_trader, trending_scanner, helius_rpc, whale_monitor_task
-    global soldiers_army, nft_aggregator
+    global jupiter_dex, rug_detector, whale_monitor, auto_trader, trending_scanner, helius_rpc, http_client
+    global soldiers_army, nft_aggregator, notify_queue, shared_bot_ready
     
     logger.info("=" * 50)
     logger.info("🎖️ SOLANA SOLDIER API STARTING 🎖️")
     logger.info("=" * 50)
-    
+
+    # Ensure MongoDB indexes (in the background: an unreachable Mongo must not hold up /healthz)
+    start_background_task(prepare_database())
+
     # Initialize Helius RPC
     helius_rpc = HeliusRPC(HELIUS_API_KEY)
+    http_client = httpx.AsyncClient(http2=True, limits=HTTP_POOL_LIMITS)
     logger.info(f"✅ Helius RPC initialized (API key: {HELIUS_API_KEY[:8]}...)")
     
     # Initialize trading components
@@ -3372,51 +3836,63 @@ async def startup_event():
     
     # Initialize Solana Soldiers (Faucet Mining)
     soldiers_army = SolanaSoldiersArmy(db=get_telegram_db(), telegram_notify=telegram_notify_user)
-    logger.info(f"✅ Solana Soldiers initialized ({len(CRYPTO_FAUCETS)} faucets)")
+    logger.info(f"✅ Solana Soldiers initialized ({FAUCET_COUNT} faucets)")
     
     # Initialize NFT Aggregator
     nft_aggregator = NFTAggregator()
     logger.info("✅ NFT Aggregator initialized")
     
+    # Start notification worker
+    notify_queue = asyncio.Queue(maxsize=NOTIFY_QUEUE_MAX)
+    shared_bot_ready = asyncio.Event()
+    start_background_task(notify_worker())
+    logger.info("✅ Notification worker started")
+    
+    # Start whale activity writer
+    start_background_task(whale_activity_flusher())
+    
+    # Start balance refresher
+    start_background_task(balance_refresh_loop())
+    
+    # Start upstream API health checker
+    start_background_task(health_checker_loop())
+    
     # Start whale monitor in background
-    whale_monitor_task = asyncio.create_task(start_whale_monitor())
-    logger.info(f"✅ Whale Monitor started (tracking {len(WHALE_WALLETS)} wallets)")
+    start_background_task(start_whale_monitor())
+    logger.info(f"✅ Whale Monitor started (tracking {TRACKED_WHALE_COUNT} wallets)")
     
-    # Start telegram bot in background thread
-    bot_thread = threading.Thread(target=run_telegram_bot, daemon=True)
-    bot_thread.start()
-    logger.info("✅ Telegram bot thread started")
+    # Start telegram bot on this event loop
+    start_background_task(run_telegram_bot())
+    logger.info("✅ Telegram bot starting")
     
     logger.info("=" * 50)
     logger.info("🚀 SOLANA SOLDIER READY FOR ACTION! 🚀")
     logger.info("=" * 50)
 
-@app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    global telegram_app, jupiter_dex, rug_detector, whale_monitor, trending_scanner, helius_rpc, whale_monitor_task
-    
     logger.info("Shutting down Solana Soldier...")
     
     # Stop whale monitor
     if whale_monitor:
         await whale_monitor.close()
     
-    if whale_monitor_task:
-        whale_monitor_task.cancel()
-    
-    # Close trading components
-    if jupiter_dex:
-        await jupiter_dex.close()
-    if rug_detector:
-        await rug_detector.close()
-    if trending_scanner:
-        await trending_scanner.close()
-    if helius_rpc:
-        await helius_rpc.close()
-    
+    # Stop the bot before closing the clients its in-flight handlers (/trade, /trending, /rugcheck) use
     if telegram_app:
-        await telegram_app.stop()
+        await stop_telegram_bot()
+    
+    # Cancel background tasks and wait for them to unwind
+    await cancel_background_tasks()
+    await flush_whale_activities()
+    
+    # Close trading components concurrently
+    components = [c for c in (jupiter_dex, rug_detector, trending_scanner, helius_rpc) if c]
+    results = await asyncio.gather(*[c.close() for c in components], return_exceptions=True)
+    for component, result in zip(components, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error closing {type(component).__name__}: {result}")
+    if http_client:
+        await http_client.aclose()
     
     client.close()
     logger.info("Shutdown complete")
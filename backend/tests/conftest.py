@@ -0,0 +1,178 @@
+"""
+Shared fixtures for the Solana Soldier backend tests
+"""
+import os
+import re
+from pathlib import Path
+import httpx
+import orjson
+import pytest
+import requests
+import responses
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from dotenv import load_dotenv
+
+# Pick up credentials (TELEGRAM_BOT_TOKEN, HELIUS_API_KEY) from backend/.env at collection time
+load_dotenv(Path(__file__).parent.parent / '.env')
+
+BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+
+
+def _build_urls(base_url):
+    """Full endpoint URLs, built once per run"""
+    return MappingProxyType({name: f"{base_url}/api/{path}" for name, path in [
+        ("system_status", "system-status"),
+        ("trading_stats", "trading-stats"),
+        ("stats", "stats"),
+        ("whales", "whales"),
+    ]})
+
+
+URLS = _build_urls(BASE_URL)
+
+# --offline: canned responses from tests/fixtures/<name>.json replace every network call
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+OFFLINE_BASE_URL = "http://offline.test"
+OFFLINE_ROUTES = {
+    ("GET", "/api/"): "health",
+    ("GET", "/api/system-status"): "system_status",
+    ("GET", "/api/trading-stats"): "trading_stats",
+    ("GET", "/api/stats"): "stats",
+    ("GET", "/api/whales"): "whales",
+    ("GET", "/api/whale-activities"): "whale_activities",
+    ("GET", "/api/sol-price"): "sol_price",
+    ("GET", "/api/trending-tokens"): "trending_tokens",
+    ("GET", "/api/pnl-stats"): "pnl_stats",
+    ("GET", "/api/users"): "users",
+    ("GET", "/api/trades"): "trades",
+    ("GET", "/api/payments"): "payments",
+    ("GET", "/api/leaderboard"): "leaderboard",
+    ("GET", "/api/admin/dashboard"): "admin_dashboard",
+    ("GET", "/api/faucets"): "faucets",
+    ("GET", "/api/mining-sessions"): "mining_sessions",
+    ("GET", "/api/nft/trending/solana"): "nft_solana",
+    ("GET", "/api/nft/trending/ethereum"): "nft_ethereum",
+    ("GET", "/api/api-status"): "api_status",
+    ("POST", "/api/admin/test-api/solscan"): "test_solscan",
+}
+OFFLINE_EXTERNAL_ROUTES = [
+    ("GET", re.compile(r"https://api\.telegram\.org/bot[^/]+/getMe"), "telegram_getMe"),
+    ("GET", re.compile(r"https://api\.telegram\.org/bot[^/]+/getMyCommands"), "telegram_getMyCommands"),
+    ("GET", re.compile(r"https://api\.helius\.xyz/v0/addresses/[^/]+/transactions"), "helius_transactions"),
+]
+
+
+def _load_fixture(name):
+    return orjson.loads((FIXTURES_DIR / f"{name}.json").read_bytes())
+
+# (connect, read): connect just over a TCP retransmit window, read bounded so a hung endpoint fails fast
+DEFAULT_TIMEOUT = (3.05, 10)
+
+
+class TimeoutSession(requests.Session):
+    """Session that applies DEFAULT_TIMEOUT unless a call passes its own"""
+    
+    def request(self, *args, **kwargs):
+        kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        return super().request(*args, **kwargs)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--offline",
+        action="store_true",
+        help="replay tests/fixtures/*.json instead of calling the backend, Telegram or Helius"
+    )
+
+
+def pytest_configure(config):
+    global BASE_URL, URLS
+    config.addinivalue_line(
+        "markers",
+        "integration: calls Telegram/Helius directly; needs real credentials (deselect with -m 'not integration')"
+    )
+    if config.getoption("--offline"):
+        # Runs before test modules are imported, so their module-level env reads see these values
+        os.environ["REACT_APP_BACKEND_URL"] = OFFLINE_BASE_URL
+        os.environ.setdefault("TELEGRAM_BOT_TOKEN", "offline:token")
+        os.environ.setdefault("HELIUS_API_KEY", "offline-key")
+        BASE_URL = OFFLINE_BASE_URL
+        URLS = _build_urls(BASE_URL)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def offline_api(request):
+    """Under --offline, serve every requests call from the JSON fixtures"""
+    if not request.config.getoption("--offline"):
+        yield None
+        return
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rm:
+        for (method, path), name in OFFLINE_ROUTES.items():
+            rm.add(method, f"{BASE_URL}{path}", json=_load_fixture(name))
+        for method, url_re, name in OFFLINE_EXTERNAL_ROUTES:
+            rm.add(method, url_re, json=_load_fixture(name))
+        yield rm
+
+
+@pytest.fixture(scope="session")
+def httpx_transport(request):
+    """Transport for httpx clients: the fixture-backed MockTransport under --offline, else the default"""
+    if not request.config.getoption("--offline"):
+        return None
+    routes = {key: _load_fixture(name) for key, name in OFFLINE_ROUTES.items()}
+    
+    def handler(req):
+        body = routes.get((req.method, req.url.path))
+        if body is None:
+            return httpx.Response(404, json={"detail": "Not Found"})
+        return httpx.Response(200, json=body)
+    
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(scope="session")
+def http():
+    """One keep-alive session for the whole run so tests reuse pooled connections"""
+    s = TimeoutSession()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s.headers["Connection"] = "keep-alive"
+    yield s
+    s.close()
+
+
+# Read-only endpoints fetched once per session and shared by every test that asserts on them
+@pytest.fixture(scope="session")
+def system_status_response(http):
+    return http.get(URLS["system_status"])
+
+
+@pytest.fixture(scope="session")
+def trading_stats_response(http):
+    return http.get(URLS["trading_stats"])
+
+
+@pytest.fixture(scope="session")
+def stats_response(http):
+    return http.get(URLS["stats"])
+
+
+@pytest.fixture(scope="session")
+def whales_response(http):
+    return http.get(URLS["whales"])
+
+
+@pytest.fixture(scope="session")
+def telegram_api(http):
+    """(pooled session, bot API base URL); skips when TELEGRAM_BOT_TOKEN is unset"""
+    token = os.environ.get("TELEGRAM_BOT_TOKEN")
+    if not token:
+        pytest.skip("TELEGRAM_BOT_TOKEN not set")
+    return http, f"https://api.telegram.org/bot{token}"
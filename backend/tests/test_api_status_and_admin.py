@@ -2,28 +2,47 @@
 Solana Soldier Bot - API Status and Admin Commands Tests
 Tests for Solscan/Helius API status and admin API management features
 """
+import logging
+import orjson
 import pytest
-import requests
 import os
+import re
+from types import MappingProxyType
+
+log = logging.getLogger(__name__)
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+HELIUS_API_KEY = os.environ.get('HELIUS_API_KEY', '')
+SOLANA_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+# Full endpoint URLs, built once at import
+URLS = MappingProxyType({name: f"{BASE_URL}/api/{path}" for name, path in [
+    ("api_status", "api-status"),
+    ("test_solscan", "admin/test-api/solscan"),
+]})
+
+
+def _json(response):
+    """Decode a response body straight from bytes with orjson"""
+    return orjson.loads(response.content)
+
 
 class TestAPIStatus:
     """Tests for /api/api-status endpoint - Solscan and Helius API status"""
     
-    def test_api_status_endpoint_exists(self):
+    def test_api_status_endpoint_exists(self, http):
         """Test /api/api-status endpoint returns 200"""
-        response = requests.get(f"{BASE_URL}/api/api-status")
+        response = http.get(URLS["api_status"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert "apis" in data
-        print(f"✅ API status endpoint exists and returns data")
+        log.debug("✅ API status endpoint exists and returns data")
     
-    def test_solscan_status_upgrade_required(self):
+    def test_solscan_status_upgrade_required(self, http):
         """Test Solscan API shows 'upgrade_required' status (free tier limitation)"""
-        response = requests.get(f"{BASE_URL}/api/api-status")
+        response = http.get(URLS["api_status"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         solscan = data["apis"]["solscan"]
         assert solscan["status"] == "upgrade_required"
@@ -31,92 +50,93 @@ class TestAPIStatus:
         assert "upgrade" in solscan["message"].lower() or "paid tier" in solscan["message"].lower()
         assert solscan["key_configured"] == True
         
-        print(f"✅ Solscan status correctly shows 'upgrade_required': {solscan['message']}")
+        log.debug("✅ Solscan status correctly shows 'upgrade_required': %s", solscan['message'])
     
-    def test_helius_status_ok(self):
+    def test_helius_status_ok(self, http):
         """Test Helius API shows 'ok' status (working as fallback)"""
-        response = requests.get(f"{BASE_URL}/api/api-status")
+        response = http.get(URLS["api_status"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         helius = data["apis"]["helius"]
         assert helius["status"] == "ok"
         assert helius["key_configured"] == True
         
-        print(f"✅ Helius status correctly shows 'ok' - working as fallback")
+        log.debug("✅ Helius status correctly shows 'ok' - working as fallback")
 
 
 class TestSystemStatus:
     """Tests for /api/system-status endpoint - Live trading status"""
     
-    def test_system_status_live_trading_enabled(self):
+    def test_system_status_live_trading_enabled(self, system_status_response):
         """Test /api/system-status shows live_trading_enabled=true"""
-        response = requests.get(f"{BASE_URL}/api/system-status")
+        response = system_status_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["status"] == "online"
         assert data["live_trading_enabled"] == True
         assert data["auto_trade_on_whale_signal"] == True
         
-        print(f"✅ System status: live_trading={data['live_trading_enabled']}, auto_trade={data['auto_trade_on_whale_signal']}")
+        log.debug("✅ System status: live_trading=%s, auto_trade=%s", data['live_trading_enabled'], data['auto_trade_on_whale_signal'])
     
-    def test_system_status_helius_connected(self):
+    def test_system_status_helius_connected(self, system_status_response):
         """Test Helius RPC is connected (used for fallback)"""
-        response = requests.get(f"{BASE_URL}/api/system-status")
+        response = system_status_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["helius_rpc_connected"] == True
         assert data["jupiter_dex_ready"] == True
         assert data["whale_monitor_active"] == True
         
-        print(f"✅ Helius RPC connected: {data['helius_rpc_connected']}")
+        log.debug("✅ Helius RPC connected: %s", data['helius_rpc_connected'])
     
-    def test_system_status_whale_tracking(self):
+    def test_system_status_whale_tracking(self, system_status_response):
         """Test whale tracking is active with 9 wallets"""
-        response = requests.get(f"{BASE_URL}/api/system-status")
+        response = system_status_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["tracked_whale_wallets"] == 9
         
-        print(f"✅ Tracked whale wallets: {data['tracked_whale_wallets']}")
+        log.debug("✅ Tracked whale wallets: %s", data['tracked_whale_wallets'])
 
 
 class TestAdminTestAPI:
     """Tests for admin API testing endpoint"""
     
-    def test_admin_test_solscan_api(self):
+    def test_admin_test_solscan_api(self, http):
         """Test /api/admin/test-api/solscan endpoint"""
-        response = requests.post(f"{BASE_URL}/api/admin/test-api/solscan")
+        response = http.post(URLS["test_solscan"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Should return upgrade_required since Solscan needs paid tier
         assert data["status"] in ["ok", "upgrade_required", "error"]
         assert "status_code" in data
         assert "message" in data
         
-        print(f"✅ Admin test API for Solscan: status={data['status']}, message={data['message']}")
+        log.debug("✅ Admin test API for Solscan: status=%s, message=%s", data['status'], data['message'])
 
 
 class TestHeliusFallback:
     """Tests to verify Helius is working as fallback for whale data"""
     
-    def test_helius_api_direct(self):
+    @pytest.mark.integration
+    @pytest.mark.skipif(not HELIUS_API_KEY, reason="HELIUS_API_KEY not set")
+    def test_helius_api_direct(self, http):
         """Test Helius API directly to verify it's working"""
-        helius_key = "5963c03a-3441-4c7a-816f-4a307b412439"
         test_wallet = "74YhGgHA3x1jcL2TchwChDbRVVXvzSxNbYM6ytCukauM"
         
-        response = requests.get(
+        response = http.get(
             f"https://api.helius.xyz/v0/addresses/{test_wallet}/transactions",
-            params={"api-key": helius_key, "limit": 5},
+            params={"api-key": HELIUS_API_KEY, "limit": 5},
             timeout=15
         )
         
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         assert isinstance(data, list)
         assert len(data) > 0  # Should have transaction data
         
@@ -126,54 +146,54 @@ class TestHeliusFallback:
             assert "signature" in tx
             assert "type" in tx
         
-        print(f"✅ Helius API working: returned {len(data)} transactions for whale wallet")
+        log.debug("✅ Helius API working: returned %s transactions for whale wallet", len(data))
     
-    def test_whales_endpoint_returns_data(self):
+    def test_whales_endpoint_returns_data(self, whales_response):
         """Test /api/whales returns whale wallet list"""
-        response = requests.get(f"{BASE_URL}/api/whales")
+        response = whales_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "whales" in data
         assert len(data["whales"]) == 9
         
-        # Verify first whale wallet format
-        first_whale = data["whales"][0]
-        assert len(first_whale) > 30  # Solana addresses are ~44 chars
+        # Verify every whale wallet is a base58 Solana address
+        bad = [w for w in data["whales"] if not SOLANA_ADDRESS_RE.fullmatch(w)]
+        assert not bad, f"invalid addresses: {bad}"
         
-        print(f"✅ Whales endpoint returns {len(data['whales'])} tracked wallets")
+        log.debug("✅ Whales endpoint returns %s tracked wallets", len(data['whales']))
 
 
+@pytest.mark.integration
+@pytest.mark.xdist_group("telegram")  # one worker, so parallel runs stay under Bot API rate limits
 class TestTelegramBotCommands:
     """Tests to verify Telegram bot is running and commands are registered"""
     
-    def test_telegram_bot_running(self):
+    def test_telegram_bot_running(self, telegram_api):
         """Test Telegram bot is running via getMe API"""
-        bot_token = "8553687931:AAFZ87vcHiVsbrRRhcgX3fFe0D9zos-2JLM"
-        
-        response = requests.get(f"https://api.telegram.org/bot{bot_token}/getMe")
+        http, bot_url = telegram_api
+        response = http.get(f"{bot_url}/getMe")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["ok"] == True
         assert "result" in data
         assert data["result"]["is_bot"] == True
         
-        print(f"✅ Telegram bot running: @{data['result']['username']}")
+        log.debug("✅ Telegram bot running: @%s", data['result']['username'])
     
-    def test_telegram_bot_commands_registered(self):
+    def test_telegram_bot_commands_registered(self, telegram_api):
         """Test that admin commands are registered with the bot"""
-        bot_token = "8553687931:AAFZ87vcHiVsbrRRhcgX3fFe0D9zos-2JLM"
-        
-        response = requests.get(f"https://api.telegram.org/bot{bot_token}/getMyCommands")
+        http, bot_url = telegram_api
+        response = http.get(f"{bot_url}/getMyCommands")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert data["ok"] == True
         # Commands may or may not be set via setMyCommands, but bot should respond
         
-        print(f"✅ Telegram bot commands API accessible")
+        log.debug("✅ Telegram bot commands API accessible")
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
+    pytest.main([__file__, "-v", "--tb=short", "-n", "auto", "--dist=loadgroup"])
@@ -0,0 +1,77 @@
+"""
+Solana Soldier Bot - API timestamp serialization tests
+Stored BSON dates round-tripped through an endpoint in-process; no MongoDB or network needed
+"""
+import logging
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import bson
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_database")
+
+import server  # noqa: E402
+
+log = logging.getLogger(__name__)
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args):
+        return self
+
+    def batch_size(self, *args):
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+
+class _Collection:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def find(self, *args, **kwargs):
+        return _Cursor(self.docs)
+
+
+class _Database:
+    def __init__(self, **collections):
+        for name, docs in collections.items():
+            setattr(self, name, _Collection(docs))
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """TestClient without lifespan: handlers run in-process against a fake database"""
+    def use_db(**collections):
+        monkeypatch.setattr(server, "get_telegram_db", lambda: _Database(**collections))
+        return TestClient(server.app)
+    return use_db
+
+
+class TestStoredTimestamps:
+    """BSON dates decoded with the app's client options serialize with a UTC offset"""
+
+    def test_trade_created_at_keeps_utc_offset(self, api):
+        # BSON stores UTC milliseconds; decode the way the app's Motor client will
+        stored = bson.encode({"id": "t1", "created_at": datetime(2026, 1, 1, 12, 0, 0)})
+        doc = bson.decode(stored, codec_options=server.client.codec_options)
+
+        response = api(trades=[doc]).get("/api/trades")
+
+        assert response.status_code == 200
+        created_at = response.json()["trades"][0]["created_at"]
+        assert created_at == "2026-01-01T12:00:00+00:00"
+        log.debug("✅ Stored timestamp serialized as %s", created_at)
@@ -2,226 +2,277 @@
 Solana Soldier Bot - Backend API Tests
 Tests all API endpoints for the Telegram-based Solana arbitrage trading bot
 """
+import asyncio
+import httpx
+import logging
+import orjson
 import pytest
-import requests
+from pydantic import BaseModel
 import os
+import re
+from types import MappingProxyType
+
+log = logging.getLogger(__name__)
 
 BASE_URL = os.environ.get('REACT_APP_BACKEND_URL', '').rstrip('/')
+SOLANA_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+# Full endpoint URLs, built once at import
+URLS = MappingProxyType({name: f"{BASE_URL}/api/{path}" for name, path in [
+    ("health", ""),
+    ("sol_price", "sol-price"),
+    ("pnl_stats", "pnl-stats"),
+    ("leaderboard", "leaderboard"),
+    ("admin_dashboard", "admin/dashboard"),
+    ("faucets", "faucets"),
+    ("nft_solana", "nft/trending/solana"),
+    ("nft_ethereum", "nft/trending/ethereum"),
+    ("whale_activities", "whale-activities"),
+    ("trending_tokens", "trending-tokens"),
+    ("users", "users"),
+    ("trades", "trades"),
+    ("payments", "payments"),
+    ("mining_sessions", "mining-sessions"),
+]})
+
+
+def _json(response):
+    """Decode a response body straight from bytes with orjson"""
+    return orjson.loads(response.content)
+
+
+# Response shapes: one model_validate_json pass decodes and checks every required field
+class TradingStats(BaseModel):
+    total_trades: int
+    trades_today: int
+    total_profit_usd: float
+    success_rate: float
+    live_trading_enabled: bool
+    auto_trade_enabled: bool
+    tracked_whales: int
+
+
+class Stats(BaseModel):
+    total_users: int
+    active_wallets: int
+    total_trades: int
+    total_profit_usd: float
+    whale_activities_today: int
+
+
+class PnLStats(BaseModel):
+    total_pnl_usd: float
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate: float
+    active_positions: int
+
 
 class TestHealthAndStatus:
     """Health check and system status endpoint tests"""
     
-    def test_api_health_check(self):
+    def test_api_health_check(self, http):
         """Test /api/ returns online status"""
-        response = requests.get(f"{BASE_URL}/api/")
+        response = http.get(URLS["health"])
         assert response.status_code == 200
-        data = response.json()
-        assert data.get("status") == "online"
+        data = _json(response)
+        assert data["status"] == "online"
         assert "message" in data
-        print(f"✅ API health check passed: {data}")
+        log.debug("✅ API health check passed: %s", data)
     
-    def test_system_status_endpoint(self):
+    def test_system_status_endpoint(self, system_status_response):
         """Test /api/system-status returns correct trading configuration"""
-        response = requests.get(f"{BASE_URL}/api/system-status")
+        response = system_status_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Verify live trading is enabled
-        assert data.get("live_trading_enabled") == True
-        assert data.get("auto_trade_on_whale_signal") == True
+        assert data["live_trading_enabled"] == True
+        assert data["auto_trade_on_whale_signal"] == True
         
         # Verify trading parameters
-        assert data.get("min_profit_target_usd") == 2.0
-        assert data.get("max_trade_time_seconds") == 120
-        assert data.get("min_trade_sol") == 0.02
-        assert data.get("max_trade_sol") == 0.5
+        assert data["min_profit_target_usd"] == pytest.approx(2.0)
+        assert data["max_trade_time_seconds"] == 120
+        assert data["min_trade_sol"] == pytest.approx(0.02)
+        assert data["max_trade_sol"] == pytest.approx(0.5)
         
         # Verify connections
-        assert data.get("helius_rpc_connected") == True
-        assert data.get("jupiter_dex_ready") == True
-        assert data.get("whale_monitor_active") == True
+        assert data["helius_rpc_connected"] == True
+        assert data["jupiter_dex_ready"] == True
+        assert data["whale_monitor_active"] == True
         
         # Verify whale tracking
-        assert data.get("tracked_whale_wallets") == 9
+        assert data["tracked_whale_wallets"] == 9
         
-        print(f"✅ System status passed: live_trading={data.get('live_trading_enabled')}, whales={data.get('tracked_whale_wallets')}")
+        log.debug("✅ System status passed: live_trading=%s, whales=%s", data.get('live_trading_enabled'), data.get('tracked_whale_wallets'))
 
 
 class TestTradingStats:
     """Trading statistics endpoint tests"""
     
-    def test_trading_stats_endpoint(self):
+    def test_trading_stats_endpoint(self, trading_stats_response):
         """Test /api/trading-stats returns trading statistics"""
-        response = requests.get(f"{BASE_URL}/api/trading-stats")
+        response = trading_stats_response
         assert response.status_code == 200
-        data = response.json()
-        
-        # Verify required fields exist
-        assert "total_trades" in data
-        assert "trades_today" in data
-        assert "total_profit_usd" in data
-        assert "success_rate" in data
-        assert "live_trading_enabled" in data
-        assert "auto_trade_enabled" in data
-        assert "tracked_whales" in data
+        data = TradingStats.model_validate_json(response.content)
         
         # Verify live trading is enabled
-        assert data.get("live_trading_enabled") == True
-        assert data.get("auto_trade_enabled") == True
-        assert data.get("tracked_whales") == 9
+        assert data.live_trading_enabled == True
+        assert data.auto_trade_enabled == True
+        assert data.tracked_whales == 9
         
-        print(f"✅ Trading stats passed: trades={data.get('total_trades')}, profit=${data.get('total_profit_usd')}")
+        log.debug("✅ Trading stats passed: trades=%s, profit=$%s", data.total_trades, data.total_profit_usd)
     
-    def test_stats_endpoint(self):
+    def test_stats_endpoint(self, stats_response):
         """Test /api/stats returns user statistics"""
-        response = requests.get(f"{BASE_URL}/api/stats")
+        response = stats_response
         assert response.status_code == 200
-        data = response.json()
-        
-        # Verify required fields
-        assert "total_users" in data
-        assert "active_wallets" in data
-        assert "total_trades" in data
-        assert "total_profit_usd" in data
-        assert "whale_activities_today" in data
+        data = Stats.model_validate_json(response.content)
         
-        print(f"✅ Stats passed: users={data.get('total_users')}, wallets={data.get('active_wallets')}")
+        log.debug("✅ Stats passed: users=%s, wallets=%s", data.total_users, data.active_wallets)
 
 
 class TestWhaleTracking:
     """Whale tracking endpoint tests"""
     
-    def test_whales_endpoint(self):
+    def test_whales_endpoint(self, whales_response):
         """Test /api/whales returns tracked whale wallets"""
-        response = requests.get(f"{BASE_URL}/api/whales")
+        response = whales_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "whales" in data
         whales = data.get("whales", [])
         assert len(whales) == 9  # 9 whale wallets configured
         
-        # Verify wallet addresses are valid Solana addresses (32-50 chars)
-        for wallet in whales:
-            assert len(wallet) >= 32 and len(wallet) <= 50
+        # Verify wallet addresses are valid base58 Solana addresses
+        bad = [w for w in whales if not SOLANA_ADDRESS_RE.fullmatch(w)]
+        assert not bad, f"invalid addresses: {bad}"
         
-        print(f"✅ Whales endpoint passed: {len(whales)} whale wallets tracked")
-    
-    def test_whale_activities_endpoint(self):
-        """Test /api/whale-activities returns whale activity list"""
-        response = requests.get(f"{BASE_URL}/api/whale-activities")
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "activities" in data
-        # Activities may be empty if no whale activity detected yet
-        print(f"✅ Whale activities passed: {len(data.get('activities', []))} activities")
+        log.debug("✅ Whales endpoint passed: %s whale wallets tracked", len(whales))
 
 
 class TestPriceAndTokens:
     """Price and token endpoint tests"""
     
-    def test_sol_price_endpoint(self):
+    def test_sol_price_endpoint(self, http):
         """Test /api/sol-price returns SOL price"""
-        response = requests.get(f"{BASE_URL}/api/sol-price")
+        response = http.get(URLS["sol_price"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "price_usd" in data
         price = data.get("price_usd")
         assert price > 0  # SOL price should be positive
         
-        print(f"✅ SOL price passed: ${price}")
-    
-    def test_trending_tokens_endpoint(self):
-        """Test /api/trending-tokens returns trending tokens"""
-        response = requests.get(f"{BASE_URL}/api/trending-tokens")
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "tokens" in data
-        # Tokens list may vary based on market conditions
-        print(f"✅ Trending tokens passed: {len(data.get('tokens', []))} tokens")
+        log.debug("✅ SOL price passed: $%s", price)
 
 
 class TestPnLAndPositions:
     """P&L and positions endpoint tests"""
     
-    def test_pnl_stats_endpoint(self):
+    def test_pnl_stats_endpoint(self, http):
         """Test /api/pnl-stats returns P&L statistics"""
-        response = requests.get(f"{BASE_URL}/api/pnl-stats")
+        response = http.get(URLS["pnl_stats"])
         assert response.status_code == 200
-        data = response.json()
-        
-        # Verify required P&L fields
-        assert "total_pnl_usd" in data
-        assert "total_trades" in data
-        assert "winning_trades" in data
-        assert "losing_trades" in data
-        assert "win_rate" in data
-        assert "active_positions" in data
+        data = PnLStats.model_validate_json(response.content)
         
-        print(f"✅ P&L stats passed: total_pnl=${data.get('total_pnl_usd')}, win_rate={data.get('win_rate')}%")
+        log.debug("✅ P&L stats passed: total_pnl=$%s, win_rate=%s%%", data.total_pnl_usd, data.win_rate)
 
 
-class TestUserAndWalletEndpoints:
-    """User and wallet endpoint tests"""
+class TestListEndpoints:
+    """List endpoints that return a single collection key"""
     
-    def test_users_endpoint(self):
-        """Test /api/users returns user list"""
-        response = requests.get(f"{BASE_URL}/api/users")
+    @pytest.mark.parametrize("name,key", [
+        ("whale_activities", "activities"),
+        ("trending_tokens", "tokens"),
+        ("users", "users"),
+        ("trades", "trades"),
+        ("payments", "payments"),
+        ("mining_sessions", "sessions"),
+    ], ids=["whale_activities", "trending_tokens", "users", "trades", "payments", "mining_sessions"])
+    def test_list_endpoint(self, http, name, key):
+        """Test list endpoint returns 200 with its collection key (may be empty)"""
+        response = http.get(URLS[name])
         assert response.status_code == 200
-        data = response.json()
-        
-        assert "users" in data
-        print(f"✅ Users endpoint passed: {len(data.get('users', []))} users")
+        data = _json(response)
+        assert key in data
+        log.debug("✅ %s passed: %s %s", name, len(data.get(key, [])), key)
+
+
+class TestConcurrentSmoke:
+    """Every read endpoint fired at once over one multiplexed HTTP/2 connection"""
     
-    def test_trades_endpoint(self):
-        """Test /api/trades returns trade list"""
-        response = requests.get(f"{BASE_URL}/api/trades")
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "trades" in data
-        print(f"✅ Trades endpoint passed: {len(data.get('trades', []))} trades")
+    SMOKE_CHECKS = {
+        "/api/": "status",
+        "/api/system-status": "live_trading_enabled",
+        "/api/trading-stats": "total_trades",
+        "/api/stats": "total_users",
+        "/api/whales": "whales",
+        "/api/whale-activities": "activities",
+        "/api/sol-price": "price_usd",
+        "/api/trending-tokens": "tokens",
+        "/api/pnl-stats": "total_pnl_usd",
+        "/api/users": "users",
+        "/api/trades": "trades",
+        "/api/payments": "payments",
+        "/api/leaderboard": "leaderboard",
+        "/api/admin/dashboard": "total_users",
+        "/api/faucets": "faucets",
+        "/api/mining-sessions": "sessions",
+    }
     
-    def test_payments_endpoint(self):
-        """Test /api/payments returns payment list"""
-        response = requests.get(f"{BASE_URL}/api/payments")
-        assert response.status_code == 200
-        data = response.json()
-        
-        assert "payments" in data
-        print(f"✅ Payments endpoint passed: {len(data.get('payments', []))} payments")
+    def test_all_endpoints_concurrently(self, httpx_transport):
+        """Test all read endpoints respond when hit concurrently (wall time ~ slowest endpoint)"""
+        async def fetch_all():
+            async with httpx.AsyncClient(
+                base_url=BASE_URL,
+                http2=True,
+                timeout=30,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                transport=httpx_transport
+            ) as client:
+                return await asyncio.gather(*(client.get(path) for path in self.SMOKE_CHECKS))
+        
+        responses = asyncio.run(fetch_all())
+        
+        for (path, key), response in zip(self.SMOKE_CHECKS.items(), responses):
+            assert response.status_code == 200, f"{path} returned {response.status_code}"
+            assert key in _json(response), f"{path} missing '{key}'"
+        
+        log.debug("✅ Concurrent smoke passed: %s endpoints", len(responses))
 
 
+@pytest.mark.integration
+@pytest.mark.xdist_group("telegram")  # one worker, so parallel runs stay under Bot API rate limits
 class TestTelegramBot:
     """Telegram bot API tests"""
     
-    def test_telegram_bot_getme(self):
+    def test_telegram_bot_getme(self, telegram_api):
         """Test Telegram bot responds to getMe API call"""
-        bot_token = "8553687931:AAFZ87vcHiVsbrRRhcgX3fFe0D9zos-2JLM"
-        response = requests.get(f"https://api.telegram.org/bot{bot_token}/getMe")
+        http, bot_url = telegram_api
+        response = http.get(f"{bot_url}/getMe")
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
-        assert data.get("ok") == True
+        assert data["ok"] == True
         result = data.get("result", {})
         assert result.get("is_bot") == True
         assert result.get("username") == "Cfsolanasoldier_bot"
         assert result.get("first_name") == "SOLANA SOLDIER MEV BOT"
         
-        print(f"✅ Telegram bot getMe passed: @{result.get('username')}")
+        log.debug("✅ Telegram bot getMe passed: @%s", result.get('username'))
 
 
 class TestLeaderboard:
     """Leaderboard endpoint tests - NEW FEATURE"""
     
-    def test_leaderboard_endpoint(self):
+    def test_leaderboard_endpoint(self, http):
         """Test /api/leaderboard returns leaderboard data"""
-        response = requests.get(f"{BASE_URL}/api/leaderboard")
+        response = http.get(URLS["leaderboard"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "leaderboard" in data
         leaderboard = data.get("leaderboard", [])
@@ -237,17 +288,17 @@ class TestLeaderboard:
                 assert "successful_trades" in entry
                 assert "win_rate" in entry
         
-        print(f"✅ Leaderboard endpoint passed: {len(leaderboard)} traders on leaderboard")
+        log.debug("✅ Leaderboard endpoint passed: %s traders on leaderboard", len(leaderboard))
 
 
 class TestAdminDashboard:
     """Admin dashboard endpoint tests - NEW FEATURE"""
     
-    def test_admin_dashboard_endpoint(self):
+    def test_admin_dashboard_endpoint(self, http):
         """Test /api/admin/dashboard returns admin stats"""
-        response = requests.get(f"{BASE_URL}/api/admin/dashboard")
+        response = http.get(URLS["admin_dashboard"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Verify required admin dashboard fields
         assert "total_users" in data
@@ -265,21 +316,21 @@ class TestAdminDashboard:
         assert "tracked_whales" in data
         
         # Verify live trading is enabled
-        assert data.get("live_trading_enabled") == True
-        assert data.get("auto_trade_enabled") == True
-        assert data.get("tracked_whales") == 9
+        assert data["live_trading_enabled"] == True
+        assert data["auto_trade_enabled"] == True
+        assert data["tracked_whales"] == 9
         
-        print(f"✅ Admin dashboard passed: users={data.get('total_users')}, trades={data.get('total_trades')}, profit=${data.get('total_profit_usd')}")
+        log.debug("✅ Admin dashboard passed: users=%s, trades=%s, profit=$%s", data.get('total_users'), data.get('total_trades'), data.get('total_profit_usd'))
 
 
 class TestFaucetMining:
     """Faucet mining endpoint tests - NEW FEATURE (Solana Soldiers)"""
     
-    def test_faucets_endpoint(self):
+    def test_faucets_endpoint(self, http):
         """Test /api/faucets returns 48+ faucets"""
-        response = requests.get(f"{BASE_URL}/api/faucets")
+        response = http.get(URLS["faucets"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "faucets" in data
         assert "stats" in data
@@ -304,28 +355,19 @@ class TestFaucetMining:
         assert "total_faucets" in stats
         assert "mainnet_faucets" in stats
         assert "testnet_faucets" in stats
-        assert stats.get("total_faucets") >= 48
-        
-        print(f"✅ Faucets endpoint passed: {len(faucets)} faucets available, mainnet={stats.get('mainnet_faucets')}, testnet={stats.get('testnet_faucets')}")
-    
-    def test_mining_sessions_endpoint(self):
-        """Test /api/mining-sessions returns mining session list"""
-        response = requests.get(f"{BASE_URL}/api/mining-sessions")
-        assert response.status_code == 200
-        data = response.json()
+        assert stats["total_faucets"] >= 48
         
-        assert "sessions" in data
-        print(f"✅ Mining sessions endpoint passed: {len(data.get('sessions', []))} sessions")
+        log.debug("✅ Faucets endpoint passed: %s faucets available, mainnet=%s, testnet=%s", len(faucets), stats.get('mainnet_faucets'), stats.get('testnet_faucets'))
 
 
 class TestNFTAggregator:
     """NFT aggregator endpoint tests - NEW FEATURE"""
     
-    def test_nft_trending_solana(self):
+    def test_nft_trending_solana(self, http):
         """Test /api/nft/trending/solana returns NFT collections"""
-        response = requests.get(f"{BASE_URL}/api/nft/trending/solana")
+        response = http.get(URLS["nft_solana"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "collections" in data
         collections = data.get("collections", [])
@@ -347,13 +389,13 @@ class TestNFTAggregator:
             # Verify chain is solana
             assert collection.get("chain") == "solana"
         
-        print(f"✅ NFT trending Solana passed: {len(collections)} collections")
+        log.debug("✅ NFT trending Solana passed: %s collections", len(collections))
     
-    def test_nft_trending_ethereum(self):
+    def test_nft_trending_ethereum(self, http):
         """Test /api/nft/trending/ethereum returns NFT collections"""
-        response = requests.get(f"{BASE_URL}/api/nft/trending/ethereum")
+        response = http.get(URLS["nft_ethereum"])
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         assert "collections" in data
         collections = data.get("collections", [])
@@ -364,17 +406,17 @@ class TestNFTAggregator:
             collection = collections[0]
             assert collection.get("chain") == "ethereum"
         
-        print(f"✅ NFT trending Ethereum passed: {len(collections)} collections")
+        log.debug("✅ NFT trending Ethereum passed: %s collections", len(collections))
 
 
 class TestQuickTradeAmounts:
     """Quick trade amount configuration tests - NEW FEATURE"""
     
-    def test_system_status_trade_amounts(self):
+    def test_system_status_trade_amounts(self, system_status_response):
         """Test /api/system-status shows trade amount configuration"""
-        response = requests.get(f"{BASE_URL}/api/system-status")
+        response = system_status_response
         assert response.status_code == 200
-        data = response.json()
+        data = _json(response)
         
         # Verify trade amount bounds
         min_trade = data.get("min_trade_sol")
@@ -388,8 +430,8 @@ class TestQuickTradeAmounts:
         # Quick trade supports $2-$500 per trade
         # At ~$200 SOL price, $2 = 0.01 SOL, $500 = 2.5 SOL
         # Current config: min=0.02, max=0.5 SOL
-        print(f"✅ Trade amounts passed: min={min_trade} SOL, max={max_trade} SOL")
+        log.debug("✅ Trade amounts passed: min=%s SOL, max=%s SOL", min_trade, max_trade)
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v", "--tb=short"])
+    pytest.main([__file__, "-v", "--tb=short", "-n", "auto", "--dist=loadgroup"])
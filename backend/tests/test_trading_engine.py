@@ -0,0 +1,357 @@
+"""
+Solana Soldier Bot - Trading engine tests
+Batched RPC paths exercised against httpx.MockTransport; no network or credentials needed
+"""
+import asyncio
+import base64
+import httpx
+import logging
+import orjson
+import sys
+import websockets
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import trading_engine as te  # noqa: E402
+
+log = logging.getLogger(__name__)
+
+
+def _rpc_reply(body):
+    return httpx.Response(200, content=orjson.dumps(body))
+
+
+def _helius(handler):
+    """HeliusRPC whose RPC traffic (direct and batched) goes to handler"""
+    helius = te.HeliusRPC("test-key")
+    helius.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    helius._batcher.client = helius.client
+    return helius
+
+
+def _mint_account(mint_authority, freeze_authority=None):
+    return {"data": {"parsed": {"info": {"mintAuthority": mint_authority, "freezeAuthority": freeze_authority}}}}
+
+
+class TestRpcBatcher:
+    """Concurrent HeliusRPC reads coalesce into one JSON-RPC batch POST"""
+
+    def test_concurrent_reads_share_one_post(self):
+        posts = []
+
+        def rpc(request):
+            body = orjson.loads(request.content)
+            posts.append(body)
+            return _rpc_reply([
+                {"jsonrpc": "2.0", "id": item["id"], "result": {"value": (item["id"] + 1) * te.LAMPORTS_PER_SOL}}
+                for item in reversed(body)
+            ])
+
+        async def run():
+            helius = _helius(rpc)
+            return await asyncio.gather(*(helius.get_balance(f"Wallet{i}") for i in range(3)))
+
+        assert asyncio.run(run()) == [1.0, 2.0, 3.0]
+        assert len(posts) == 1 and [item["params"][0] for item in posts[0]] == ["Wallet0", "Wallet1", "Wallet2"]
+
+    def test_whole_batch_error_reaches_every_caller(self):
+        def rpc(request):
+            return _rpc_reply({"jsonrpc": "2.0", "id": None, "error": {"code": 429, "message": "Too many requests"}})
+
+        async def run():
+            helius = _helius(rpc)
+            return await asyncio.gather(*(helius._batcher.call("getBalance", [f"Wallet{i}"]) for i in range(3)))
+
+        for reply in asyncio.run(run()):
+            assert reply["error"]["message"] == "Too many requests"
+
+
+    def test_close_waits_for_queued_and_inflight_batches(self):
+        async def rpc(request):
+            await asyncio.sleep(0.05)
+            body = orjson.loads(request.content)
+            items = body if isinstance(body, list) else [body]
+            replies = [{"jsonrpc": "2.0", "id": item["id"], "result": {"value": te.LAMPORTS_PER_SOL}} for item in items]
+            return _rpc_reply(replies if isinstance(body, list) else replies[0])
+
+        async def run():
+            helius = _helius(rpc)
+            calls = [asyncio.create_task(helius.get_balance(f"Wallet{i}")) for i in range(3)]
+            await asyncio.sleep(0)  # queued, batch window still open
+            await helius.close()
+            return await asyncio.gather(*calls)
+
+        assert asyncio.run(run()) == [1.0, 1.0, 1.0]
+
+
+class TestRugDetectorBatch:
+    """check_tokens: one getMultipleAccounts batch, re-keyed by id, per-token fallback for failed chunks"""
+
+    def test_check_tokens_rekeys_by_id_and_falls_back(self):
+        mints = [f"Mint{i:03d}" for i in range(150)]  # two chunks: 100 + 50
+        single_calls = []
+
+        def rpc(request):
+            body = orjson.loads(request.content)
+            if isinstance(body, list):
+                replies = []
+                for item in body:
+                    if item["id"] == 0:
+                        accounts = [_mint_account("Auth" if i % 2 else None) for i in range(len(item["params"][0]))]
+                        replies.append({"jsonrpc": "2.0", "id": 0, "result": {"value": accounts}})
+                    else:
+                        replies.append({"jsonrpc": "2.0", "id": item["id"], "error": {"code": 429, "message": "rate"}})
+                return _rpc_reply(replies[::-1])  # out of order on purpose
+            single_calls.append(body["params"][0])
+            return _rpc_reply({"jsonrpc": "2.0", "id": 1, "result": {"value": _mint_account(None, "Freezer")}})
+
+        def dexscreener(request):
+            return _rpc_reply({"pairs": [{"baseToken": {"symbol": "T"}, "liquidity": {"usd": 50_000}, "priceUsd": "1"}]})
+
+        async def run():
+            detector = te.RugDetector(helius_rpc=_helius(rpc))
+            detector.client = httpx.AsyncClient(transport=httpx.MockTransport(dexscreener))
+            return await detector.check_tokens(mints)
+
+        results = asyncio.run(run())
+
+        assert list(results) == mints
+        for i in range(100):
+            assert results[mints[i]].details["authorities"] == {"mint_authority": bool(i % 2), "freeze_authority": False}
+        # The rate-limited chunk is looked up token by token
+        assert sorted(single_calls) == mints[100:]
+        for mint in mints[100:]:
+            assert results[mint].details["authorities"] == {"mint_authority": False, "freeze_authority": True}
+        log.debug("✅ check_tokens batch passed: %s tokens, %s fallbacks", len(results), len(single_calls))
+
+
+class TestJupiterSwapBatch:
+    """execute_swaps_batch: parallel prepare, one sendTransaction batch, results in input order"""
+
+    @staticmethod
+    def _jupiter(rpc):
+        jupiter = te.JupiterDEX(helius_rpc=_helius(rpc))
+
+        async def prepare(keypair, input_mint, output_mint, amount_lamports, **kwargs):
+            if output_mint == "QuoteFails":
+                return None, 0, "Failed to get quote"
+            if output_mint == "Raises":
+                raise RuntimeError("signing blew up")
+            return f"tx-{output_mint}".encode(), 1_000, None
+
+        async def confirm(signature, timeout=60):
+            if signature == "sig-ConfirmRaises":
+                raise httpx.ConnectError("network blip")
+            return signature != "sig-Unconfirmed"
+
+        jupiter._prepare_swap = prepare
+        jupiter.helius.confirm_transaction = confirm
+        return jupiter
+
+    @staticmethod
+    def _swaps(*output_mints):
+        return [
+            {"keypair": None, "input_mint": te.WSOL_MINT, "output_mint": mint, "amount_lamports": 10_000_000}
+            for mint in output_mints
+        ]
+
+    def test_results_keep_order_with_per_swap_failures(self):
+        sent = []
+
+        def rpc(request):
+            body = orjson.loads(request.content)
+            replies = []
+            for item in body:
+                mint = base64.b64decode(item["params"][0]).decode()[len("tx-"):]
+                sent.append(mint)
+                if mint == "SendFails":
+                    replies.append({"jsonrpc": "2.0", "id": item["id"], "error": {"message": "Blockhash not found"}})
+                else:
+                    replies.append({"jsonrpc": "2.0", "id": item["id"], "result": f"sig-{mint}"})
+            return _rpc_reply(replies[::-1])
+
+        swaps = self._swaps("TokA", "QuoteFails", "SendFails", "Raises", "Unconfirmed", "TokB")
+        results = asyncio.run(self._jupiter(rpc).execute_swaps_batch(swaps))
+
+        assert sent == ["TokA", "SendFails", "Unconfirmed", "TokB"]  # one batch, prepared swaps only
+        assert [r.success for r in results] == [True, False, False, False, False, True]
+        assert results[0].signature == "sig-TokA" and results[0].token_address == "TokA"
+        assert results[5].signature == "sig-TokB" and results[5].amount_tokens == 1_000
+        assert results[1].error == "Failed to get quote"
+        assert results[2].error == "Blockhash not found"
+        assert results[3].error == "signing blew up"
+        assert results[4].signature == "sig-Unconfirmed" and "not confirmed" in results[4].error
+        assert len({r.trade_id for r in results}) == len(results)
+
+    def test_confirm_error_fails_only_its_swap(self):
+        def rpc(request):
+            body = orjson.loads(request.content)
+            return _rpc_reply([
+                {"jsonrpc": "2.0", "id": item["id"], "result": "sig-" + base64.b64decode(item["params"][0]).decode()[len("tx-"):]}
+                for item in body
+            ])
+
+        swaps = self._swaps("TokA", "ConfirmRaises", "TokB")
+        results = asyncio.run(self._jupiter(rpc).execute_swaps_batch(swaps))
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].signature == "sig-ConfirmRaises" and results[1].error == "network blip"
+        assert len({r.trade_id for r in results}) == len(results)
+
+    def test_single_error_reply_fails_every_sent_swap(self):
+        def rpc(request):
+            return _rpc_reply({"jsonrpc": "2.0", "id": None, "error": {"code": 429, "message": "Too many requests"}})
+
+        swaps = self._swaps("TokA", "QuoteFails", "TokB")
+        results = asyncio.run(self._jupiter(rpc).execute_swaps_batch(swaps))
+
+        assert [r.success for r in results] == [False, False, False]
+        assert [r.error for r in results] == ["Too many requests", "Failed to get quote", "Too many requests"]
+
+
+class TestDexScreenerBatch:
+    """get_pairs_batch: 30 addresses per /tokens call, most liquid Solana pair per address, failed chunks skipped"""
+
+    def test_splits_dedupes_and_keeps_most_liquid_pair(self):
+        addresses = [f"Tok{i:02d}" for i in range(65)]  # three chunks: 30 + 30 + 5
+        requested = []
+
+        def pair(address, liquidity, chain="solana", dex="raydium"):
+            return {
+                "chainId": chain, "dexId": dex, "priceUsd": "1.5",
+                "baseToken": {"address": address, "symbol": address.upper(), "name": address},
+                "liquidity": {"usd": liquidity}
+            }
+
+        def dexscreener(request):
+            chunk = request.url.path.rsplit("/", 1)[-1].split(",")
+            requested.append(chunk)
+            if "Tok60" in chunk:
+                raise httpx.ConnectError("chunk failed", request=request)
+            pairs = [pair("NotAsked", 1e9)]
+            for address in chunk:
+                pairs += [pair(address, 1_000, dex="orca"), pair(address, 5_000), pair(address, 1e9, chain="ethereum")]
+            return _rpc_reply({"pairs": pairs})
+
+        async def run():
+            scanner = te.TrendingTokenScanner()
+            scanner.client = httpx.AsyncClient(transport=httpx.MockTransport(dexscreener))
+            try:
+                return await scanner.get_pairs_batch(addresses + addresses[:5] + ["", None])
+            finally:
+                await scanner.close()
+
+        results = asyncio.run(run())
+
+        assert sorted(len(chunk) for chunk in requested) == [5, 30, 30]
+        assert sorted(a for chunk in requested for a in chunk) == addresses
+        # The failed chunk's addresses are simply missing
+        assert sorted(results) == addresses[:60]
+        for address, token in results.items():
+            assert token.address == address
+            assert token.liquidity_usd == 5_000 and token.dex == "raydium"
+
+
+class TestSignatureSocket:
+    """confirm_transaction: one shared signatureSubscribe socket, total wait capped at timeout"""
+
+    @staticmethod
+    def _pending_statuses(request):
+        body = orjson.loads(request.content)
+        items = body if isinstance(body, list) else [body]
+        replies = [{"jsonrpc": "2.0", "id": item["id"], "result": {"value": [None]}} for item in items]
+        return _rpc_reply(replies if isinstance(body, list) else replies[0])
+
+    @staticmethod
+    async def _serve(handler):
+        server = await websockets.serve(handler, "127.0.0.1", 0)
+        return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+    def test_concurrent_confirmations_share_one_socket(self):
+        connections = []
+
+        async def handler(ws):
+            connections.append(ws)
+            subs = {}
+            async for message in ws:
+                request = orjson.loads(message)
+                if request["method"] != "signatureSubscribe":
+                    continue
+                sub_id = request["id"] + 100
+                subs[request["params"][0]] = sub_id
+                await ws.send(orjson.dumps({"jsonrpc": "2.0", "id": request["id"], "result": sub_id}).decode())
+                if len(subs) == 2:
+                    # Notify in reverse order; each must reach its own caller
+                    for signature, err in (("sig-B", {"InstructionError": [0, "Custom"]}), ("sig-A", None)):
+                        await ws.send(orjson.dumps({
+                            "jsonrpc": "2.0",
+                            "method": "signatureNotification",
+                            "params": {"subscription": subs[signature], "result": {"value": {"err": err}}}
+                        }).decode())
+
+        async def run():
+            server, url = await self._serve(handler)
+            helius = _helius(self._pending_statuses)
+            helius.ws_url = url
+            try:
+                return await asyncio.gather(
+                    helius.confirm_transaction("sig-A", timeout=5),
+                    helius.confirm_transaction("sig-B", timeout=5),
+                )
+            finally:
+                await helius.close()
+                server.close()
+                await server.wait_closed()
+
+        assert asyncio.run(run()) == [True, False]
+        assert len(connections) == 1
+
+    def test_dropped_socket_polls_only_the_remaining_time(self):
+        async def handler(ws):
+            request = orjson.loads(await ws.recv())
+            await ws.send(orjson.dumps({"jsonrpc": "2.0", "id": request["id"], "result": 7}).decode())
+            await asyncio.sleep(0.5)
+            await ws.close()
+
+        async def run():
+            server, url = await self._serve(handler)
+            helius = _helius(self._pending_statuses)
+            helius.ws_url = url
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            try:
+                confirmed = await helius.confirm_transaction("sig-A", timeout=1)
+                return confirmed, loop.time() - started
+            finally:
+                await helius.close()
+                server.close()
+                await server.wait_closed()
+
+        confirmed, elapsed = asyncio.run(run())
+        assert confirmed is False
+        assert elapsed < 1.5
+
+    def test_unacked_subscribe_and_failed_final_check_report_unconfirmed(self):
+        async def handler(ws):
+            async for _ in ws:
+                pass  # never acknowledge the subscribe
+
+        def rpc(request):
+            raise httpx.ConnectError("network blip", request=request)
+
+        async def run():
+            server, url = await self._serve(handler)
+            helius = _helius(rpc)
+            helius.ws_url = url
+            try:
+                confirmed = await helius.confirm_transaction("sig-A", timeout=0.5)
+                return confirmed, dict(helius._sig_acks)
+            finally:
+                await helius.close()
+                server.close()
+                await server.wait_closed()
+
+        confirmed, acks = asyncio.run(run())
+        assert confirmed is False
+        assert acks == {}
@@ -7,19 +7,24 @@ Solana Soldier Trading Engine v2
 """
 
 import asyncio
+import heapq
 import httpx
-import base58
+import base64
 import logging
-import json
+import time
+import orjson
 import websockets
+from operator import attrgetter
+from aiolimiter import AsyncLimiter
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Callable
 from dataclasses import dataclass
 from solders.keypair import Keypair
 from solders.pubkey import Pubkey
 from solders.transaction import VersionedTransaction
 from solders.signature import Signature
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -34,15 +39,37 @@ HELIUS_API_KEY = os.environ.get('HELIUS_API_KEY', '')
 HELIUS_RPC_URL = f"https://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
 HELIUS_WS_URL = f"wss://mainnet.helius-rpc.com/?api-key={HELIUS_API_KEY}"
 
-# Jupiter API
-JUPITER_QUOTE_API = "https://quote-api.jup.ag/v6/quote"
-JUPITER_SWAP_API = "https://quote-api.jup.ag/v6/swap"
+# Jupiter API (point JUPITER_QUOTE_URL/JUPITER_SWAP_URL at a paid endpoint for higher RPS)
+JUPITER_QUOTE_API = os.environ.get('JUPITER_QUOTE_URL', "https://quote-api.jup.ag/v6/quote")
+JUPITER_SWAP_API = os.environ.get('JUPITER_SWAP_URL', "https://quote-api.jup.ag/v6/swap")
+JUPITER_API_KEY = os.environ.get('JUPITER_API_KEY', '')
+JUPITER_MAX_RPS = float(os.environ.get('JUPITER_MAX_RPS', '10'))  # quote+swap requests per second
+JUPITER_QUOTE_BASE_PARAMS = {"onlyDirectRoutes": "false", "asLegacyTransaction": "false"}  # constant quote flags
 JUPITER_PRICE_API = "https://price.jup.ag/v6/price"
+JUPITER_PRICE_IDS_LIMIT = 100  # max mints per price request
 
 # Solana Constants
 WSOL_MINT = "So11111111111111111111111111111111111111112"
 USDC_MINT = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
 LAMPORTS_PER_SOL = 1_000_000_000
+MULTIPLE_ACCOUNTS_LIMIT = 100  # max pubkeys per getMultipleAccounts call
+
+# In-process cache TTLs (seconds). Prices stay short so exit checks see fresh quotes;
+# DexScreener token metadata and mint/freeze authorities change rarely.
+PRICE_CACHE_TTL = 5
+TOKEN_INFO_CACHE_TTL = 300
+AUTHORITY_CACHE_TTL = 600
+RUG_CHECK_CACHE_TTL = 60  # Whole verdicts, shared by auto-trader, /rugcheck and scans
+RUG_CHECK_CACHE_MAX = 10_000
+PRICE_CACHE_MAX = 10_000  # Per-mint caches sweep expired entries once they reach these sizes
+TOKEN_INFO_CACHE_MAX = 10_000
+AUTHORITY_CACHE_MAX = 10_000
+RPC_BATCH_WINDOW = 0.002  # Seconds concurrent Helius RPC reads wait to share one JSON-RPC batch POST
+RPC_BATCH_MAX = 100  # Flush a batch early once this many calls are queued
+
+# Shared connection-pool limits for the HTTP/2 clients (Helius, Jupiter, DexScreener, Solscan); keeps sockets warm between polls
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=32, keepalive_expiry=75)
+HTTP_TIMEOUT = httpx.Timeout(30, connect=5)  # Slow responses are tolerated; a stalled connect/TLS handshake is not
 
 # Trading Parameters
 MIN_PROFIT_USD = 2.0
@@ -53,6 +80,17 @@ GAS_RESERVE_SOL = 0.01  # Reserve for gas fees
 MAX_TRADE_SOL = 0.5  # Maximum SOL per trade for safety
 MIN_TRADE_SOL = 0.02  # Minimum trade amount
 DEFAULT_STOP_LOSS_PCT = 0.15  # 15% stop loss default
+PRICE_TICK_SECONDS = 5  # Shared position price refresh interval
+WHALE_POLL_CONCURRENCY = 20  # Max whale wallets fetched at once in fallback polling
+NEW_PAIR_MIN_LIQUIDITY_USD = 1000  # Default liquidity floor for /api/new-pairs
+
+# DexScreener
+DEXSCREENER_PAIRS_URL = "https://api.dexscreener.com/latest/dex/pairs/solana"
+DEXSCREENER_TOKENS_URL = "https://api.dexscreener.com/latest/dex/tokens/"
+DEXSCREENER_TOKENS_LIMIT = 30  # Max comma-joined addresses per /tokens call
+DEXSCREENER_CACHE_TTL = 3.0  # Trending and new-pairs share one fetch within this window
+DEXSCREENER_CACHE_MAX = 256  # Expired responses are pruned once this many URLs are cached
+DEXSCREENER_TIMEOUT = httpx.Timeout(10, connect=5)  # Fail fast; a stale scan is worthless
 
 # Live trading flags - read after dotenv loads
 LIVE_TRADING_ENABLED = os.environ.get('LIVE_TRADING_ENABLED', 'false').lower() == 'true'
@@ -73,6 +111,24 @@ class TokenInfo:
     creator_address: Optional[str] = None
 
 
+@dataclass(slots=True)
+class TrendingToken:
+    address: Optional[str]
+    symbol: Optional[str]
+    name: Optional[str]
+    price_usd: float
+    liquidity_usd: float
+    volume_24h: float
+    price_change_24h: float
+    dex: Optional[str]
+
+
+@dataclass(slots=True)
+class NewPair(TrendingToken):
+    pair_address: Optional[str] = None
+    created_at: int = 0
+
+
 @dataclass
 class TradeSignal:
     token_address: str
@@ -107,47 +163,120 @@ class TradeResult:
     error: Optional[str] = None
 
 
+def _sweep_expired(cache: Dict[str, Tuple[object, float]], ttl: float, max_size: int, now: float):
+    """Drop expired (value, stored_at) entries in place once the cache has reached max_size"""
+    if len(cache) >= max_size:
+        for key in [key for key, entry in cache.items() if now - entry[1] >= ttl]:
+            del cache[key]
+
+
+class _RpcBatcher:
+    """Coalesce concurrent JSON-RPC calls into one batch POST per short window"""
+    
+    def __init__(self, client: httpx.AsyncClient, url: str, window: float = RPC_BATCH_WINDOW, max_size: int = RPC_BATCH_MAX):
+        self.client = client
+        self.url = url
+        self.window = window
+        self.max_size = max_size
+        self._pending: List[Tuple[str, list, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+    
+    async def call(self, method: str, params: list) -> Dict:
+        """Queue one call and return its JSON-RPC response object ({"result": ...} or {"error": ...})"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((method, params, future))
+        if len(self._pending) >= self.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+    
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+    
+    async def _send(self, batch: List[Tuple[str, list, asyncio.Future]]):
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params, _) in enumerate(batch)
+        ]
+        try:
+            # A lone call goes out as a plain request, exactly as before batching
+            response = await self.client.post(self.url, json=payload[0] if len(payload) == 1 else payload)
+            data = orjson.loads(response.content)
+            if isinstance(data, list):
+                by_id = {item.get("id"): item for item in data}
+            else:
+                # A lone call's reply, or one error object rejecting the whole batch (429, too large): every caller sees it
+                by_id = dict.fromkeys(range(len(batch)), data)
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for i, (_, _, future) in enumerate(batch):
+            if not future.done():
+                future.set_result(by_id.get(i, {}))
+    
+    async def close(self):
+        """Send any queued calls now and wait for in-flight batches, so callers get results before the client closes"""
+        if self._pending:
+            self._flush()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+
 class HeliusRPC:
     """Helius RPC client for fast Solana blockchain queries"""
     
     def __init__(self, api_key: str = None):
         self.api_key = api_key or HELIUS_API_KEY
         self.rpc_url = f"https://mainnet.helius-rpc.com/?api-key={self.api_key}"
-        self.client = httpx.AsyncClient(timeout=30)
+        self.ws_url = f"wss://mainnet.helius-rpc.com/?api-key={self.api_key}"
+        self.api_url = "https://api.helius.xyz"
+        # One pooled HTTP/2 client for RPC and enhanced API calls; requests multiplex over kept-alive connections
+        self.client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS)
+        # Concurrent reads (balances, transactions, signature statuses) share one batch round-trip
+        self._batcher = _RpcBatcher(self.client, self.rpc_url)
+        # Shared signatureSubscribe socket, opened on first confirmation and reopened after a drop
+        self._sig_ws = None
+        self._sig_ws_lock = asyncio.Lock()
+        self._sig_reader: Optional[asyncio.Task] = None
+        self._sig_request_id = 0
+        self._sig_acks: Dict[int, asyncio.Future] = {}  # request id -> (ack, notification future)
+        self._sig_subs: Dict[int, asyncio.Future] = {}  # subscription id -> signatureNotification value
     
     async def get_balance(self, address: str) -> float:
-        """Get SOL balance for an address"""
+        """Get SOL balance for an address (0.0 if the lookup fails)"""
+        balance = await self.get_balance_or_none(address)
+        return balance if balance is not None else 0.0
+    
+    async def get_balance_or_none(self, address: str) -> Optional[float]:
+        """Get SOL balance for an address; None if the RPC lookup failed, so callers can tell it from an empty wallet"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getBalance",
-                "params": [address]
-            }
-            response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = await self._batcher.call("getBalance", [address])
             if "result" in data:
                 return data["result"]["value"] / LAMPORTS_PER_SOL
-            return 0.0
+            logger.error(f"Get balance RPC error: {data.get('error')}")
+            return None
         except Exception as e:
             logger.error(f"Get balance error: {e}")
-            return 0.0
+            return None
     
     async def get_token_accounts(self, address: str) -> List[Dict]:
         """Get all token accounts for an address"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTokenAccountsByOwner",
-                "params": [
-                    address,
-                    {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"},
-                    {"encoding": "jsonParsed"}
-                ]
-            }
-            response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = await self._batcher.call("getTokenAccountsByOwner", [
+                address,
+                {"programId": "TokenkegQfeZyiNwAJbNbGKPFXCWuBvf9Ss623VQ5DA"},
+                {"encoding": "jsonParsed"}
+            ])
             if "result" in data:
                 return data["result"]["value"]
             return []
@@ -158,14 +287,7 @@ class HeliusRPC:
     async def get_recent_transactions(self, address: str, limit: int = 10) -> List[Dict]:
         """Get recent transactions for an address"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getSignaturesForAddress",
-                "params": [address, {"limit": limit}]
-            }
-            response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = await self._batcher.call("getSignaturesForAddress", [address, {"limit": limit}])
             if "result" in data:
                 return data["result"]
             return []
@@ -173,17 +295,26 @@ class HeliusRPC:
             logger.error(f"Get transactions error: {e}")
             return []
     
+    async def get_enhanced_transactions(self, address: str, limit: int = 20, api_key: str = None) -> Optional[List[Dict]]:
+        """Get parsed transactions for an address from the Helius enhanced API (None on failure)"""
+        try:
+            response = await self.client.get(
+                f"{self.api_url}/v0/addresses/{address}/transactions",
+                params={"api-key": api_key or self.api_key, "limit": limit},
+                timeout=15
+            )
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            logger.warning(f"Helius enhanced API returned {response.status_code}")
+            return None
+        except Exception as e:
+            logger.error(f"Get enhanced transactions error: {e}")
+            return None
+    
     async def get_transaction(self, signature: str) -> Optional[Dict]:
         """Get transaction details"""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "getTransaction",
-                "params": [signature, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}]
-            }
-            response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = await self._batcher.call("getTransaction", [signature, {"encoding": "jsonParsed", "maxSupportedTransactionVersion": 0}])
             if "result" in data:
                 return data["result"]
             return None
@@ -191,17 +322,27 @@ class HeliusRPC:
             logger.error(f"Get transaction error: {e}")
             return None
     
-    async def get_latest_blockhash(self) -> Optional[str]:
-        """Get latest blockhash for transaction signing"""
+    async def get_health(self) -> Tuple[bool, Optional[str]]:
+        """Check RPC node health (returns ok flag and error message)"""
         try:
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
-                "method": "getLatestBlockhash",
-                "params": [{"commitment": "finalized"}]
+                "method": "getHealth"
             }
             response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = orjson.loads(response.content)
+            if data.get("result") == "ok":
+                return True, None
+            return False, data.get("error", {}).get("message", f"HTTP {response.status_code}")
+        except Exception as e:
+            logger.error(f"Get health error: {e}")
+            return False, str(e)
+    
+    async def get_latest_blockhash(self) -> Optional[str]:
+        """Get latest blockhash for transaction signing"""
+        try:
+            data = await self._batcher.call("getLatestBlockhash", [{"commitment": "finalized"}])
             if "result" in data:
                 return data["result"]["value"]["blockhash"]
             return None
@@ -217,12 +358,12 @@ class HeliusRPC:
                 "id": 1,
                 "method": "sendTransaction",
                 "params": [
-                    base58.b58encode(signed_tx).decode('utf-8'),
-                    {"encoding": "base58", "skipPreflight": False, "maxRetries": 3}
+                    base64.b64encode(signed_tx).decode('ascii'),
+                    {"encoding": "base64", "skipPreflight": False, "maxRetries": 3}
                 ]
             }
             response = await self.client.post(self.rpc_url, json=payload)
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if "result" in data:
                 return True, data["result"], None
@@ -233,35 +374,189 @@ class HeliusRPC:
             logger.error(f"Send transaction error: {e}")
             return False, None, str(e)
     
+    async def send_transactions(self, signed_txs: List[bytes]) -> List[Tuple[bool, Optional[str], Optional[str]]]:
+        """Send several signed transactions in one JSON-RPC batch request"""
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "sendTransaction",
+                "params": [
+                    base64.b64encode(signed_tx).decode('ascii'),
+                    {"encoding": "base64", "skipPreflight": False, "maxRetries": 3}
+                ]
+            }
+            for i, signed_tx in enumerate(signed_txs)
+        ]
+        try:
+            response = await self.client.post(self.rpc_url, json=payload)
+            data = orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"Batch send transaction error: {e}")
+            return [(False, None, str(e))] * len(signed_txs)
+        if isinstance(data, dict):
+            # The whole batch was rejected (rate limit, malformed request) with a single error object
+            error = (data.get("error") or {}).get("message", "Unknown error")
+            logger.error(f"Batch send transaction rejected: {error}")
+            return [(False, None, error)] * len(signed_txs)
+        by_id = {item.get("id"): item for item in data}
+        
+        results = []
+        for i in range(len(signed_txs)):
+            data = by_id.get(i, {})
+            if "result" in data:
+                results.append((True, data["result"], None))
+            else:
+                results.append((False, None, data.get("error", {}).get("message", "Unknown error")))
+        return results
+    
+    async def get_signature_status(self, signature: str) -> Optional[Dict]:
+        """Get the current status of a transaction signature (None if not yet seen)"""
+        data = await self._batcher.call("getSignatureStatuses", [[signature]])
+        if "result" in data:
+            return data["result"]["value"][0]
+        return None
+    
+    async def _signature_socket(self):
+        """Connected shared signature WebSocket; the reader task routes replies by id"""
+        async with self._sig_ws_lock:
+            if self._sig_ws is None:
+                self._sig_ws = await websockets.connect(self.ws_url, ping_interval=30, ping_timeout=10)
+                self._sig_reader = asyncio.create_task(self._read_signature_socket(self._sig_ws))
+            return self._sig_ws
+    
+    async def _read_signature_socket(self, ws):
+        """Resolve subscribe acks by request id and notifications by subscription id"""
+        try:
+            async for message in ws:
+                data = orjson.loads(message)
+                if data.get("method") == "signatureNotification":
+                    params = data["params"]
+                    future = self._sig_subs.pop(params["subscription"], None)
+                    if future and not future.done():
+                        future.set_result(params["result"]["value"])
+                    continue
+                ack = self._sig_acks.pop(data.get("id"), None)
+                if ack is None or ack.done():
+                    continue
+                # Register before the next message is read, so an immediate notification is not lost
+                notified = asyncio.get_running_loop().create_future()
+                if "result" in data:
+                    self._sig_subs[data["result"]] = notified
+                ack.set_result((data, notified))
+        except Exception as e:
+            logger.warning(f"Signature WebSocket closed: {e}")
+        finally:
+            if self._sig_ws is ws:
+                self._sig_ws = None
+            # Waiters on this connection fall back to polling
+            waiters = list(self._sig_acks.values()) + list(self._sig_subs.values())
+            self._sig_acks.clear()
+            self._sig_subs.clear()
+            for future in waiters:
+                if not future.done():
+                    future.set_exception(ConnectionError("signature WebSocket closed"))
+    
+    async def _unsubscribe_signature(self, ws, sub_id: int):
+        """Best-effort signatureUnsubscribe for a subscription that never notified"""
+        self._sig_subs.pop(sub_id, None)
+        self._sig_request_id += 1
+        try:
+            await ws.send(orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": self._sig_request_id,
+                "method": "signatureUnsubscribe",
+                "params": [sub_id]
+            }).decode())
+        except Exception:
+            pass
+    
+    async def wait_for_signature(self, signature: str, timeout: float = 60) -> Optional[bool]:
+        """Wait for confirmation via signatureSubscribe on the shared socket; None if the WebSocket could not be used"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        ws = None
+        request_id = None
+        sub_id = None
+        try:
+            ws = await asyncio.wait_for(self._signature_socket(), timeout=timeout)
+            self._sig_request_id += 1
+            request_id = self._sig_request_id
+            ack = loop.create_future()
+            self._sig_acks[request_id] = ack
+            await ws.send(orjson.dumps({
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "signatureSubscribe",
+                "params": [signature, {"commitment": "confirmed"}]
+            }).decode())
+            reply, notified = await asyncio.wait_for(ack, timeout=max(deadline - loop.time(), 0))
+            if "error" in reply:
+                logger.warning(f"signatureSubscribe rejected, polling instead: {reply['error']}")
+                return None
+            sub_id = reply["result"]
+            
+            # The transaction may have landed before the subscription did
+            status = await self.get_signature_status(signature)
+            if status and status.get("confirmationStatus") in ["confirmed", "finalized"]:
+                await self._unsubscribe_signature(ws, sub_id)
+                return status.get("err") is None
+            
+            value = await asyncio.wait_for(notified, timeout=max(deadline - loop.time(), 0))
+            if value.get("err"):
+                logger.error(f"Transaction failed: {value['err']}")
+                return False
+            return True
+        except asyncio.TimeoutError:
+            # An unacknowledged subscribe must not leave its future behind for the life of the socket
+            if request_id is not None:
+                self._sig_acks.pop(request_id, None)
+            if sub_id is not None:
+                await self._unsubscribe_signature(ws, sub_id)
+            # A missed notification must not report a swap that landed as unconfirmed
+            try:
+                status = await self.get_signature_status(signature)
+            except Exception as e:
+                logger.warning(f"Final signature status check failed: {e}")
+                return False
+            if status and status.get("confirmationStatus") in ["confirmed", "finalized"]:
+                return status.get("err") is None
+            return False
+        except Exception as e:
+            logger.warning(f"signatureSubscribe unavailable, polling instead: {e}")
+            return None
+    
     async def confirm_transaction(self, signature: str, timeout: int = 60) -> bool:
-        """Wait for transaction confirmation"""
+        """Wait for transaction confirmation (WebSocket push, polling as fallback) within timeout overall"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        confirmed = await self.wait_for_signature(signature, timeout)
+        if confirmed is not None:
+            return confirmed
         try:
-            start_time = asyncio.get_event_loop().time()
-            while asyncio.get_event_loop().time() - start_time < timeout:
-                payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "getSignatureStatuses",
-                    "params": [[signature]]
-                }
-                response = await self.client.post(self.rpc_url, json=payload)
-                data = response.json()
-                
-                if "result" in data and data["result"]["value"][0]:
-                    status = data["result"]["value"][0]
+            # Only the time the WebSocket attempt left over is spent polling
+            while loop.time() < deadline:
+                # Batched, so concurrent confirmations share one getSignatureStatuses round-trip
+                status = await self.get_signature_status(signature)
+                if status:
                     if status.get("confirmationStatus") in ["confirmed", "finalized"]:
                         return True
                     if status.get("err"):
                         logger.error(f"Transaction failed: {status['err']}")
                         return False
                 
-                await asyncio.sleep(2)
+                await asyncio.sleep(min(2, max(deadline - loop.time(), 0)))
             return False
         except Exception as e:
             logger.error(f"Confirm transaction error: {e}")
             return False
     
     async def close(self):
+        if self._sig_ws is not None:
+            await self._sig_ws.close()
+        if self._sig_reader is not None:
+            await asyncio.gather(self._sig_reader, return_exceptions=True)
+        await self._batcher.close()
         await self.client.aclose()
 
 
@@ -308,11 +603,11 @@ class HeliusWebSocket:
                     {"encoding": "jsonParsed", "commitment": "confirmed"}
                 ]
             }
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(orjson.dumps(request).decode())
             
             # Wait for subscription confirmation
             response = await asyncio.wait_for(self.websocket.recv(), timeout=10)
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             if "result" in data:
                 sub_id = data["result"]
@@ -340,10 +635,10 @@ class HeliusWebSocket:
                     {"commitment": "confirmed"}
                 ]
             }
-            await self.websocket.send(json.dumps(request))
+            await self.websocket.send(orjson.dumps(request).decode())
             
             response = await asyncio.wait_for(self.websocket.recv(), timeout=10)
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             if "result" in data:
                 sub_id = data["result"]
@@ -361,23 +656,19 @@ class HeliusWebSocket:
         
         while self.is_running:
             try:
-                message = await asyncio.wait_for(self.websocket.recv(), timeout=60)
-                data = json.loads(message)
+                # Liveness comes from the connection's own ping_interval/ping_timeout keepalive:
+                # a dead peer surfaces here as ConnectionClosed, so recv needs no timeout
+                message = await self.websocket.recv()
+                data = orjson.loads(message)
                 
                 if "method" in data and data["method"] == "accountNotification":
                     await self._handle_account_notification(data)
                 elif "method" in data and data["method"] == "logsNotification":
                     await self._handle_logs_notification(data)
                     
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    pong = await self.websocket.ping()
-                    await asyncio.wait_for(pong, timeout=10)
-                except:
-                    logger.warning("WebSocket ping failed, reconnecting...")
-                    await self._reconnect()
             except websockets.exceptions.ConnectionClosed:
+                if not self.is_running:
+                    break  # closed by close()
                 logger.warning("WebSocket connection closed, reconnecting...")
                 await self._reconnect()
             except Exception as e:
@@ -446,9 +737,24 @@ class HeliusWebSocket:
 class JupiterDEX:
     """Jupiter DEX integration for live Solana swaps"""
     
-    def __init__(self, helius_rpc: HeliusRPC = None):
-        self.client = httpx.AsyncClient(timeout=30)
+    def __init__(
+        self,
+        helius_rpc: HeliusRPC = None,
+        quote_url: str = JUPITER_QUOTE_API,
+        swap_url: str = JUPITER_SWAP_API,
+        api_key: str = JUPITER_API_KEY,
+        max_rps: float = JUPITER_MAX_RPS,
+        price_ttl: float = PRICE_CACHE_TTL
+    ):
+        self.quote_url = quote_url
+        self.swap_url = swap_url
+        headers = {"x-api-key": api_key} if api_key else None
+        self.client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS, headers=headers)
         self.helius = helius_rpc or HeliusRPC()
+        self._rate_limiter = AsyncLimiter(max_rps, 1)  # shared by quote and swap calls
+        self.price_ttl = price_ttl
+        self._price_cache: Dict[str, Tuple[float, float]] = {}  # mint -> (price, fetched_at)
+        self._price_inflight: Dict[str, asyncio.Task] = {}  # mint -> price fetch shared by concurrent callers
     
     async def get_quote(
         self, 
@@ -460,16 +766,16 @@ class JupiterDEX:
         """Get swap quote from Jupiter"""
         try:
             params = {
+                **JUPITER_QUOTE_BASE_PARAMS,
                 "inputMint": input_mint,
                 "outputMint": output_mint,
-                "amount": amount,
-                "slippageBps": slippage_bps,
-                "onlyDirectRoutes": False,
-                "asLegacyTransaction": False
+                "amount": str(amount),
+                "slippageBps": str(slippage_bps)
             }
-            response = await self.client.get(JUPITER_QUOTE_API, params=params)
+            async with self._rate_limiter:
+                response = await self.client.get(self.quote_url, params=params)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             logger.error(f"Jupiter quote error: {response.status_code} - {response.text}")
             return None
         except Exception as e:
@@ -491,69 +797,105 @@ class JupiterDEX:
                 "dynamicComputeUnitLimit": True,
                 "prioritizationFeeLamports": "auto"
             }
-            response = await self.client.post(JUPITER_SWAP_API, json=payload)
+            async with self._rate_limiter:
+                response = await self.client.post(self.swap_url, json=payload)
             if response.status_code == 200:
-                data = response.json()
-                return base58.b58decode(data["swapTransaction"])
+                data = orjson.loads(response.content)
+                return base64.b64decode(data["swapTransaction"])  # Jupiter returns base64
             logger.error(f"Jupiter swap error: {response.status_code} - {response.text}")
             return None
         except Exception as e:
             logger.error(f"Jupiter swap exception: {e}")
             return None
     
+    async def _prepare_swap(
+        self,
+        keypair: Keypair,
+        input_mint: str,
+        output_mint: str,
+        amount_lamports: int,
+        slippage_bps: int = MAX_SLIPPAGE_BPS,
+        user_public_key: Optional[str] = None
+    ) -> Tuple[Optional[bytes], int, Optional[str]]:
+        """Quote, build and sign a swap; returns (signed_tx, out_amount, error)"""
+        # Step 1: Get quote
+        quote = await self.get_quote(input_mint, output_mint, amount_lamports, slippage_bps)
+        if not quote:
+            return None, 0, "Failed to get quote"
+        
+        out_amount = int(quote.get("outAmount", 0))
+        price_impact = float(quote.get("priceImpactPct", 0))
+        
+        logger.info(f"[LIVE TRADE] Quote received: out={out_amount}, price_impact={price_impact}%")
+        
+        # Safety check: reject high price impact
+        if price_impact > 5:
+            return None, out_amount, f"Price impact too high: {price_impact}%"
+        
+        # Step 2: Get swap transaction
+        swap_tx_bytes = await self.get_swap_transaction(
+            quote, 
+            user_public_key or str(keypair.pubkey())
+        )
+        if not swap_tx_bytes:
+            return None, out_amount, "Failed to get swap transaction"
+        
+        # Step 3: Sign transaction
+        unsigned_tx = VersionedTransaction.from_bytes(swap_tx_bytes)
+        tx = VersionedTransaction(unsigned_tx.message, [keypair])
+        return bytes(tx), out_amount, None
+    
+    async def _confirm_swap(
+        self,
+        trade_id: str,
+        signature: str,
+        input_mint: str,
+        output_mint: str,
+        amount_lamports: int,
+        out_amount: int
+    ) -> TradeResult:
+        """Wait for a sent swap to confirm and build its TradeResult"""
+        confirmed = await self.helius.confirm_transaction(signature, timeout=60)
+        
+        if confirmed:
+            logger.info(f"[LIVE TRADE] ✅ Transaction confirmed: {signature}")
+            return TradeResult(
+                success=True,
+                trade_id=trade_id,
+                signature=signature,
+                action="BUY" if input_mint == WSOL_MINT else "SELL",
+                token_address=output_mint if input_mint == WSOL_MINT else input_mint,
+                amount_sol=amount_lamports / LAMPORTS_PER_SOL,
+                amount_tokens=out_amount
+            )
+        return TradeResult(
+            success=False,
+            trade_id=trade_id,
+            signature=signature,
+            error="Transaction not confirmed within timeout"
+        )
+    
     async def execute_swap(
         self,
         keypair: Keypair,
         input_mint: str,
         output_mint: str,
         amount_lamports: int,
-        slippage_bps: int = MAX_SLIPPAGE_BPS
+        slippage_bps: int = MAX_SLIPPAGE_BPS,
+        user_public_key: Optional[str] = None
     ) -> TradeResult:
-        """Execute a live swap on Jupiter"""
+        """Execute a live swap on Jupiter (pass user_public_key to skip re-encoding the keypair's pubkey)"""
         import uuid
         trade_id = str(uuid.uuid4())
         
         try:
             logger.info(f"[LIVE TRADE] Starting swap: {amount_lamports/LAMPORTS_PER_SOL:.4f} SOL -> {output_mint[:8]}...")
             
-            # Step 1: Get quote
-            quote = await self.get_quote(input_mint, output_mint, amount_lamports, slippage_bps)
-            if not quote:
-                return TradeResult(
-                    success=False,
-                    trade_id=trade_id,
-                    error="Failed to get quote"
-                )
-            
-            out_amount = int(quote.get("outAmount", 0))
-            price_impact = float(quote.get("priceImpactPct", 0))
-            
-            logger.info(f"[LIVE TRADE] Quote received: out={out_amount}, price_impact={price_impact}%")
-            
-            # Safety check: reject high price impact
-            if price_impact > 5:
-                return TradeResult(
-                    success=False,
-                    trade_id=trade_id,
-                    error=f"Price impact too high: {price_impact}%"
-                )
-            
-            # Step 2: Get swap transaction
-            swap_tx_bytes = await self.get_swap_transaction(
-                quote, 
-                str(keypair.pubkey())
+            signed_tx, out_amount, error = await self._prepare_swap(
+                keypair, input_mint, output_mint, amount_lamports, slippage_bps, user_public_key
             )
-            if not swap_tx_bytes:
-                return TradeResult(
-                    success=False,
-                    trade_id=trade_id,
-                    error="Failed to get swap transaction"
-                )
-            
-            # Step 3: Sign transaction
-            tx = VersionedTransaction.from_bytes(swap_tx_bytes)
-            tx.sign([keypair])
-            signed_tx = bytes(tx)
+            if error:
+                return TradeResult(success=False, trade_id=trade_id, error=error)
             
             logger.info(f"[LIVE TRADE] Transaction signed, sending...")
             
@@ -570,26 +912,9 @@ class JupiterDEX:
             logger.info(f"[LIVE TRADE] Transaction sent: {signature}")
             
             # Step 5: Confirm transaction
-            confirmed = await self.helius.confirm_transaction(signature, timeout=60)
-            
-            if confirmed:
-                logger.info(f"[LIVE TRADE] ✅ Transaction confirmed: {signature}")
-                return TradeResult(
-                    success=True,
-                    trade_id=trade_id,
-                    signature=signature,
-                    action="BUY" if input_mint == WSOL_MINT else "SELL",
-                    token_address=output_mint if input_mint == WSOL_MINT else input_mint,
-                    amount_sol=amount_lamports / LAMPORTS_PER_SOL,
-                    amount_tokens=out_amount
-                )
-            else:
-                return TradeResult(
-                    success=False,
-                    trade_id=trade_id,
-                    signature=signature,
-                    error="Transaction not confirmed within timeout"
-                )
+            return await self._confirm_swap(
+                trade_id, signature, input_mint, output_mint, amount_lamports, out_amount
+            )
                     
         except Exception as e:
             logger.error(f"[LIVE TRADE] Swap execution error: {e}")
@@ -599,19 +924,122 @@ class JupiterDEX:
                 error=str(e)
             )
     
+    async def execute_swaps_batch(self, swaps: List[Dict]) -> List[TradeResult]:
+        """Execute several swaps: build them in parallel, send in one RPC batch, confirm in parallel.
+        
+        Each item takes the execute_swap keyword arguments (keypair, input_mint, output_mint,
+        amount_lamports and optionally slippage_bps/user_public_key). Results come back in the same order.
+        """
+        import uuid
+        trade_ids = [str(uuid.uuid4()) for _ in swaps]
+        results: List[Optional[TradeResult]] = [None] * len(swaps)
+        
+        prepared = await asyncio.gather(
+            *[self._prepare_swap(**swap) for swap in swaps],
+            return_exceptions=True
+        )
+        
+        ready = []  # indices of swaps with a signed transaction
+        for i, outcome in enumerate(prepared):
+            if isinstance(outcome, Exception):
+                results[i] = TradeResult(success=False, trade_id=trade_ids[i], error=str(outcome))
+            elif outcome[2]:
+                results[i] = TradeResult(success=False, trade_id=trade_ids[i], error=outcome[2])
+            else:
+                ready.append(i)
+        
+        if ready:
+            logger.info(f"[LIVE TRADE] Sending {len(ready)} signed swaps in one batch...")
+            sent = await self.helius.send_transactions([prepared[i][0] for i in ready])
+            
+            confirming = []  # (index, signature) of swaps accepted by the RPC
+            for i, (success, signature, error) in zip(ready, sent):
+                if success:
+                    confirming.append((i, signature))
+                else:
+                    results[i] = TradeResult(success=False, trade_id=trade_ids[i], error=error)
+            
+            confirmed = await asyncio.gather(*[
+                self._confirm_swap(
+                    trade_ids[i], signature,
+                    swaps[i]["input_mint"], swaps[i]["output_mint"],
+                    swaps[i]["amount_lamports"], prepared[i][1]
+                )
+                for i, signature in confirming
+            ], return_exceptions=True)
+            for (i, signature), result in zip(confirming, confirmed):
+                if isinstance(result, Exception):
+                    # Already sent: keep the signature so the caller can still track the swap
+                    result = TradeResult(success=False, trade_id=trade_ids[i], signature=signature, error=str(result))
+                results[i] = result
+        
+        return results
+    
     async def get_token_price(self, token_mint: str) -> Optional[float]:
-        """Get token price in USD"""
+        """Get token price in USD (cached for PRICE_CACHE_TTL seconds)"""
+        prices = await self.get_token_prices([token_mint])
+        return prices.get(token_mint)
+    
+    async def get_token_prices(self, token_mints: List[str]) -> Dict[str, float]:
+        """Get USD prices for many mints, fetching only the stale ones in a single Jupiter call"""
+        now = time.monotonic()
+        prices = {}
+        missing = []
+        for mint in token_mints:
+            cached = self._price_cache.get(mint)
+            if cached and now - cached[1] < self.price_ttl:
+                prices[mint] = cached[0]
+            else:
+                missing.append(mint)
+        if not missing:
+            return prices
+        
+        # Mints already being fetched by another caller join that request instead of issuing their own
+        tasks = set()
+        to_fetch = []
+        for mint in missing:
+            task = self._price_inflight.get(mint)
+            if task:
+                tasks.add(task)
+            else:
+                to_fetch.append(mint)
+        for i in range(0, len(to_fetch), JUPITER_PRICE_IDS_LIMIT):
+            chunk = to_fetch[i:i + JUPITER_PRICE_IDS_LIMIT]
+            task = asyncio.create_task(self._fetch_prices(chunk))
+            for mint in chunk:
+                self._price_inflight[mint] = task
+            task.add_done_callback(lambda t, chunk=chunk: self._release_inflight(chunk, t))
+            tasks.add(task)
+        
+        fetched = {}
+        for result in await asyncio.gather(*[asyncio.shield(task) for task in tasks]):
+            fetched.update(result)
+        prices.update((mint, fetched[mint]) for mint in missing if mint in fetched)
+        return prices
+    
+    def _release_inflight(self, mints: List[str], task: asyncio.Task):
+        for mint in mints:
+            if self._price_inflight.get(mint) is task:
+                del self._price_inflight[mint]
+    
+    async def _fetch_prices(self, mints: List[str]) -> Dict[str, float]:
+        """One Jupiter price request for up to JUPITER_PRICE_IDS_LIMIT mints; fills the cache"""
+        prices = {}
         try:
-            params = {"ids": token_mint}
+            params = {"ids": ",".join(mints)}
             response = await self.client.get(JUPITER_PRICE_API, params=params)
             if response.status_code == 200:
-                data = response.json()
-                if "data" in data and token_mint in data["data"]:
-                    return data["data"][token_mint].get("price", 0)
-            return None
+                data = orjson.loads(response.content).get("data") or {}
+                fetched_at = time.monotonic()
+                _sweep_expired(self._price_cache, self.price_ttl, PRICE_CACHE_MAX, fetched_at)
+                for mint in mints:
+                    if mint in data:
+                        price = data[mint].get("price", 0)
+                        self._price_cache[mint] = (price, fetched_at)
+                        prices[mint] = price
         except Exception as e:
             logger.error(f"Price fetch error: {e}")
-            return None
+        return prices
     
     async def close(self):
         await self.client.aclose()
@@ -630,20 +1058,46 @@ class RugDetector:
         "high_tax": 0.1,
     }
     
-    def __init__(self, solscan_api_key: str = None, helius_rpc: HeliusRPC = None):
+    KNOWN_RUGGERS = frozenset({
+        "AUFxnVLsKkkupjCY4kmA5ZDH8c4HgK7CZ4FYw1VcXpn8",
+    })
+    
+    def __init__(self, solscan_api_key: str = None, helius_rpc: HeliusRPC = None, known_ruggers: Iterable[str] = ()):
         self.solscan_api_key = solscan_api_key
+        self._rugger_set = self.KNOWN_RUGGERS | frozenset(known_ruggers)  # O(1) creator lookups
         self.helius = helius_rpc or HeliusRPC()
-        self.client = httpx.AsyncClient(timeout=30)
+        self.client = httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS)
+        self._token_info_cache: Dict[str, Tuple[Dict, float]] = {}  # mint -> (info, fetched_at)
+        self._authority_cache: Dict[str, Tuple[Dict, float]] = {}
+        self._result_cache: Dict[str, Tuple[RugCheckResult, float]] = {}
     
-    async def check_token(self, token_address: str) -> RugCheckResult:
-        """Comprehensive rug check for a token"""
+    async def check_token(self, token_address: str, authorities: Optional[Dict] = None) -> RugCheckResult:
+        """Comprehensive rug check for a token (authorities may be pre-fetched by check_tokens)"""
+        cached = self._result_cache.get(token_address)
+        if cached and time.monotonic() - cached[1] < RUG_CHECK_CACHE_TTL:
+            return cached[0]
+        
         warnings = []
         risk_factors = []
         details = {}
         
         try:
-            # Fetch token metadata
-            token_info = await self._get_token_info(token_address)
+            # Fetch token metadata and mint/freeze authorities concurrently
+            if authorities is None:
+                token_info, authorities = await asyncio.gather(
+                    self._get_token_info(token_address),
+                    self._check_authorities_helius(token_address),
+                    return_exceptions=True
+                )
+            else:
+                token_info = await self._get_token_info(token_address)
+            # A failed lookup counts as worst case, same as the helpers' own fallbacks
+            if isinstance(token_info, Exception):
+                logger.error(f"Token info error: {token_info}")
+                token_info = {}
+            if isinstance(authorities, Exception):
+                logger.error(f"Authority check error: {authorities}")
+                authorities = {"mint_authority": True, "freeze_authority": True}
             details["token_info"] = token_info
             
             # Check 1: Liquidity
@@ -670,7 +1124,6 @@ class RugDetector:
                 details["age_hours"] = age_hours
             
             # Check 4: Mint/Freeze authority via Helius
-            authorities = await self._check_authorities_helius(token_address)
             if authorities.get("mint_authority"):
                 warnings.append("Mint authority enabled - can create more tokens")
                 risk_factors.append(0.25)
@@ -689,12 +1142,14 @@ class RugDetector:
             risk_score = min(1.0, sum(risk_factors))
             is_safe = risk_score < 0.5
             
-            return RugCheckResult(
+            result = RugCheckResult(
                 is_safe=is_safe,
                 risk_score=risk_score,
                 warnings=warnings,
                 details=details
             )
+            self._cache_result(token_address, result)
+            return result
             
         except Exception as e:
             logger.error(f"Rug check error: {e}")
@@ -706,30 +1161,40 @@ class RugDetector:
             )
     
     async def _get_token_info(self, token_address: str) -> Dict:
-        """Fetch token information from DexScreener"""
+        """Fetch token information from DexScreener (cached for TOKEN_INFO_CACHE_TTL seconds)"""
+        cached = self._token_info_cache.get(token_address)
+        if cached and time.monotonic() - cached[1] < TOKEN_INFO_CACHE_TTL:
+            return cached[0]
         try:
             response = await self.client.get(
                 f"https://api.dexscreener.com/latest/dex/tokens/{token_address}"
             )
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 pairs = data.get("pairs", [])
                 if pairs:
                     p = pairs[0]
-                    return {
+                    info = {
                         "symbol": p.get("baseToken", {}).get("symbol"),
                         "name": p.get("baseToken", {}).get("name"),
                         "liquidity_usd": float(p.get("liquidity", {}).get("usd", 0) or 0),
                         "holder_count": 100,  # DexScreener doesn't provide this
                         "price_usd": float(p.get("priceUsd", 0) or 0),
                     }
+                    now = time.monotonic()
+                    _sweep_expired(self._token_info_cache, TOKEN_INFO_CACHE_TTL, TOKEN_INFO_CACHE_MAX, now)
+                    self._token_info_cache[token_address] = (info, now)
+                    return info
             return {}
         except Exception as e:
             logger.error(f"Token info error: {e}")
             return {}
     
     async def _check_authorities_helius(self, token_address: str) -> Dict:
-        """Check mint/freeze authorities using Helius RPC"""
+        """Check mint/freeze authorities using Helius RPC (cached for AUTHORITY_CACHE_TTL seconds)"""
+        cached = self._authority_cache.get(token_address)
+        if cached and time.monotonic() - cached[1] < AUTHORITY_CACHE_TTL:
+            return cached[0]
         try:
             payload = {
                 "jsonrpc": "2.0",
@@ -737,30 +1202,105 @@ class RugDetector:
                 "method": "getAccountInfo",
                 "params": [token_address, {"encoding": "jsonParsed"}]
             }
-            async with httpx.AsyncClient() as client:
-                response = await client.post(self.helius.rpc_url, json=payload)
-                data = response.json()
-                
-                if "result" in data and data["result"]["value"]:
-                    parsed = data["result"]["value"]["data"]["parsed"]["info"]
-                    return {
-                        "mint_authority": parsed.get("mintAuthority") is not None,
-                        "freeze_authority": parsed.get("freezeAuthority") is not None
-                    }
-            return {"mint_authority": False, "freeze_authority": False}
+            response = await self.helius.client.post(self.helius.rpc_url, json=payload)
+            data = orjson.loads(response.content)
+            
+            # Error bodies (rate limits etc.) count as worst case and are not cached
+            if "result" not in data:
+                logger.error(f"Authority check RPC error: {data.get('error')}")
+                return {"mint_authority": True, "freeze_authority": True}
+            if data["result"]["value"]:
+                parsed = data["result"]["value"]["data"]["parsed"]["info"]
+                authorities = {
+                    "mint_authority": parsed.get("mintAuthority") is not None,
+                    "freeze_authority": parsed.get("freezeAuthority") is not None
+                }
+            else:
+                authorities = {"mint_authority": False, "freeze_authority": False}
+            now = time.monotonic()
+            _sweep_expired(self._authority_cache, AUTHORITY_CACHE_TTL, AUTHORITY_CACHE_MAX, now)
+            self._authority_cache[token_address] = (authorities, now)
+            return authorities
         except Exception as e:
             logger.error(f"Authority check error: {e}")
             return {"mint_authority": True, "freeze_authority": True}
     
+    def _cache_result(self, token_address: str, result: RugCheckResult):
+        """Remember a verdict, dropping expired entries once the cache is full"""
+        now = time.monotonic()
+        _sweep_expired(self._result_cache, RUG_CHECK_CACHE_TTL, RUG_CHECK_CACHE_MAX, now)
+        self._result_cache[token_address] = (result, now)
+    
+    def invalidate(self, token_address: str):
+        """Forget cached data for a token so the next check hits the network"""
+        self._result_cache.pop(token_address, None)
+        self._token_info_cache.pop(token_address, None)
+        self._authority_cache.pop(token_address, None)
+    
+    async def check_tokens(self, token_addresses: List[str]) -> Dict[str, RugCheckResult]:
+        """Rug check many tokens, fetching all mint/freeze authorities in one batched RPC request"""
+        authorities = await self._check_authorities_batch(token_addresses)
+        results = await asyncio.gather(*[
+            self.check_token(addr, authorities.get(addr)) for addr in token_addresses
+        ])
+        return dict(zip(token_addresses, results))
+    
+    async def _check_authorities_batch(self, token_addresses: List[str]) -> Dict[str, Dict]:
+        """Check mint/freeze authorities for many tokens with one JSON-RPC batch of getMultipleAccounts"""
+        now = time.monotonic()
+        authorities = {}
+        missing = []
+        for addr in token_addresses:
+            cached = self._authority_cache.get(addr)
+            if cached and now - cached[1] < AUTHORITY_CACHE_TTL:
+                authorities[addr] = cached[0]
+            else:
+                missing.append(addr)
+        chunks = [
+            missing[i:i + MULTIPLE_ACCOUNTS_LIMIT]
+            for i in range(0, len(missing), MULTIPLE_ACCOUNTS_LIMIT)
+        ]
+        if not chunks:
+            return authorities
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": i,
+                "method": "getMultipleAccounts",
+                "params": [chunk, {"encoding": "jsonParsed"}]
+            }
+            for i, chunk in enumerate(chunks)
+        ]
+        try:
+            response = await self.helius.client.post(self.helius.rpc_url, json=payload)
+            # Batch responses may arrive in any order; match them back to their chunk by id
+            by_id = {item.get("id"): item for item in orjson.loads(response.content)}
+            fetched_at = time.monotonic()
+            _sweep_expired(self._authority_cache, AUTHORITY_CACHE_TTL, AUTHORITY_CACHE_MAX, fetched_at)
+            for i, chunk in enumerate(chunks):
+                accounts = by_id.get(i, {}).get("result", {}).get("value")
+                if accounts is None:
+                    continue
+                for addr, account in zip(chunk, accounts):
+                    if account:
+                        parsed = account["data"]["parsed"]["info"]
+                        authorities[addr] = {
+                            "mint_authority": parsed.get("mintAuthority") is not None,
+                            "freeze_authority": parsed.get("freezeAuthority") is not None
+                        }
+                    else:
+                        authorities[addr] = {"mint_authority": False, "freeze_authority": False}
+                    self._authority_cache[addr] = (authorities[addr], fetched_at)
+            return authorities
+        except Exception as e:
+            logger.error(f"Batch authority check error: {e}")
+            return authorities
+    
     async def _check_known_ruggers(self, creator_address: Optional[str]) -> bool:
         """Check if creator is in known rugger database"""
         if not creator_address:
             return False
-        
-        KNOWN_RUGGERS = [
-            "AUFxnVLsKkkupjCY4kmA5ZDH8c4HgK7CZ4FYw1VcXpn8",
-        ]
-        return creator_address in KNOWN_RUGGERS
+        return creator_address in self._rugger_set
     
     async def close(self):
         await self.client.aclose()
@@ -777,12 +1317,31 @@ class WhaleMonitorWebSocket:
         helius_rpc: HeliusRPC = None
     ):
         self.whale_wallets = whale_wallets
+        self._whale_set = frozenset(whale_wallets)  # O(1) owner checks when parsing balances
         self.helius_api_key = helius_api_key
         self.on_whale_activity = on_whale_activity
         self.helius_rpc = helius_rpc or HeliusRPC(helius_api_key)
         self.helius_ws = None
         self.is_running = False
         self.last_signatures: Dict[str, str] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._poll_semaphore = asyncio.Semaphore(WHALE_POLL_CONCURRENCY)
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Create a task that stays referenced until done and logs it if it crashes"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(self._log_task_exception)
+        return task
+    
+    @staticmethod
+    def _log_task_exception(task: asyncio.Task):
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            logger.error(f"Whale monitor task crashed: {exc!r}", exc_info=exc)
     
     async def start(self):
         """Start WebSocket monitoring"""
@@ -797,7 +1356,7 @@ class WhaleMonitorWebSocket:
         connected = await self.helius_ws.connect()
         if not connected:
             logger.error("Failed to connect WebSocket, falling back to polling")
-            asyncio.create_task(self._fallback_polling())
+            self._spawn(self._fallback_polling())
             return
         
         # Subscribe to whale wallets
@@ -806,7 +1365,7 @@ class WhaleMonitorWebSocket:
             await asyncio.sleep(0.5)  # Rate limit
         
         # Start listening
-        asyncio.create_task(self.helius_ws.listen())
+        self._spawn(self.helius_ws.listen())
         logger.info(f"WebSocket monitoring started for {len(self.whale_wallets)} whales")
     
     async def _handle_transaction(self, event: Dict):
@@ -848,7 +1407,7 @@ class WhaleMonitorWebSocket:
             # Find token changes
             for post in post_balances:
                 owner = post.get("owner")
-                if owner in self.whale_wallets:
+                if owner in self._whale_set:
                     mint = post.get("mint")
                     post_amount = float(post.get("uiTokenAmount", {}).get("uiAmount", 0) or 0)
                     
@@ -876,31 +1435,63 @@ class WhaleMonitorWebSocket:
             logger.error(f"Parse transaction error: {e}")
             return None
     
+    def _parse_enhanced_transaction(self, wallet: str, tx: Dict) -> Optional[Dict]:
+        """Extract whale activity from a Helius enhanced (pre-parsed) transaction"""
+        for transfer in tx.get("tokenTransfers") or []:
+            amount = float(transfer.get("tokenAmount") or 0)
+            if amount <= 0.001:  # Ignore dust
+                continue
+            if transfer.get("toUserAccount") == wallet:
+                action = "BUY"
+            elif transfer.get("fromUserAccount") == wallet:
+                action = "SELL"
+            else:
+                continue
+            return {
+                "whale_address": wallet,
+                "signature": tx.get("signature"),
+                "token_address": transfer.get("mint"),
+                "token_symbol": "TOKEN",
+                "amount": amount,
+                "action": action,
+                "timestamp": datetime.now(timezone.utc).isoformat()
+            }
+        return None
+    
+    async def _poll_wallet(self, wallet: str) -> Optional[List[Dict]]:
+        """Fetch a whale's recent enhanced transactions, capped at WHALE_POLL_CONCURRENCY in flight"""
+        async with self._poll_semaphore:
+            return await self.helius_rpc.get_enhanced_transactions(wallet, limit=5)
+    
     async def _fallback_polling(self):
         """Fallback to polling if WebSocket fails"""
         logger.info("Starting fallback polling for whale wallets")
         
         while self.is_running:
             try:
-                for wallet in self.whale_wallets:
-                    txs = await self.helius_rpc.get_recent_transactions(wallet, limit=5)
+                # One enhanced-API call per whale, all in flight at once (no per-signature getTransaction)
+                results = await asyncio.gather(
+                    *[self._poll_wallet(wallet) for wallet in self.whale_wallets],
+                    return_exceptions=True
+                )
+                
+                for wallet, txs in zip(self.whale_wallets, results):
+                    if isinstance(txs, Exception):
+                        logger.error(f"Polling error for {wallet[:8]}...: {txs}")
+                        continue
+                    if not txs:
+                        continue
                     
+                    last_sig = self.last_signatures.get(wallet)  # one lookup per wallet, not per transaction
                     for tx in txs:
-                        sig = tx.get("signature")
-                        if wallet in self.last_signatures and sig == self.last_signatures[wallet]:
+                        if last_sig is not None and tx.get("signature") == last_sig:
                             break
                         
-                        if sig:
-                            tx_details = await self.helius_rpc.get_transaction(sig)
-                            if tx_details:
-                                activity = await self._parse_transaction(sig, tx_details)
-                                if activity and self.on_whale_activity:
-                                    await self.on_whale_activity(activity)
-                    
-                    if txs:
-                        self.last_signatures[wallet] = txs[0].get("signature")
+                        activity = self._parse_enhanced_transaction(wallet, tx)
+                        if activity and self.on_whale_activity:
+                            await self.on_whale_activity(activity)
                     
-                    await asyncio.sleep(1)  # Rate limit between wallets
+                    self.last_signatures[wallet] = txs[0].get("signature")
                 
                 await asyncio.sleep(10)  # Poll interval
                 
@@ -913,6 +1504,8 @@ class WhaleMonitorWebSocket:
         self.is_running = False
         if self.helius_ws:
             await self.helius_ws.close()
+        for task in list(self._tasks):
+            task.cancel()
     
     async def close(self):
         await self.stop()
@@ -947,6 +1540,11 @@ class LiveAutoTrader:
         self.active_positions: Dict[str, Dict] = {}
         self.is_enabled = LIVE_TRADING_ENABLED and AUTO_TRADE_ON_WHALE_SIGNAL
         
+        # Shared price ticker: one bulk price fetch per tick for every open position
+        self._prices: Dict[str, Tuple[float, float]] = {}  # mint -> (price, tick time)
+        self._price_events: Dict[str, asyncio.Event] = {}
+        self._price_ticker_task: Optional[asyncio.Task] = None
+        
         # P&L tracking
         self.total_pnl_usd: float = 0.0
         self.total_trades: int = 0
@@ -982,10 +1580,20 @@ class LiveAutoTrader:
         if trade_amount_sol < self.min_trade_sol:
             trade_amount_sol = self.min_trade_sol
         
+        # Interned so the position, price and event dicts all share one key object
+        token_address = sys.intern(token_address)
+        
         logger.info(f"[AUTO-TRADE] Processing whale signal for {token_address[:8]}...")
         
+        # Rug check, wallet balance and entry prices are independent reads: one round-trip instead of three
+        user_public_key = str(user_keypair.pubkey())  # base58-encode once per trade
+        rug_result, user_balance, prices = await asyncio.gather(
+            self.rug_detector.check_token(token_address),
+            self.helius.get_balance(user_public_key),
+            self.jupiter.get_token_prices([token_address, WSOL_MINT])
+        )
+        
         # Step 1: Rug check
-        rug_result = await self.rug_detector.check_token(token_address)
         if not rug_result.is_safe:
             logger.warning(f"[AUTO-TRADE] Token failed rug check: {rug_result.warnings}")
             if self.telegram_notify:
@@ -1002,7 +1610,6 @@ class LiveAutoTrader:
             return None
         
         # Step 3: Check wallet balance
-        user_balance = await self.helius.get_balance(str(user_keypair.pubkey()))
         if user_balance < trade_amount_sol + GAS_RESERVE_SOL:
             logger.warning(f"[AUTO-TRADE] Insufficient balance: {user_balance} SOL")
             if self.telegram_notify:
@@ -1016,17 +1623,18 @@ class LiveAutoTrader:
         actual_trade_amount = max(self.min_trade_sol, min(trade_amount_sol, self.max_trade_sol))
         amount_lamports = int(actual_trade_amount * LAMPORTS_PER_SOL)
         
-        # Get entry price for P&L tracking
-        entry_price = await self.jupiter.get_token_price(token_address)
-        sol_price = await self.jupiter.get_token_price(WSOL_MINT) or 200
+        # Entry price for P&L tracking
+        entry_price = prices.get(token_address)
+        sol_price = prices.get(WSOL_MINT) or 200
         entry_value_usd = actual_trade_amount * sol_price
         
-        # Step 5: Notify user trade is starting
+        # Step 5: Notify user trade is starting (sent alongside the swap rather than ahead of it)
+        notify_task = None
         if self.telegram_notify:
-            await self.telegram_notify(
+            notify_task = asyncio.create_task(self.telegram_notify(
                 user_telegram_id,
                 f"🚀 *EXECUTING TRADE*\n\nWhale detected buying!\nToken: `{token_address[:16]}...`\nAmount: {actual_trade_amount:.4f} SOL (~${entry_value_usd:.2f})\nStop-Loss: {(stop_loss_pct or self.default_stop_loss_pct)*100:.0f}%\n\nProcessing..."
-            )
+            ))
         
         # Step 6: Execute trade
         result = await self.jupiter.execute_swap(
@@ -1034,8 +1642,14 @@ class LiveAutoTrader:
             input_mint=WSOL_MINT,
             output_mint=token_address,
             amount_lamports=amount_lamports,
-            slippage_bps=MAX_SLIPPAGE_BPS
+            slippage_bps=MAX_SLIPPAGE_BPS,
+            user_public_key=user_public_key
         )
+        if notify_task:
+            try:
+                await notify_task  # keep "Processing..." ahead of the outcome message
+            except Exception as e:
+                logger.error(f"[AUTO-TRADE] Trade start notification failed: {e}")
         
         # Step 7: Record and monitor position
         if result.success:
@@ -1043,6 +1657,7 @@ class LiveAutoTrader:
                 "trade_id": result.trade_id,
                 "user_telegram_id": user_telegram_id,
                 "keypair": user_keypair,
+                "pubkey_str": user_public_key,
                 "entry_time": datetime.now(timezone.utc),
                 "entry_signature": result.signature,
                 "amount_sol": actual_trade_amount,
@@ -1085,7 +1700,7 @@ class LiveAutoTrader:
             trade_record = {
                 "id": position["trade_id"],
                 "user_telegram_id": position["user_telegram_id"],
-                "wallet_public_key": str(position["keypair"].pubkey()),
+                "wallet_public_key": position["pubkey_str"],
                 "token_address": position["token_address"],
                 "trade_type": "BUY",
                 "amount_sol": position["amount_sol"],
@@ -1099,8 +1714,8 @@ class LiveAutoTrader:
                 "entry_signature": signature,
                 "exit_signature": exit_signature,
                 "stop_loss_pct": position.get("stop_loss_pct", self.default_stop_loss_pct),
-                "created_at": position["entry_time"].isoformat(),
-                "closed_at": datetime.now(timezone.utc).isoformat() if status == "CLOSED" else None
+                "created_at": position["entry_time"],
+                "closed_at": datetime.now(timezone.utc) if status == "CLOSED" else None
             }
             
             # Upsert trade record
@@ -1112,6 +1727,28 @@ class LiveAutoTrader:
         except Exception as e:
             logger.error(f"Save trade error: {e}")
     
+    def _ensure_price_ticker(self):
+        """Start the shared price ticker if it is not already running"""
+        if self._price_ticker_task is None or self._price_ticker_task.done():
+            self._price_ticker_task = asyncio.create_task(self._price_ticker())
+    
+    async def _price_ticker(self):
+        """Fetch prices for all open positions in one call and wake their exit monitors"""
+        while self.active_positions:
+            try:
+                mints = list(self.active_positions) + [WSOL_MINT]
+                fetched = await self.jupiter.get_token_prices(mints)
+                tick_ts = time.monotonic()
+                # Only mints priced this tick are stamped and woken; the rest keep their old timestamp
+                for mint, price in fetched.items():
+                    self._prices[mint] = (price, tick_ts)
+                    event = self._price_events.get(mint)
+                    if event:
+                        event.set()
+            except Exception as e:
+                logger.error(f"[AUTO-TRADE] Price ticker error: {e}")
+            await asyncio.sleep(PRICE_TICK_SECONDS)
+    
     async def _monitor_for_exit(self, token_address: str):
         """Monitor position for profit target or stop-loss exit"""
         position = self.active_positions.get(token_address)
@@ -1127,15 +1764,28 @@ class LiveAutoTrader:
         
         logger.info(f"[AUTO-TRADE] Monitoring position: {token_address[:8]}... Entry: ${entry_value_usd:.2f}, Stop-Loss: ${stop_loss_value:.2f}")
         
+        price_event = self._price_events.setdefault(token_address, asyncio.Event())
+        self._ensure_price_ticker()
+        
         check_count = 0
+        last_tick_ts = 0.0
         while token_address in self.active_positions:
             try:
+                # Wait for the shared ticker to publish a fresh price
+                try:
+                    await asyncio.wait_for(price_event.wait(), timeout=PRICE_TICK_SECONDS * 2)
+                except asyncio.TimeoutError:
+                    pass
+                price_event.clear()
+                
                 check_count += 1
                 elapsed = (datetime.now(timezone.utc) - entry_time).total_seconds()
                 
-                # Get current token price
-                current_price = await self.jupiter.get_token_price(token_address)
-                sol_price = await self.jupiter.get_token_price(WSOL_MINT) or 200
+                # Never decide an exit on a price the ticker did not refresh since the last check
+                price_entry = self._prices.get(token_address)
+                if not price_entry or price_entry[1] <= last_tick_ts:
+                    continue
+                current_price, last_tick_ts = price_entry
                 
                 if current_price and position.get("amount_tokens"):
                     # Calculate current value and P&L
@@ -1170,11 +1820,12 @@ class LiveAutoTrader:
                         await self._execute_exit(token_address, f"TIMEOUT ({pnl_pct:.1f}%)", pnl_usd)
                         break
                 
-                await asyncio.sleep(5)  # Check every 5 seconds
-                
             except Exception as e:
                 logger.error(f"[AUTO-TRADE] Monitor error: {e}")
                 await asyncio.sleep(5)
+        
+        self._price_events.pop(token_address, None)
+        self._prices.pop(token_address, None)  # a re-entered token must not start from this position's price
     
     async def _execute_exit(self, token_address: str, reason: str, pnl_usd: float = 0.0):
         """Exit position by selling tokens"""
@@ -1198,7 +1849,8 @@ class LiveAutoTrader:
             input_mint=token_address,
             output_mint=WSOL_MINT,
             amount_lamports=amount_tokens,
-            slippage_bps=MAX_SLIPPAGE_BPS
+            slippage_bps=MAX_SLIPPAGE_BPS,
+            user_public_key=position["pubkey_str"]
         )
         
         # Calculate final P&L
@@ -1252,6 +1904,8 @@ Total P&L: {'+' if self.total_pnl_usd >= 0 else ''}${self.total_pnl_usd:.2f}
             logger.info(f"[AUTO-TRADE] ✅ Exit successful: {result.signature}, P&L: ${final_pnl:.2f}")
         else:
             # Exit failed - notify and try again?
+            # Drop the cached "safe" verdict so a new signal re-checks this token
+            self.rug_detector.invalidate(token_address)
             await self._save_trade_to_db(position, "EXIT_FAILED", position.get("entry_signature"), None, pnl_usd)
             
             if self.telegram_notify:
@@ -1296,48 +1950,142 @@ Total P&L: {'+' if self.total_pnl_usd >= 0 else ''}${self.total_pnl_usd:.2f}
         return False
 
 
+_EMPTY: Dict = {}  # shared read-only default for missing nested objects
+
+
+def _to_float(value) -> float:
+    """DexScreener number or numeric string to float; missing/null/empty -> 0.0"""
+    return float(value) if value else 0.0
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one str object for values DexScreener repeats across pairs (dexId, symbol)"""
+    return sys.intern(value) if value else value
+
+
+def _pair_liquidity(p: Dict) -> float:
+    liquidity = p.get("liquidity")
+    return _to_float(liquidity.get("usd")) if liquidity else 0.0
+
+
+def _extract_pair(p: Dict, cls: type = TrendingToken, **extra) -> TrendingToken:
+    """Flatten a DexScreener pair into a scanner record (TrendingToken or NewPair)"""
+    base = p.get("baseToken") or _EMPTY
+    volume = p.get("volume")
+    price_change = p.get("priceChange")
+    return cls(
+        address=base.get("address"),
+        symbol=_intern(base.get("symbol")),
+        name=base.get("name"),
+        price_usd=_to_float(p.get("priceUsd")),
+        liquidity_usd=_pair_liquidity(p),
+        volume_24h=_to_float(volume.get("h24")) if volume else 0.0,
+        price_change_24h=_to_float(price_change.get("h24")) if price_change else 0.0,
+        dex=_intern(p.get("dexId")),
+        **extra
+    )
+
+
 class TrendingTokenScanner:
     """Scan for trending tokens on DEXes"""
     
     def __init__(self):
-        self.client = httpx.AsyncClient(timeout=30)
+        self.client = httpx.AsyncClient(http2=True, timeout=DEXSCREENER_TIMEOUT, limits=HTTP_POOL_LIMITS)
+        self._response_cache: Dict[str, Tuple[Dict, float]] = {}  # url -> (parsed body, fetched_at)
+        self._inflight: Dict[str, asyncio.Task] = {}  # url -> fetch shared by concurrent callers
+    
+    async def _cached_get_json(self, url: str, ttl: float = DEXSCREENER_CACHE_TTL) -> Optional[Dict]:
+        """GET a DexScreener URL, reusing the parsed body for ttl seconds (None on HTTP error)"""
+        cached = self._response_cache.get(url)
+        if cached and time.monotonic() - cached[1] < ttl:
+            return cached[0]
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._fetch_json(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        return await asyncio.shield(task)
+    
+    async def _fetch_json(self, url: str) -> Optional[Dict]:
+        response = await self.client.get(url)
+        if response.status_code != 200:
+            return None
+        data = orjson.loads(response.content)
+        now = time.monotonic()
+        # Batch lookups add a URL per distinct address chunk; drop the expired ones
+        _sweep_expired(self._response_cache, DEXSCREENER_CACHE_TTL, DEXSCREENER_CACHE_MAX, now)
+        self._response_cache[url] = (data, now)
+        return data
+    
+    async def get_market_snapshot(self) -> Dict[str, List[TrendingToken]]:
+        """Trending tokens and new pairs together; both read one shared DexScreener fetch"""
+        trending, new_pairs = await asyncio.gather(self.get_trending_tokens(), self.get_new_pairs())
+        return {"trending": trending, "new_pairs": new_pairs}
     
-    async def get_trending_tokens(self) -> List[Dict]:
+    async def get_trending_tokens(self) -> List[TrendingToken]:
         """Get trending Solana tokens"""
         try:
             tokens = []
             
             # Fetch from pairs endpoint
-            response = await self.client.get(
-                "https://api.dexscreener.com/latest/dex/pairs/solana"
-            )
-            if response.status_code == 200:
-                data = response.json()
-                pairs = data.get("pairs", [])[:20]
-                for p in pairs:
-                    tokens.append({
-                        "address": p.get("baseToken", {}).get("address"),
-                        "symbol": p.get("baseToken", {}).get("symbol"),
-                        "name": p.get("baseToken", {}).get("name"),
-                        "price_usd": float(p.get("priceUsd", 0) or 0),
-                        "liquidity_usd": float(p.get("liquidity", {}).get("usd", 0) or 0),
-                        "volume_24h": float(p.get("volume", {}).get("h24", 0) or 0),
-                        "price_change_24h": float(p.get("priceChange", {}).get("h24", 0) or 0),
-                        "dex": p.get("dexId")
-                    })
+            data = await self._cached_get_json(DEXSCREENER_PAIRS_URL)
+            if data:
+                pairs = (data.get("pairs") or [])[:20]
+                tokens = [_extract_pair(p) for p in pairs if p.get("chainId", "solana") == "solana"]
             
-            # Remove duplicates
-            seen = set()
-            unique = []
-            for t in tokens:
-                if t["address"] and t["address"] not in seen:
-                    seen.add(t["address"])
-                    unique.append(t)
+            # Remove duplicates (reversed so the first pair listed for a token wins)
+            unique = {t.address: t for t in reversed(tokens) if t.address}
             
-            return sorted(unique, key=lambda x: x.get("volume_24h", 0), reverse=True)[:20]
+            return heapq.nlargest(20, unique.values(), key=attrgetter("volume_24h"))
         except Exception as e:
             logger.error(f"Trending tokens error: {e}")
             return []
     
+    async def get_new_pairs(self, min_liquidity: float = NEW_PAIR_MIN_LIQUIDITY_USD, limit: int = 20) -> List[NewPair]:
+        """Get the most recently created Solana pairs with at least min_liquidity USD"""
+        try:
+            data = await self._cached_get_json(DEXSCREENER_PAIRS_URL)
+            if not data:
+                return []
+            
+            # Filter and rank the raw pairs; only the `limit` survivors get a result dict built
+            candidates = (
+                p for p in data.get("pairs") or []
+                if p.get("chainId", "solana") == "solana" and _pair_liquidity(p) >= min_liquidity
+            )
+            newest = heapq.nlargest(limit, candidates, key=lambda p: p.get("pairCreatedAt") or 0)
+            
+            return [
+                _extract_pair(p, NewPair, pair_address=p.get("pairAddress"), created_at=p.get("pairCreatedAt") or 0)
+                for p in newest
+            ]
+        except Exception as e:
+            logger.error(f"New pairs error: {e}")
+            return []
+    
+    async def get_pairs_batch(self, addresses: Iterable[str]) -> Dict[str, TrendingToken]:
+        """Most liquid Solana pair per token address, looked up 30 addresses per DexScreener call"""
+        wanted = sorted(set(filter(None, addresses)))  # sorted so repeat candidate sets hit the cache
+        chunks = [wanted[i:i + DEXSCREENER_TOKENS_LIMIT] for i in range(0, len(wanted), DEXSCREENER_TOKENS_LIMIT)]
+        results = await asyncio.gather(
+            *(self._cached_get_json(DEXSCREENER_TOKENS_URL + ",".join(chunk)) for chunk in chunks),
+            return_exceptions=True
+        )
+        
+        wanted_set = set(wanted)
+        best: Dict[str, Dict] = {}
+        for data in results:
+            if isinstance(data, Exception):
+                logger.error(f"DexScreener batch lookup error: {data}")
+                continue
+            for p in (data or _EMPTY).get("pairs") or []:
+                if p.get("chainId", "solana") != "solana":
+                    continue
+                address = (p.get("baseToken") or _EMPTY).get("address")
+                if address in wanted_set and (address not in best or _pair_liquidity(p) > _pair_liquidity(best[address])):
+                    best[address] = p
+        
+        return {address: _extract_pair(p) for address, p in best.items()}
+    
     async def close(self):
         await self.client.aclose()